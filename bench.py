@@ -0,0 +1,511 @@
+# ============================================================================
+# FICHIER : bench.py
+# DESCRIPTION : Banc d'essai des performances (scénarios sans affichage)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Des scénarios "pires cas" reproductibles : beaucoup de fruits en vol,
+#   beaucoup de morceaux qui tournent, rafales d'explosions de bombes, éclats
+#   de glace, mode 2 joueurs avec les deux freeze, écran des scores avec un
+#   historique de 50 000 parties
+# - Le temps de chaque phase de la frame : mise à jour, collisions, dessin,
+#   flip, avec médiane, 95e et 99e centiles
+# - Une référence JSON : les mesures sont comparées à celles enregistrées,
+#   avec une tolérance ; une régression fait échouer la commande (code 1)
+#
+# UTILISATION :
+#   python bench.py                                   # tous les scénarios
+#   python bench.py --scenario fruits --frames 600
+#   python bench.py --sauver-reference bench_reference.json
+#   python bench.py --reference bench_reference.json --tolerance 0.15
+#
+# POURQUOI ?
+# Sans mesure, on ne voit une baisse de performance que sur la borne, quand
+# le jeu saccade déjà. Les scénarios forcent les situations coûteuses, avec
+# une graine fixe : deux mesures sont comparables.
+#
+# ============================================================================
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import pygame
+
+import qualite
+import scores
+from constantes import liste_fruits
+from interface import dessiner_scores
+from objets import obtenir_sprite
+from rendu import FileRendu
+from simulation import DUREE_DECOMPTE, Simulation, initialiser_sans_affichage
+
+# Phases mesurées, dans l'ordre de la frame
+PHASES = ("mise_a_jour", "collisions", "dessin", "flip")
+
+# Mesures comparées à la référence
+MESURES_COMPAREES = ("p50", "p95")
+
+# En dessous de cet écart (ms), une différence est du bruit de mesure
+ECART_MINIMUM_MS = 0.05
+
+TAILLE_ECRAN = (1280, 720)
+FRAMES_CHAUFFE = 30  # Frames non mesurées (caches, premières rotations...)
+
+# ============================================================================
+# SCÉNARIOS
+# ============================================================================
+# - joueurs : mode de la partie
+# - fruits : nombre de fruits maintenus à l'écran
+# - morceaux : nombre de morceaux maintenus à l'écran
+# - explosions / glaces : nombre de rafales de particules toutes les `periode` frames
+# - freeze : les deux joueurs (ou le joueur seul) restent gelés
+# - parties : taille de l'historique des scores (scénario de l'écran des scores)
+# ============================================================================
+SCENARIOS = {
+    "fruits": {
+        "description": "80 fruits en vol, la lame les traverse",
+        "joueurs": 1,
+        "fruits": 80,
+    },
+    "morceaux": {
+        "description": "300 morceaux qui tournent et s'estompent",
+        "joueurs": 1,
+        "morceaux": 300,
+    },
+    "explosion": {
+        "description": "Rafales d'explosions de bombes (4 toutes les 60 frames)",
+        "joueurs": 1,
+        "fruits": 10,
+        "explosions": 4,
+        "periode": 60,
+    },
+    "glace": {
+        "description": "Éclats de glace (6 rafales toutes les 30 frames)",
+        "joueurs": 1,
+        "fruits": 10,
+        "glaces": 6,
+        "periode": 30,
+    },
+    "2j_freeze": {
+        "description": "2 joueurs, les deux moitiés gelées",
+        "joueurs": 2,
+        "fruits": 40,
+        "morceaux": 100,
+        "freeze": True,
+    },
+    "scores": {
+        "description": "Écran des scores, historique de 50 000 parties",
+        "parties": 50000,
+        "frames": 30,
+    },
+}
+
+
+# ============================================================================
+# PRÉPARATION DES SCÉNARIOS
+# ============================================================================
+def _fruit_en_vol(simulation, rng):
+    """Crée un fruit déjà à l'écran (au lieu de partir du bas)."""
+    zone = rng.choice([1, 2]) if simulation.nombre_de_joueurs == 2 else None
+    fruit = simulation.mes_fruits.creer(
+        rng.choice(liste_fruits), simulation.largeur, simulation.hauteur, zone, rng=rng
+    )
+    fruit.y = rng.uniform(100, simulation.hauteur - 100)
+    fruit.speed_y = rng.uniform(-12, 2)
+
+
+def _entretenir(simulation, reglage, rng, frame):
+    """
+    Remet le scénario à son niveau de charge (non mesuré).
+
+    Les fruits tranchés ou tombés, les morceaux estompés sont remplacés : la
+    charge reste la même pendant toute la mesure.
+    """
+    # Vies infinies : la partie ne se termine jamais pendant la mesure
+    simulation.vies_j1 = simulation.vies_j2 = 10**9
+
+    while len(simulation.mes_fruits) < reglage.get("fruits", 0):
+        _fruit_en_vol(simulation, rng)
+
+    while len(simulation.morceaux_fruits) < reglage.get("morceaux", 0):
+        # Même image qu'un vrai fruit tranché (sprite redimensionné du jeu)
+        image = obtenir_sprite(rng.choice(liste_fruits), 160)["cut"]
+        simulation.morceaux_fruits.creer(
+            rng.uniform(0, simulation.largeur),
+            rng.uniform(0, simulation.hauteur),
+            image,
+            rng.choice(["gauche", "droite"]),
+            rng=rng,
+        )
+
+    if frame % reglage.get("periode", 60) == 0:
+        # Même nombre de particules que simulation._traiter_resultat
+        for _ in range(reglage.get("explosions", 0)):
+            x, y = rng.uniform(0, simulation.largeur), rng.uniform(0, simulation.hauteur)
+            for _ in range(qualite.nombre_particules(50)):
+                simulation.particules_explosion.creer(x, y, rng)
+        for _ in range(reglage.get("glaces", 0)):
+            x, y = rng.uniform(0, simulation.largeur), rng.uniform(0, simulation.hauteur)
+            for _ in range(qualite.nombre_particules(30)):
+                simulation.particules_glace.creer(x, y, rng)
+
+    if reglage.get("freeze"):
+        zones = ("partie",) if simulation.nombre_de_joueurs == 1 else ("j1", "j2")
+        for zone in zones:
+            simulation.geler(zone, 10**9)
+
+
+def _position_lame(frame, largeur, hauteur):
+    """Trajet de la lame : une courbe qui balaie tout l'écran."""
+    return (
+        int(largeur / 2 + largeur * 0.45 * math.sin(frame * 0.07)),
+        int(hauteur / 2 + hauteur * 0.4 * math.sin(frame * 0.11)),
+    )
+
+
+def _creer_historique(chemin, nombre, rng):
+    """Écrit un fichier de scores avec `nombre` parties en mode 1 joueur (et 10 % en 2J)."""
+    historique_1j = [
+        {
+            "score": rng.randint(0, 500),
+            "niveau": rng.randint(1, 50),
+            "date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 12:00:{i % 60:02d}",
+            "duree_secondes": rng.randint(10, 900),
+            "graine": rng.getrandbits(32),
+        }
+        for i in range(nombre)
+    ]
+    historique_2j = [
+        {
+            "score": 0,
+            "niveau": 1,
+            "date": f"2025-01-01 12:00:{i % 60:02d}",
+            "duree_secondes": rng.randint(10, 900),
+            "gagnant": rng.choice(["J1", "J2", "egalite"]),
+        }
+        for i in range(nombre // 10)
+    ]
+    with open(chemin, "w", encoding="utf-8") as fichier:
+        json.dump(
+            {"historique_1j": historique_1j, "historique_2j": historique_2j},
+            fichier,
+            indent=4,
+            ensure_ascii=False,
+        )
+
+
+# ============================================================================
+# DESSIN (mêmes opérations que l'écran de jeu de main.py)
+# ============================================================================
+class DessinPartie:
+    """
+    Dessine une partie comme main.py : fond, fruits, morceaux, particules,
+    lame, HUD et voiles de freeze.
+
+    Attributs:
+        fond (Surface): Fond redimensionné à la taille de l'écran
+        files (tuple): Files de rendu (fruits, morceaux, particules)
+        font_info, font_vies, font_freeze (Font): Polices du HUD
+    """
+
+    def __init__(self, taille):
+        try:
+            fond = pygame.image.load("Assets/Images/Backgrounds/Background1.png").convert()
+            self.fond = pygame.transform.smoothscale(fond, taille)
+        except (pygame.error, FileNotFoundError):
+            self.fond = pygame.Surface(taille)
+            self.fond.fill((50, 50, 100))
+        self.files = (FileRendu(), FileRendu(), FileRendu())
+        self.font_info = pygame.font.Font(None, 40)
+        self.font_vies = pygame.font.Font(None, 50)
+        self.font_freeze = pygame.font.Font(None, 120)
+
+    def _voile_freeze(self, screen, x, largeur, timer):
+        """Voile bleu + texte FREEZE + temps restant sur une zone."""
+        hauteur = screen.get_height()
+        overlay = pygame.Surface((largeur, hauteur))
+        overlay.set_alpha(60)
+        overlay.fill((173, 216, 230))
+        screen.blit(overlay, (x, 0))
+        txt_freeze = self.font_freeze.render("FREEZE", True, (0, 100, 200))
+        txt_timer = self.font_vies.render(f"{timer / 60:.1f}s", True, (0, 150, 255))
+        screen.blit(txt_freeze, (x + largeur // 2 - txt_freeze.get_width() // 2, hauteur // 2 - 80))
+        screen.blit(txt_timer, (x + largeur // 2 - txt_timer.get_width() // 2, hauteur // 2 + 20))
+
+    def dessiner(self, screen, simulation):
+        """Dessine une frame de la partie."""
+        screen.blit(self.fond, (0, 0))
+
+        file_fruits, file_morceaux, file_particules = self.files
+        for file in self.files:
+            file.commencer(screen)
+        simulation.mes_fruits.dessiner(file_fruits)
+        file_fruits.soumettre()
+        simulation.morceaux_fruits.dessiner(file_morceaux)
+        file_morceaux.soumettre()
+        simulation.particules_explosion.dessiner(file_particules)
+        simulation.particules_glace.dessiner(file_particules)
+        file_particules.soumettre()
+
+        simulation.controleur_souris.draw_slice(screen, temps=simulation.temps_ms())
+
+        # HUD : les textes sont rendus à chaque frame, comme dans main.py
+        largeur = screen.get_width()
+        milieu_x = largeur // 2
+        for texte, x, y in (
+            (f"VIES : {simulation.vies_j1}", milieu_x // 2, 60),
+            (f"NIVEAU : {simulation.niveau}", milieu_x, 105),
+            (f"Score : {simulation.score}", milieu_x, 150),
+        ):
+            surface = self.font_vies.render(texte, True, (255, 255, 255))
+            screen.blit(surface, (x - surface.get_width() // 2, y))
+
+        if simulation.nombre_de_joueurs == 1:
+            if simulation.gele("partie"):
+                self._voile_freeze(screen, 0, largeur, simulation.temps_freeze("partie"))
+        else:
+            if simulation.gele("j1"):
+                self._voile_freeze(screen, 0, milieu_x, simulation.temps_freeze("j1"))
+            if simulation.gele("j2"):
+                self._voile_freeze(screen, milieu_x, largeur - milieu_x, simulation.temps_freeze("j2"))
+
+
+# ============================================================================
+# MESURE
+# ============================================================================
+def _chrono():
+    """Horloge en millisecondes."""
+    return time.perf_counter() * 1000
+
+
+def mesurer_partie(reglage, frames, graine):
+    """
+    Mesure un scénario de partie.
+
+    Chaque frame : entretien de la charge (non mesuré), puis
+    mise à jour (simulation.etape), collisions (ControleurJoueur.update_slice le
+    long du trajet de la lame), dessin et flip.
+
+    Retourne:
+        dict: Durées (ms) de chaque frame, par phase
+    """
+    screen = pygame.display.get_surface()
+    largeur, hauteur = screen.get_size()
+    rng = random.Random(graine)
+    simulation = Simulation(reglage.get("joueurs", 1), largeur, hauteur, graine=graine)
+    # Le décompte est passé : la partie tourne tout de suite
+    simulation.frame = DUREE_DECOMPTE
+    dessin = DessinPartie((largeur, hauteur))
+    durees = {phase: [] for phase in PHASES}
+
+    lame = simulation.controleur_souris
+    lame.start_slice(_position_lame(0, largeur, hauteur), temps=simulation.temps_ms())
+    for frame in range(FRAMES_CHAUFFE + frames):
+        _entretenir(simulation, reglage, rng, frame)
+
+        # La lame est gérée à part (phase "collisions") : etape() ne doit pas
+        # tester les collisions une deuxième fois
+        lame.slicing = False
+        t0 = _chrono()
+        simulation.etape()
+        t1 = _chrono()
+        lame.slicing = True
+        position = _position_lame(frame, largeur, hauteur)
+        lame.update_slice(
+            position,
+            simulation.mes_fruits,
+            largeur,
+            simulation.nombre_de_joueurs,
+            simulation.morceaux_fruits,
+            temps=simulation.temps_ms(),
+            rng=simulation.rng_effets,
+        )
+        t2 = _chrono()
+        dessin.dessiner(screen, simulation)
+        t3 = _chrono()
+        pygame.display.flip()
+        t4 = _chrono()
+
+        if frame >= FRAMES_CHAUFFE:
+            durees["mise_a_jour"].append(t1 - t0)
+            durees["collisions"].append(t2 - t1)
+            durees["dessin"].append(t3 - t2)
+            durees["flip"].append(t4 - t3)
+
+    return durees
+
+
+def mesurer_scores(reglage, frames, graine):
+    """
+    Mesure l'écran des scores avec un gros historique (dessin + flip).
+
+    Le fichier de scores est temporaire : celui du joueur n'est pas touché.
+    """
+    screen = pygame.display.get_surface()
+    durees = {"dessin": [], "flip": []}
+    ancien_fichier = scores.FICHIER_SCORES
+    with tempfile.TemporaryDirectory() as dossier:
+        scores.FICHIER_SCORES = os.path.join(dossier, "scores.json")
+        try:
+            _creer_historique(scores.FICHIER_SCORES, reglage["parties"], random.Random(graine))
+            for frame in range(min(FRAMES_CHAUFFE, 3) + frames):
+                t0 = _chrono()
+                dessiner_scores(screen)
+                t1 = _chrono()
+                pygame.display.flip()
+                t2 = _chrono()
+                if frame >= min(FRAMES_CHAUFFE, 3):
+                    durees["dessin"].append(t1 - t0)
+                    durees["flip"].append(t2 - t1)
+        finally:
+            scores.FICHIER_SCORES = ancien_fichier
+    return durees
+
+
+def resumer(durees):
+    """
+    Résume les durées d'une phase.
+
+    Args:
+        durees (list): Durées en ms (au moins une)
+
+    Retourne:
+        dict: moyenne, p50, p95, p99 et max (ms)
+    """
+    if len(durees) >= 2:
+        centiles = statistics.quantiles(durees, n=100, method="inclusive")
+        p50, p95, p99 = centiles[49], centiles[94], centiles[98]
+    else:
+        p50 = p95 = p99 = durees[0]
+    return {
+        "moyenne": statistics.fmean(durees),
+        "p50": p50,
+        "p95": p95,
+        "p99": p99,
+        "max": max(durees),
+    }
+
+
+def mesurer_scenario(nom, frames=None, graine=0):
+    """
+    Mesure un scénario.
+
+    Args:
+        nom (str): Clé de SCENARIOS
+        frames (int): Frames mesurées (None = 300, ou la valeur du scénario)
+        graine (int): Graine du scénario (même graine = même charge)
+
+    Retourne:
+        dict: Résumé de chaque phase, plus "frame" (somme des phases)
+    """
+    reglage = SCENARIOS[nom]
+    if frames is None:
+        frames = reglage.get("frames", 300)
+
+    if "parties" in reglage:
+        durees = mesurer_scores(reglage, frames, graine)
+    else:
+        durees = mesurer_partie(reglage, frames, graine)
+
+    resultat = {phase: resumer(valeurs) for phase, valeurs in durees.items()}
+    resultat["frame"] = resumer([sum(valeurs) for valeurs in zip(*durees.values())])
+    return resultat
+
+
+# ============================================================================
+# RÉFÉRENCE
+# ============================================================================
+def comparer(resultats, reference, tolerance):
+    """
+    Compare les résultats à une référence.
+
+    Une mesure est une régression si elle dépasse la référence de plus de
+    `tolerance` (0.15 = 15 %) ET de plus de ECART_MINIMUM_MS.
+
+    Retourne:
+        list: Régressions, sous la forme (scénario, phase, mesure, référence, actuel)
+    """
+    regressions = []
+    for nom, phases in resultats.items():
+        for phase, mesures in phases.items():
+            ancien = reference.get(nom, {}).get(phase)
+            if ancien is None:
+                continue
+            for mesure in MESURES_COMPAREES:
+                avant, apres = ancien[mesure], mesures[mesure]
+                if apres > avant * (1 + tolerance) and apres - avant > ECART_MINIMUM_MS:
+                    regressions.append((nom, phase, mesure, avant, apres))
+    return regressions
+
+
+def afficher_resultats(nom, resultat):
+    """Affiche le tableau d'un scénario."""
+    print(f"\n=== {nom} : {SCENARIOS[nom]['description']} ===")
+    print(f"  {'phase':<12}{'moyenne':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    for phase in (*PHASES, "frame"):
+        if phase not in resultat:
+            continue
+        r = resultat[phase]
+        print(
+            f"  {phase:<12}{r['moyenne']:9.3f}{r['p50']:9.3f}"
+            f"{r['p95']:9.3f}{r['p99']:9.3f}{r['max']:9.3f}"
+        )
+
+
+def main():
+    """Point d'entrée : python bench.py"""
+    parser = argparse.ArgumentParser(description="Banc d'essai des performances")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scénario à mesurer (répétable). Par défaut : tous",
+    )
+    parser.add_argument("--frames", type=int, default=None, help="Frames mesurées par scénario")
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--reference", help="Fichier JSON de référence à comparer")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.15, help="Marge avant régression (0.15 = 15 %%)"
+    )
+    parser.add_argument("--sauver-reference", help="Écrire les résultats comme nouvelle référence")
+    args = parser.parse_args()
+
+    initialiser_sans_affichage(charger_images=True)
+    pygame.display.set_mode(TAILLE_ECRAN)
+    # Qualité maximale et fixe : les mesures restent comparables
+    qualite.reglages.clear()
+    qualite.reglages.update(qualite.NIVEAUX_QUALITE[0])
+
+    resultats = {}
+    for nom in args.scenario or SCENARIOS:
+        resultats[nom] = mesurer_scenario(nom, args.frames, args.graine)
+        afficher_resultats(nom, resultats[nom])
+
+    if args.sauver_reference:
+        with open(args.sauver_reference, "w", encoding="utf-8") as fichier:
+            json.dump(resultats, fichier, indent=4, ensure_ascii=False)
+        print(f"\nRéférence écrite dans {args.sauver_reference}")
+
+    if args.reference:
+        with open(args.reference, "r", encoding="utf-8") as fichier:
+            reference = json.load(fichier)
+        regressions = comparer(resultats, reference, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} régression(s) (tolérance {args.tolerance:.0%}) :")
+            for nom, phase, mesure, avant, apres in regressions:
+                print(
+                    f"  {nom} / {phase} / {mesure} : {avant:.3f} ms -> {apres:.3f} ms"
+                    f" (+{(apres / avant - 1) * 100 if avant else 100:.0f} %)"
+                )
+            raise SystemExit(1)
+        print(f"\n✅ Aucune régression par rapport à {args.reference}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+# ============================================================================
+# FICHIER : bot.py
+# DESCRIPTION : Joueur automatique (simulations, tests d'endurance)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Un bot qui lit la liste des objets de la partie, prédit leurs
+#   trajectoires (paraboles, rebonds sur les bords, freeze) et joue :
+#   * à la souris : des gestes de lame qui traversent le fruit visé
+#   * au clavier : les touches Z, E, S, D de la zone du joueur 1
+# - Des réglages : habileté, temps de réaction, évitement des bombes
+# - Une mesure d'endurance : temps de frame minute par minute, pour voir si
+#   le jeu se dégrade au fil d'une longue session
+#
+# Le bot est un "pilote" (voir simulation.py) : il retourne des entrées
+# ("souris", "appui", "relache", "touche"), exactement comme un joueur humain.
+# Dans main.py, il remplace le joueur quand BOT_AUTOMATIQUE vaut True.
+#
+# UTILISATION SANS AFFICHAGE (test d'endurance) :
+#   python bot.py --minutes 60 --joueurs 2 --habilete 0.9
+#
+# ============================================================================
+
+import argparse
+import math
+import random
+import time
+from collections import deque
+
+import controller
+import trajectoires
+
+
+def predire_position(objet, frames, largeur, gele=False):
+    """
+    Prédit la position d'un objet dans quelques frames.
+
+    Calcul direct sur la parabole de l'objet, rebonds compris (voir
+    trajectoires.predire) : regarder loin coûte autant que regarder près.
+
+    Args:
+        objet (ObjetVolant): Fruit, glaçon ou bombe
+        frames (int): Nombre de frames dans le futur
+        largeur (int): Largeur du terrain (pour les rebonds)
+        gele (bool): True si la zone de l'objet est gelée (il ne bouge pas)
+
+    Retourne:
+        tuple: (x, y) prédits
+    """
+    if gele or frames <= 0:
+        return objet.x, objet.y
+    return trajectoires.predire(objet, frames, largeur)
+
+
+class Bot:
+    """
+    Joueur automatique.
+
+    Attributs:
+        habilete (float): 0 à 1 ; 1 = vise parfaitement, 0 = gestes très imprécis
+        reaction_frames (int): Frames avant de réagir à un nouvel objet
+        evitement_bombes (float): Probabilité d'éviter une bombe (1 = toujours)
+        duree_geste (int): Frames max avec le bouton enfoncé (encaisse le combo)
+        frames_coupe (int): Nombre de points d'un geste de lame
+        cadence_touches (int): Frames minimum entre deux touches du clavier
+        mode (str): "souris", "clavier", ou None = selon le mode de jeu
+            (1 joueur : souris ; 2 joueurs : clavier pour J1 ET souris pour J2)
+        rng (Random): Hasard du bot (séparé de celui de la partie)
+    """
+
+    def __init__(
+        self,
+        habilete=0.8,
+        reaction_frames=15,
+        evitement_bombes=1.0,
+        duree_geste=45,
+        frames_coupe=4,
+        cadence_touches=8,
+        mode=None,
+        graine=0,
+    ):
+        self.habilete = habilete
+        self.reaction_frames = reaction_frames
+        self.evitement_bombes = evitement_bombes
+        self.duree_geste = duree_geste
+        self.frames_coupe = frames_coupe
+        self.cadence_touches = cadence_touches
+        self.mode = mode
+        self.rng = random.Random(graine)
+        self.reinitialiser()
+
+    def reinitialiser(self):
+        """Oublie la partie précédente."""
+        self.vus = {}  # Objet -> frame où le bot l'a vu pour la première fois
+        self.bouton_enfonce = False
+        self.debut_geste = 0
+        self.geste = deque()  # Points (x, y) restants du geste en cours
+        self.cible = None
+        self.derniere_touche = -self.cadence_touches
+
+    # ========================================================================
+    # OUTILS
+    # ========================================================================
+    def _zone_gelee(self, simulation, x):
+        """True si les objets à la position x sont gelés."""
+        return simulation.gele(simulation.zone_de(x))
+
+    def _predire(self, simulation, objet, frames):
+        """Position de l'objet dans quelques frames (voir predire_position)."""
+        gele = self._zone_gelee(simulation, objet.x)
+        return predire_position(objet, frames, simulation.largeur, gele)
+
+    def _visible(self, simulation, objet, frame):
+        """True si le bot a eu le temps de voir l'objet."""
+        return (
+            not objet.sliced
+            and frame - self.vus[objet] >= self.reaction_frames
+            and objet.y < simulation.hauteur
+        )
+
+    def _pres_d_une_bombe(self, simulation, x, y, frames=0):
+        """True si le point (x, y) est dans une bombe (dans `frames` frames)."""
+        for objet in simulation.mes_fruits:
+            if objet.genre == "bombe":
+                bx, by = self._predire(simulation, objet, frames)
+                if math.hypot(bx - x, by - y) < objet.radius + 15:
+                    return True
+        return False
+
+    def _evite_bombe(self):
+        """Tire au sort si le bot remarque la bombe cette fois-ci."""
+        return self.rng.random() < self.evitement_bombes
+
+    # ========================================================================
+    # SOURIS
+    # ========================================================================
+    def _choisir_cible(self, simulation, frame, milieu_min):
+        """
+        Retourne l'objet à trancher : le plus bas des objets visibles (c'est
+        celui qui va tomber en premier), ou None.
+
+        Args:
+            milieu_min (int): X minimum (mode 2 joueurs : la souris joue à droite)
+        """
+        cible = None
+        for objet in simulation.mes_fruits:
+            if objet.genre == "bombe" or objet.x < milieu_min:
+                continue
+            if not self._visible(simulation, objet, frame):
+                continue
+            if cible is None or objet.y > cible.y:
+                cible = objet
+        return cible
+
+    def _preparer_geste(self, simulation, cible, milieu_min):
+        """
+        Prépare un geste de lame qui traverse la position PRÉDITE de la cible.
+
+        Les collisions sont testées point par point, une fois par frame : le
+        point du milieu du geste doit tomber dans le fruit au moment où le
+        fruit y sera.
+        """
+        # Erreur de visée : plus l'habileté est basse, plus elle est grande
+        ecart = (1 - self.habilete) * cible.radius * 2
+        erreur_x = self.rng.gauss(0, ecart) if ecart else 0
+        erreur_y = self.rng.gauss(0, ecart) if ecart else 0
+
+        # Direction du geste au hasard, longueur un peu plus grande que le fruit
+        angle = self.rng.uniform(0, 2 * math.pi)
+        dx = math.cos(angle) * cible.radius * 2.4
+        dy = math.sin(angle) * cible.radius * 2.4
+
+        self.geste.clear()
+        n = self.frames_coupe
+        for i in range(n):
+            t = i / (n - 1) - 0.5 if n > 1 else 0
+            x, y = self._predire(simulation, cible, i)
+            x = max(milieu_min, min(simulation.largeur - 1, x + erreur_x + dx * t))
+            y = max(0, min(simulation.hauteur - 1, y + erreur_y + dy * t))
+            self.geste.append((int(x), int(y)))
+        self.cible = cible
+
+    def _relacher(self, entrees):
+        """Relâche le bouton et abandonne le geste en cours."""
+        if self.bouton_enfonce:
+            entrees.append(("relache",))
+            self.bouton_enfonce = False
+        self.geste.clear()
+        self.cible = None
+
+    def _jouer_souris(self, simulation, frame, entrees):
+        """Ajoute les entrées de la souris pour cette frame."""
+        milieu_min = simulation.largeur // 2 if simulation.nombre_de_joueurs == 2 else 0
+
+        # Relâche régulièrement le bouton pour encaisser le combo
+        if self.bouton_enfonce and frame - self.debut_geste >= self.duree_geste:
+            self._relacher(entrees)
+            return
+
+        if not self.geste:
+            cible = self._choisir_cible(simulation, frame, milieu_min)
+            if cible is None:
+                # Rien à trancher : la lame ne reste pas immobile à l'écran
+                self._relacher(entrees)
+                return
+            self._preparer_geste(simulation, cible, milieu_min)
+
+        x, y = self.geste[0]
+        if self._pres_d_une_bombe(simulation, x, y) and self._evite_bombe():
+            # Une bombe traverse le geste : on lève la lame
+            self._relacher(entrees)
+            return
+
+        self.geste.popleft()
+        entrees.append(("souris", x, y))
+        if not self.bouton_enfonce:
+            entrees.append(("appui",))
+            self.bouton_enfonce = True
+            self.debut_geste = frame
+
+    # ========================================================================
+    # CLAVIER (joueur 1, zones Z E S D de la moitié gauche)
+    # ========================================================================
+    def _zones_clavier(self, simulation):
+        """Mêmes zones que controller.handle_keyboard_inputs."""
+        return controller.zones_clavier(simulation.largeur, simulation.hauteur)
+
+    def _jouer_clavier(self, simulation, frame, entrees):
+        """Appuie sur la touche de la zone qui contient le plus de fruits."""
+        if frame - self.derniere_touche < self.cadence_touches:
+            return
+
+        meilleure_touche = None
+        meilleur_nombre = 0
+        for touche, (x_min, y_min, x_max, y_max) in self._zones_clavier(simulation).items():
+            nombre = 0
+            bombe = False
+            for objet in simulation.mes_fruits:
+                if not (x_min <= objet.x <= x_max and y_min <= objet.y <= y_max):
+                    continue
+                if objet.genre == "bombe":
+                    bombe = True
+                elif self._visible(simulation, objet, frame):
+                    nombre += 1
+            if bombe and self._evite_bombe():
+                continue
+            if nombre > meilleur_nombre:
+                meilleure_touche, meilleur_nombre = touche, nombre
+
+        if meilleure_touche is None:
+            return
+        if self.rng.random() > self.habilete:
+            # Erreur : mauvaise touche
+            meilleure_touche = self.rng.choice(list(self._zones_clavier(simulation)))
+        entrees.append(("touche", meilleure_touche))
+        self.derniere_touche = frame
+
+    # ========================================================================
+    # PILOTE
+    # ========================================================================
+    def pilote(self, simulation, frame):
+        """
+        Retourne les entrées du bot pour cette frame.
+
+        Args:
+            simulation (Simulation): La partie (lue, jamais modifiée)
+            frame (int): Numéro de la frame
+
+        Retourne:
+            list: Entrées au format de simulation.appliquer_entree
+        """
+        if simulation.frame == 0:
+            # Nouvelle partie
+            self.reinitialiser()
+
+        # Mémorise les nouveaux objets, oublie ceux qui ont disparu. La clé
+        # est la vue elle-même et pas id(vue) : l'adresse d'une vue libérée
+        # peut resservir à un nouvel objet, qui serait alors "déjà vu"
+        vus = {}
+        for objet in simulation.mes_fruits:
+            vus[objet] = self.vus.get(objet, frame)
+        self.vus = vus
+
+        if simulation.en_attente or simulation.termine:
+            return []
+
+        mode = self.mode
+        entrees = []
+        if mode == "clavier" or (mode is None and simulation.nombre_de_joueurs == 2):
+            self._jouer_clavier(simulation, frame, entrees)
+        if mode == "souris" or mode is None:
+            self._jouer_souris(simulation, frame, entrees)
+        return entrees
+
+
+# ============================================================================
+# MESURE D'ENDURANCE
+# ============================================================================
+class MesureEndurance:
+    """
+    Statistiques du temps de frame par intervalle (une ligne par minute).
+
+    Comparer les lignes entre elles montre si le jeu ralentit au fil d'une
+    longue session (fuite de mémoire, cache qui grossit...).
+
+    Attributs:
+        intervalle_frames (int): Nombre de frames par ligne du rapport
+        durees (list): Durées (ms) de l'intervalle en cours
+        numero (int): Numéro de l'intervalle en cours
+        historique (list): Résumé de chaque intervalle terminé
+    """
+
+    def __init__(self, intervalle_frames=60 * 60):
+        self.intervalle_frames = intervalle_frames
+        self.durees = []
+        self.numero = 1
+        self.historique = []
+
+    def enregistrer(self, duree_ms, simulation):
+        """
+        Ajoute la durée d'une frame ; affiche le résumé à la fin de l'intervalle.
+
+        Args:
+            duree_ms (float): Temps de travail de la frame
+            simulation (Simulation): La partie (niveau, nombre d'objets)
+
+        Retourne:
+            dict: Le résumé si un intervalle vient de se terminer, sinon None
+        """
+        self.durees.append(duree_ms)
+        if len(self.durees) < self.intervalle_frames:
+            return None
+
+        durees = sorted(self.durees)
+        resume = {
+            "intervalle": self.numero,
+            "moyenne_ms": sum(durees) / len(durees),
+            "p99_ms": durees[min(len(durees) - 1, int(len(durees) * 0.99))],
+            "max_ms": durees[-1],
+            "niveau": simulation.niveau,
+            "objets": len(simulation.mes_fruits),
+            "morceaux": len(simulation.morceaux_fruits),
+        }
+        print(
+            f"⏱️ Endurance #{resume['intervalle']} : moyenne {resume['moyenne_ms']:.2f} ms"
+            f" | p99 {resume['p99_ms']:.2f} ms | max {resume['max_ms']:.2f} ms"
+            f" | niveau {resume['niveau']} | objets {resume['objets']}"
+            f" | morceaux {resume['morceaux']}"
+        )
+        self.historique.append(resume)
+        self.durees = []
+        self.numero += 1
+        return resume
+
+
+def main():
+    """Point d'entrée : test d'endurance sans affichage."""
+    # Import local : simulation importe tout le jeu
+    from simulation import Simulation, appliquer_entree, initialiser_sans_affichage
+
+    parser = argparse.ArgumentParser(description="Test d'endurance avec le bot")
+    parser.add_argument("--minutes", type=float, default=10, help="Durée de jeu simulée")
+    parser.add_argument("--joueurs", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--habilete", type=float, default=0.9)
+    parser.add_argument("--reaction", type=int, default=12, help="Temps de réaction (frames)")
+    parser.add_argument("--evitement", type=float, default=1.0, help="Évitement des bombes")
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--images", action="store_true", help="Charger les images (morceaux)")
+    parser.add_argument("--telemetrie", help="Dossier où enregistrer la télémétrie des parties")
+    args = parser.parse_args()
+
+    initialiser_sans_affichage(charger_images=args.images)
+    simulation = Simulation(args.joueurs, effets=args.images, graine=args.graine)
+    bot = Bot(
+        habilete=args.habilete,
+        reaction_frames=args.reaction,
+        evitement_bombes=args.evitement,
+        graine=args.graine,
+    )
+    mesure = MesureEndurance()
+    telemetrie = None
+    if args.telemetrie:
+        from telemetrie import EnregistreurTelemetrie
+
+        telemetrie = EnregistreurTelemetrie(args.telemetrie)
+        telemetrie.commencer(simulation)
+    parties = 0
+
+    for frame in range(int(args.minutes * 60 * 60)):
+        debut = time.perf_counter()
+        evenements = []
+        for entree in bot.pilote(simulation, simulation.frame):
+            evenements.extend(appliquer_entree(simulation, entree))
+        evenements.extend(simulation.etape())
+        duree_ms = (time.perf_counter() - debut) * 1000
+        if telemetrie is not None:
+            telemetrie.frame(simulation, duree_ms)
+            telemetrie.evenements(simulation, evenements)
+        if simulation.termine:
+            parties += 1
+            simulation.demarrer(graine=args.graine + parties)
+            if telemetrie is not None:
+                telemetrie.commencer(simulation)
+        mesure.enregistrer(duree_ms, simulation)
+
+    if telemetrie is not None:
+        telemetrie.terminer(simulation, "abandon")
+
+    print(f"{parties} partie(s) terminée(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import os
+
 import pygame
 
 liste_fruits = ["poire", "pomme", "banane", "orange"]
@@ -5,85 +7,165 @@ liste_objets_speciaux = ["bombe", "ice"]
 
 images = {}  # Dict vide, rempli dans load_assets()
 
+# Résolution logique du jeu (surface interne mise à l'échelle vers la fenêtre)
+# None = on dessine directement dans la fenêtre
+# Exemples : (1280, 720), ou (960, 540) pour les machines modestes
+RESOLUTION_LOGIQUE = None
+
+# Qualité adaptative : baisse les effets visuels si les frames dépassent le budget
+QUALITE_ADAPTATIVE = True
+
+# Mode 2 joueurs : chaque moitié de l'écran est dessinée par son propre thread
+RENDU_THREADS_2J = False
+
+# Physique vectorisée (physique.py) : les objets volants et les morceaux sont
+# déplacés par NumPy quand ils sont nombreux. Sans NumPy installé, ou avec
+# False, le jeu garde la physique Python (mêmes résultats, replays compris).
+PHYSIQUE_NUMPY = True
+
+# Trajectoires analytiques (trajectoires.py) : la position des objets est
+# calculée depuis leur lancer et leur âge au lieu d'être avancée frame par
+# frame. Les arrondis diffèrent un peu : le mode est gardé dans les replays.
+TRAJECTOIRES_ANALYTIQUES = False
+
+# Apparitions en vagues (vagues.py) : objets seuls, rafales, salves et vagues
+# en miroir (2 joueurs), plus grosses aux niveaux élevés. False = un objet à
+# la fois comme avant. Le mode est gardé dans les replays.
+VAGUES_APPARITION = True
+
+# Graine aléatoire des parties : None = une nouvelle graine à chaque partie,
+# un entier = toujours la même suite d'objets (utile pour tester ou rejouer)
+GRAINE_PARTIE = None
+
+# Difficulté : courbes des deux modes (gravité, délais entre les lancers,
+# objets spéciaux, objets à l'écran au plus), niveau par niveau.
+# Voir difficulte.py. Pour l'équilibrer sans jouer à la main : python tuner.py
+# Cherché à côté du code, quel que soit le dossier d'où le jeu est lancé
+FICHIER_DIFFICULTE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "difficulte.json")
+
+# Replays : chaque partie terminée est enregistrée (entrées + graine) dans ce
+# dossier, pour pouvoir la rejouer avec : python replay.py <fichier>
+ENREGISTRER_REPLAYS = True
+DOSSIER_REPLAYS = "replays"
+# Replays gardés au plus : les plus anciens sont supprimés (une borne allumée
+# en permanence ne remplit pas son disque). None = tous
+REPLAYS_MAX = 500
+
+# Joueur automatique (bot.py) : le bot joue à la place du joueur, relance une
+# partie après chaque Game Over et affiche le temps de frame minute par minute.
+# Sert aux tests d'endurance des bornes (plusieurs heures, niveaux 30 et plus).
+BOT_AUTOMATIQUE = False
+BOT_JOUEURS = 1  # Mode lancé par le bot (2 = clavier pour J1, souris pour J2)
+BOT_REGLAGES = {
+    "habilete": 0.9,  # 0 à 1 : précision des gestes
+    "reaction_frames": 12,  # Temps de réaction (60 frames = 1 seconde)
+    "evitement_bombes": 1.0,  # Probabilité d'éviter une bombe
+}
+BOT_DELAI_REJOUER = 3 * 60  # Frames sur l'écran Game Over avant de rejouer
+
+# Journal des événements (journal.py) : None = coupé (aucun coût en jeu),
+# sinon "DEBUG", "INFO", "AVERTISSEMENT" ou "ERREUR"
+JOURNAL_NIVEAU = None
+JOURNAL_CATEGORIES = None  # Ex. ["tranchage", "freeze"] ; None = toutes
+JOURNAL_FICHIER = None  # None = la console
+JOURNAL_FORMAT = "texte"  # "texte" ou "json" (une ligne JSON par message)
+
+# Télémétrie (telemetrie.py) : un fichier par partie avec le temps de chaque
+# frame, le nombre d'objets et les événements (coupes, ratés, niveaux...).
+# None = coupée ; sinon le dossier des fichiers. Analyse : python telemetrie.py <dossier>
+TELEMETRIE_DOSSIER = None
+
+# Diagnostic mémoire (memoire.py) : captures tracemalloc toutes les N frames,
+# avec ce qui a grossi et la taille des listes et des caches. Ralentit
+# beaucoup le jeu : à n'activer que pour chercher une fuite.
+MEMOIRE_DIAGNOSTIC = False
+MEMOIRE_INTERVALLE_FRAMES = 60 * 60  # Une capture par minute de jeu
+
+# Profileur (profileur.py) : panneau des temps par phase, basculé avec F3
+PROFILEUR_VISIBLE = False
+# Fichier de trace Chrome (chrome://tracing, ui.perfetto.dev) : None = pas de trace
+PROFILEUR_TRACE = None
+
+
+# Rechargement à chaud (rechargement.py) : un thread relit la date des images,
+# des sons et du fichier de difficulté ; les fichiers changés sont rechargés
+# au prochain changement d'écran, sans relancer le jeu
+RECHARGEMENT_A_CHAUD = True
+RECHARGEMENT_INTERVALLE = 1.0  # Secondes entre deux relevés
+
+# Fichiers des images des objets : un fichier par état ("up" = monte,
+# "down" = descend, "cut" = coupé) pour les fruits, un seul pour les spéciaux
+FICHIERS_IMAGES = {
+    "poire": {
+        "up": "Assets/Images/Fruits/angry_pear.png",
+        "down": "Assets/Images/Fruits/scared_pear.png",
+        "cut": "Assets/Images/Fruits/cut_pear.png",
+    },
+    "pomme": {
+        "up": "Assets/Images/Fruits/angry_apple.png",
+        "down": "Assets/Images/Fruits/scared_apple.png",
+        "cut": "Assets/Images/Fruits/cut_apple.png",
+    },
+    "banane": {
+        "up": "Assets/Images/Fruits/angry_banana.png",
+        "down": "Assets/Images/Fruits/scared_banana.png",
+        "cut": "Assets/Images/Fruits/cut_banana.png",
+    },
+    "orange": {
+        "up": "Assets/Images/Fruits/angry_orange.png",
+        "down": "Assets/Images/Fruits/scared_orange.png",
+        "cut": "Assets/Images/Fruits/cut_orange.png",
+    },
+    "bombe": "Assets/Images/Special/bombe.png",
+    "ice": "Assets/Images/Special/ice.png",
+}
+
 
 def load_assets():
     """
     Charge les images des fruits dans le dictionnaire images
     """
-    try:
-        images["poire"] = {
-            "up": pygame.image.load(
-                "Assets/Images/Fruits/angry_pear.png"
-            ).convert_alpha(),
-            "down": pygame.image.load(
-                "Assets/Images/Fruits/scared_pear.png"
-            ).convert_alpha(),
-            "cut": pygame.image.load(
-                "Assets/Images/Fruits/cut_pear.png"
-            ).convert_alpha(),
-        }
-        print("✓ Images poires chargées")
-
-        images["pomme"] = {
-            "up": pygame.image.load(
-                "Assets/Images/Fruits/angry_apple.png"
-            ).convert_alpha(),
-            "down": pygame.image.load(
-                "Assets/Images/Fruits/scared_apple.png"
-            ).convert_alpha(),
-            "cut": pygame.image.load(
-                "Assets/Images/Fruits/cut_apple.png"
-            ).convert_alpha(),
-        }
-        print("✓ Images pommes chargées")
-
-        images["banane"] = {
-            "up": pygame.image.load(
-                "Assets/Images/Fruits/angry_banana.png"
-            ).convert_alpha(),
-            "down": pygame.image.load(
-                "Assets/Images/Fruits/scared_banana.png"
-            ).convert_alpha(),
-            "cut": pygame.image.load(
-                "Assets/Images/Fruits/cut_banana.png"
-            ).convert_alpha(),
-        }
-        print("✓ Images bananes chargées")
-
-        images["orange"] = {
-            "up": pygame.image.load(
-                "Assets/Images/Fruits/angry_orange.png"
-            ).convert_alpha(),
-            "down": pygame.image.load(
-                "Assets/Images/Fruits/scared_orange.png"
-            ).convert_alpha(),
-            "cut": pygame.image.load(
-                "Assets/Images/Fruits/cut_orange.png"
-            ).convert_alpha(),
-        }
-        print("✓ Images oranges chargées")
-
-    except pygame.error as e:
-        print(f"✗ Erreur chargement images : {e}")
-        # Fallback
-        for fruit in liste_fruits:
-            images[fruit] = None
-
-    # Images des objets spéciaux
-    try:
-        images["bombe"] = pygame.image.load(
-            "Assets/Images/Special/bombe.png"
-        ).convert_alpha()
-        print("✓ Image bombe chargée")
-    except pygame.error as e:
-        print(f"✗ Erreur chargement image bombe : {e}")
-        images["bombe"] = None
-
-    try:
-        images["ice"] = pygame.image.load(
-            "Assets/Images/Special/ice.png"
-        ).convert_alpha()
-        print("✓ Image ice chargée")
-    except pygame.error as e:
-        print(f"✗ Erreur chargement image ice : {e}")
-        images["ice"] = None
\ No newline at end of file
+    for type_objet, fichiers in FICHIERS_IMAGES.items():
+        try:
+            if isinstance(fichiers, dict):
+                images[type_objet] = {
+                    etat: pygame.image.load(chemin).convert_alpha()
+                    for etat, chemin in fichiers.items()
+                }
+                print(f"✓ Images {type_objet} chargées")
+            else:
+                images[type_objet] = pygame.image.load(fichiers).convert_alpha()
+                print(f"✓ Image {type_objet} chargée")
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"✗ Erreur chargement image {type_objet} : {e}")
+            # Fallback
+            images[type_objet] = None
+
+
+def recharger_image(chemin):
+    """
+    Recharge une seule image (rechargement à chaud).
+
+    Args:
+        chemin (str): Fichier de l'image (une valeur de FICHIERS_IMAGES)
+
+    Retourne:
+        str: Type d'objet de l'image ("pomme", "bombe"...)
+    """
+    for type_objet, fichiers in FICHIERS_IMAGES.items():
+        if fichiers == chemin:
+            images[type_objet] = pygame.image.load(chemin).convert_alpha()
+            return type_objet
+        if isinstance(fichiers, dict) and chemin in fichiers.values():
+            # Un nouveau dict : les objets déjà lancés gardent l'ancien. Les
+            # états absents (erreur au démarrage) sont relus aussi.
+            anciennes = images.get(type_objet) or {}
+            nouvelles = {}
+            for etat, fichier in fichiers.items():
+                if fichier == chemin or etat not in anciennes:
+                    nouvelles[etat] = pygame.image.load(fichier).convert_alpha()
+                else:
+                    nouvelles[etat] = anciennes[etat]
+            images[type_objet] = nouvelles
+            return type_objet
+    raise ValueError(f"Image inconnue : {chemin}")
@@ -1,15 +1,99 @@
 import pygame
 import math
-from objets import Fruit, Glacon, Bombe, MorceauFruit
+from array import array
+import journal
 
-# Variables pour le slicing à la souris
-slicing = False
-# Liste des positions de la souris pendant le tranchage (pour dessiner la traînée)
-slice_points = []
 
 # ============================================================================
-# VARIABLES POUR LE SYSTÈME DE COMBO
+# CLASSE : TraineeLame
 # ============================================================================
+# Mémoire circulaire (ring buffer) de taille fixe pour les positions de la
+# souris pendant le tranchage.
+#
+# POURQUOI ?
+# - Avec une liste, slice_points.pop(0) décale tous les éléments à chaque point
+# - Ici, les tableaux sont alloués UNE fois : ajouter un point écrase le plus
+#   ancien, sans aucune allocation ni décalage
+# - Chaque point garde son horodatage, pour faire disparaître la traînée
+#   quand la souris s'arrête
+# ============================================================================
+class TraineeLame:
+    """
+    Traînée de la lame, stockée dans des tableaux circulaires.
+
+    Attributs:
+        capacite (int): Nombre maximum de points gardés
+        duree_vie_ms (int): Âge maximum d'un point avant de disparaître
+        xs, ys (array): Positions des points
+        temps (array): Horodatage de chaque point en millisecondes
+        debut (int): Index du point le plus ancien
+        taille (int): Nombre de points actuellement stockés
+    """
+
+    def __init__(self, capacite=32, duree_vie_ms=180):
+        self.capacite = capacite
+        self.duree_vie_ms = duree_vie_ms
+        self.xs = array("d", [0.0]) * capacite
+        self.ys = array("d", [0.0]) * capacite
+        self.temps = array("d", [0.0]) * capacite
+        self.debut = 0
+        self.taille = 0
+
+    def __len__(self):
+        return self.taille
+
+    def vider(self):
+        """Supprime tous les points (sans réallouer les tableaux)."""
+        self.debut = 0
+        self.taille = 0
+
+    def ajouter(self, pos, temps):
+        """
+        Ajoute un point ; si la traînée est pleine, le plus ancien est écrasé.
+
+        Args:
+            pos (tuple): Position (x, y)
+            temps (float): Horodatage en millisecondes
+        """
+        if self.taille < self.capacite:
+            index = (self.debut + self.taille) % self.capacite
+            self.taille += 1
+        else:
+            index = self.debut
+            self.debut = (self.debut + 1) % self.capacite
+        self.xs[index] = pos[0]
+        self.ys[index] = pos[1]
+        self.temps[index] = temps
+
+    def points(self, maintenant=None):
+        """
+        Retourne les points du plus ancien au plus récent.
+
+        Args:
+            maintenant (float): Si donné, les points plus vieux que
+                duree_vie_ms sont ignorés
+
+        Retourne:
+            list: Liste de tuples (x, y)
+        """
+        resultat = []
+        for i in range(self.taille):
+            index = (self.debut + i) % self.capacite
+            if maintenant is not None and maintenant - self.temps[index] > self.duree_vie_ms:
+                continue
+            resultat.append((self.xs[index], self.ys[index]))
+        return resultat
+
+
+# ============================================================================
+# CLASSE : ControleurJoueur
+# ============================================================================
+# Le tranchage à la souris d'UN joueur : geste en cours, traînée de la lame
+# et combo. Chaque partie (simulation.py) a ses propres contrôleurs : on peut
+# faire tourner plusieurs parties dans le même processus (bots, équilibrage,
+# tests) sans qu'elles se mélangent.
+#
+# SYSTÈME DE COMBO :
 # Un combo, c'est quand le joueur tranche plusieurs fruits en un seul geste
 # (sans relâcher le bouton de la souris)
 #
@@ -22,227 +106,300 @@ slice_points = []
 #
 # FORMULE : points = fruits_tranches + max(0, fruits_tranches - 2)
 # ============================================================================
-
-# Compteur de fruits tranchés pendant le geste actuel
-combo_actuel = 0
-
-
-def start_slice(mouse_pos):
+class ControleurJoueur:
     """
-    :Param: Démarre le slicing quand le joueur appuie sur le bouton de la souris.
-    Args:
-        mouse_pos (tuple): Position initiale de la souris (x, y)
-    """
-    global slicing, slice_points, combo_actuel
-
-    # Active le mode tranchage
-    slicing = True
-
-    # Commence une nouvelle traînée avec la position actuelle
-    slice_points = [mouse_pos]
-
-    # Réinitialise le combo (nouveau geste = nouveau combo)
-    combo_actuel = 0
+    Tranchage à la souris d'un joueur.
 
-
-def update_slice(mouse_pos, mes_fruits, screen_width, nombre_de_joueurs=1, morceaux_fruits=None):
+    Attributs:
+        slicing (bool): True pendant un geste (bouton de la souris enfoncé)
+        trainee (TraineeLame): Positions de la souris pendant le geste
+        combo_actuel (int): Fruits tranchés pendant le geste actuel
     """
-    :Param: Met à jour la traînée ET vérifie les collisions en temps réel (sous le curseur)
 
-    Args:
-        mouse_pos (tuple): Position actuelle de la souris (x, y)
-        mes_fruits (list): Liste des fruits actuellement à l'écran
-        screen_width (int): Largeur de l'écran (pour gérer les 2 joueurs)
-        nombre_de_joueurs (int): Nombre de joueurs (1 ou 2)
-        morceaux_fruits (list): Liste pour stocker les morceaux de fruits créés lors de la coupe
-    Retourne:
-        str: "freeze" si un glaçon a été tranché
-        str: "game_over" si une bombe a été tranchée
-        int: 1 si un fruit normal a été tranché
-        None: si rien n'a été tranché
-    """
-    global slice_points, combo_actuel
+    __slots__ = ("slicing", "trainee", "combo_actuel")
+
+    def __init__(self):
+        self.slicing = False
+        self.trainee = TraineeLame()
+        self.combo_actuel = 0
+
+    def reinitialiser(self):
+        """Abandonne le geste en cours (nouvelle partie)."""
+        self.slicing = False
+        self.combo_actuel = 0
+        self.trainee.vider()
+
+    def start_slice(self, mouse_pos, temps=None):
+        """
+        :Param: Démarre le slicing quand le joueur appuie sur le bouton de la souris.
+        Args:
+            mouse_pos (tuple): Position initiale de la souris (x, y)
+            temps (float): Horodatage en ms (par défaut pygame.time.get_ticks())
+        """
+
+        # Active le mode tranchage
+        self.slicing = True
+
+        # Commence une nouvelle traînée avec la position actuelle
+        self.trainee.vider()
+        self.trainee.ajouter(mouse_pos, pygame.time.get_ticks() if temps is None else temps)
+
+        # Réinitialise le combo (nouveau geste = nouveau combo)
+        self.combo_actuel = 0
+
+    def update_slice(
+        self,
+        mouse_pos,
+        mes_fruits,
+        screen_width,
+        nombre_de_joueurs=1,
+        morceaux_fruits=None,
+        temps=None,
+        rng=None,
+    ):
+        """
+        :Param: Met à jour la traînée ET vérifie les collisions en temps réel (sous le curseur)
+
+        Args:
+            mouse_pos (tuple): Position actuelle de la souris (x, y)
+            mes_fruits (ObjetsVolants): Fruits, glaçons et bombes à l'écran
+            screen_width (int): Largeur de l'écran (pour gérer les 2 joueurs)
+            nombre_de_joueurs (int): Nombre de joueurs (1 ou 2)
+            morceaux_fruits (Morceaux): Reçoit les morceaux des fruits coupés
+            temps (float): Horodatage en ms (par défaut pygame.time.get_ticks())
+            rng (Random): Générateur aléatoire des effets, pour les morceaux
+        Retourne:
+            str: "freeze" si un glaçon a été tranché
+            str: "game_over" si une bombe a été tranchée
+            int: 1 si un fruit normal a été tranché
+            None: si rien n'a été tranché
+        """
+
+        # Si on n'est pas en mode slicing, on ne fait rien
+        if not self.slicing:
+            return None
+
+        # ========================================================================
+        # ÉTAPE 1 : Mise à jour de la traînée visuelle
+        # ========================================================================
+
+        # Ajoute la position actuelle de la souris à la traînée
+        # (taille fixe : le point le plus ancien est écrasé quand elle est pleine)
+        self.trainee.ajouter(mouse_pos, pygame.time.get_ticks() if temps is None else temps)
+
+        # ========================================================================
+        # ÉTAPE 2 : VÉRIFICATION DES COLLISIONS (POINT vs CERCLE)
+        # ========================================================================
+
+        # Position de la souris
+        mx, my = mouse_pos
+
+        # Milieu de l'écran (pour 2 joueurs)
+        milieu_x = screen_width // 2
+
+        # On parcourt une copie de la liste [:] pour pouvoir supprimer dedans sans bug
+        for fruit in mes_fruits[:]:
+
+            # --- VÉRIFICATION DE LA ZONE (J2 ne peut couper qu'à droite) ---
+            if nombre_de_joueurs == 2:
+                # Si le fruit est à GAUCHE, le joueur 2 (Souris) ne peut pas le toucher
+                if fruit.x < milieu_x:
+                    continue
+                # Protection supplémentaire : Si la SOURIS est à gauche, on ne coupe pas
+                if mx < milieu_x:
+                    continue
+
+            # --- VÉRIFICATION COLLISION (POINT vs CERCLE) ---
+            # On regarde simplement si le curseur de la souris est DANS le rayon du fruit
+            # On utilise la formule de distance euclidienne :
+            # distance = √((x2-x1)² + (y2-y1)²)
+            #
+            # Si cette distance est inférieure au rayon du fruit,
+            # alors la souris est "dans" le fruit = collision !
+            distance = math.sqrt((mx - fruit.x) ** 2 + (my - fruit.y) ** 2)
+
+            #  --- COLLISION DÉTECTÉE ---
+            if distance < fruit.radius:
+                # Vérifie qu'on ne coupe pas un fruit déjà coupé
+                if not fruit.sliced:
+
+                    # ============================================================
+                    # CAS 1 : C'est un GLAÇON (effet "freeze", voir objets.GENRES)
+                    # ============================================================
+                    effet = fruit.effet
+                    if effet == "freeze":
+                        mes_fruits.remove(fruit)
+
+                        # Détermine quel joueur a tranché (basé sur la position de la souris)
+                        if nombre_de_joueurs == 2:
+                            joueur = 2 if mx >= milieu_x else 1
+                            if journal.actif_info:
+                                journal.ecrire(journal.INFO, "tranchage", "Glaçon tranché", joueur=joueur)
+                            return f"freeze_j{joueur}"
+                        else:
+                            if journal.actif_info:
+                                journal.ecrire(journal.INFO, "tranchage", "Glaçon tranché")
+                            return "freeze"
+
+                    # ============================================================
+                    # CAS 2 : C'est une BOMBE (effet "explosion")
+                    # ============================================================
+                    if effet == "explosion":
+                        mes_fruits.remove(fruit)  # La bombe disparaît
+                        if journal.actif_info:
+                            journal.ecrire(journal.INFO, "tranchage", "Bombe tranchée", x=mx, y=my)
+                        return "game_over"
+
+                    # ============================================================
+                    # CAS 3 : C'est un FRUIT (normal) - MODIFIÉ POUR LES MORCEAUX
+                    # ============================================================
+
+                    # Incrémente le compteur de combo
+                    self.combo_actuel += 1
+
+                    # Appelle la méthode couper() qui retourne les infos pour les morceaux
+                    infos_coupe = fruit.couper()
+
+                    # Si on a les infos ET une liste pour stocker les morceaux
+                    if infos_coupe and morceaux_fruits is not None:
+                        # --------------------------------------------------------
+                        # CRÉATION DES 2 MORCEAUX DE FRUIT
+                        # --------------------------------------------------------
+                        # On crée 2 morceaux à partir des infos retournées par
+                        # fruit.couper(). Les 2 morceaux partent de la même position mais dans des directions opposées.
+
+                        # Morceau GAUCHE : part vers la gauche avec rotation anti-horaire
+                        morceaux_fruits.creer(
+                            infos_coupe["x"], infos_coupe["y"], infos_coupe["image"], "gauche", rng
+                        )
+
+                        # Morceau DROIT : part vers la droite avec rotation horaire
+                        # L'image est automatiquement inversée (miroir)
+                        morceaux_fruits.creer(
+                            infos_coupe["x"], infos_coupe["y"], infos_coupe["image"], "droite", rng
+                        )
+
+                    if journal.actif_debug:
+                        journal.ecrire(
+                            journal.DEBUG, "tranchage", "Fruit tranché", type=fruit.type, combo=self.combo_actuel
+                        )
+
+                    # Supprime le fruit original de la liste
+                    # (il est remplacé par les 2 morceaux)
+                    mes_fruits.remove(fruit)
+
+                    # Retourne 1 pour signaler qu'un fruit a été tranché
+                    return 1
 
-    # Si on n'est pas en mode slicing, on ne fait rien
-    if not slicing:
+        # Aucune collision détectée
         return None
 
-    # ========================================================================
-    # ÉTAPE 1 : Mise à jour de la traînée visuelle
-    # ========================================================================
+    def end_slice(self, mes_fruits, screen_width=None, nombre_de_joueurs=1):
+        """
+        :Param: Termine le slicing quand le joueur relâche le bouton de la souris et calcule le score du combo.
 
-    # Ajoute la position actuelle de la souris à la traînée
-    slice_points.append(mouse_pos)
+        Args:
+            mes_fruits (ObjetsVolants): Fruits, glaçons et bombes à l'écran
+            screen_width (int): Largeur de l'écran (pour gérer les 2 joueurs)
+            nombre_de_joueurs (int): Nombre de joueurs (1 ou 2)
 
-    # Limite la longueur de la traînée à 15 points pour éviter une traînée infinie
-    if len(slice_points) > 15:
-        slice_points.pop(0)
+        Retourne:
+            int: le score total à ajouter (fruits tranchés + bonus combo). Retourne 0 si aucun fruit tranché.
+        """
 
-    # ========================================================================
-    # ÉTAPE 2 : VÉRIFICATION DES COLLISIONS (POINT vs CERCLE)
-    # ========================================================================
+        # Désactive le mode tranchage
+        self.slicing = False
 
-    # Position de la souris
-    mx, my = mouse_pos
+        # Réinitialise la traînée visuelle
+        self.trainee.vider()
 
-    # Milieu de l'écran (pour 2 joueurs)
-    milieu_x = screen_width // 2
+        # Calcul du score basé sur le combo
+        if self.combo_actuel == 0:
+            # Aucun fruit tranché pendant ce geste
+            return 0
 
-    # On parcourt une copie de la liste [:] pour pouvoir supprimer dedans sans bug
-    for fruit in mes_fruits[:]:
+        # Calcul du bonus
+        # max(0, x) retourne 0 si x est négatif, sinon retourne x
+        # Cela évite d'avoir un bonus négatif pour 1 ou 2 fruits
+        bonus = max(0, self.combo_actuel - 2)
 
-        # --- VÉRIFICATION DE LA ZONE (J2 ne peut couper qu'à droite) ---
-        if nombre_de_joueurs == 2:
-            # Si le fruit est à GAUCHE, le joueur 2 (Souris) ne peut pas le toucher
-            if fruit.x < milieu_x:
-                continue
-            # Protection supplémentaire : Si la SOURIS est à gauche, on ne coupe pas
-            if mx < milieu_x:
-                continue
+        # Score total = fruits tranchés + bonus
+        score_geste = self.combo_actuel + bonus
 
-        # --- VÉRIFICATION COLLISION (POINT vs CERCLE) ---
-        # On regarde simplement si le curseur de la souris est DANS le rayon du fruit
-        # On utilise la formule de distance euclidienne :
-        # distance = √((x2-x1)² + (y2-y1)²)
-        #
-        # Si cette distance est inférieure au rayon du fruit,
-        # alors la souris est "dans" le fruit = collision !
-        distance = math.sqrt((mx - fruit.x) ** 2 + (my - fruit.y) ** 2)
-
-        #  --- COLLISION DÉTECTÉE ---
-        if distance < fruit.radius:
-            # Vérifie qu'on ne coupe pas un fruit déjà coupé
-            if not fruit.sliced:
-
-                # ============================================================
-                # CAS 1 : C'est un GLAÇON
-                # ============================================================
-                if isinstance(fruit, Glacon) or fruit.type == "ice":
-                    mes_fruits.remove(fruit)
+        # Journal : résultat du combo
+        if journal.actif_info:
+            journal.ecrire(
+                journal.INFO, "tranchage", "Fin du geste", fruits=self.combo_actuel, bonus=bonus, points=score_geste
+            )
 
-                    # Détermine quel joueur a tranché (basé sur la position de la souris)
-                    if nombre_de_joueurs == 2:
-                        if mx >= milieu_x:
-                            print("Glacon tranche par J2 !")
-                            return "freeze_j2"
-                        else:
-                            print("Glacon tranche par J1 !")
-                            return "freeze_j1"
-                    else:
-                        print("Glacon tranche !")
-                        return "freeze"
-
-                # ============================================================
-                # CAS 2 : C'est une BOMBE
-                # ============================================================
-                if isinstance(fruit, Bombe) or fruit.type == "bombe":
-                    mes_fruits.remove(fruit)  # La bombe disparaît
-                    print("BOOM ! Bombe tranchée !")
-                    return "game_over"
-
-                # ============================================================
-                # CAS 3 : C'est un FRUIT (normal) - MODIFIÉ POUR LES MORCEAUX
-                # ============================================================
-
-                # Incrémente le compteur de combo
-                combo_actuel += 1
+        # Réinitialise le compteur pour le prochain geste
+        self.combo_actuel = 0
 
-                # Appelle la méthode couper() qui retourne les infos pour les morceaux
-                infos_coupe = fruit.couper()
+        return score_geste
 
-                # Si on a les infos ET une liste pour stocker les morceaux
-                if infos_coupe and morceaux_fruits is not None:
-                    # --------------------------------------------------------
-                    # CRÉATION DES 2 MORCEAUX DE FRUIT
-                    # --------------------------------------------------------
-                    # On crée 2 objets MorceauFruit à partir des infos retournées
-                    # par fruit.couper(). Les 2 morceaux partent de la même position mais dans des directions opposées.
-                    
-                    # Morceau GAUCHE : part vers la gauche avec rotation anti-horaire
-                    morceau_gauche = MorceauFruit(
-                        x=infos_coupe["x"],
-                        y=infos_coupe["y"],
-                        image=infos_coupe["image"],
-                        direction="gauche"
-                    )
-                    
-                    # Morceau DROIT : part vers la droite avec rotation horaire
-                    # L'image sera automatiquement inversée (miroir) dans le constructeur
-                    morceau_droite = MorceauFruit(
-                        x=infos_coupe["x"],
-                        y=infos_coupe["y"],
-                        image=infos_coupe["image"],
-                        direction="droite"
-                    )
-                    
-                    # Ajout des 2 morceaux à la liste
-                    morceaux_fruits.append(morceau_gauche)
-                    morceaux_fruits.append(morceau_droite)
-                    
-                    print(f"🍎 Fruit tranché en 2 morceaux ! Combo actuel : {combo_actuel}")
-                else:
-                    print(f"🍎 Fruit tranché ! Combo actuel : {combo_actuel}")
+    def draw_slice(self, screen, temps=None, echelle=1.0):
+        """
+        :Param: Dessine la traînée de la lame pendant un geste
+        Args:
+            screen (pygame.Surface): Surface de l'écran où dessiner
+            temps (float): Horodatage en ms (par défaut pygame.time.get_ticks())
+            echelle (float): Taille de screen par rapport à celle du jeu
+        """
+        if self.slicing:
+            dessiner_trainee(screen, self.trainee, temps, echelle)
 
-                # Supprime le fruit original de la liste
-                # (il est remplacé par les 2 morceaux)
-                mes_fruits.remove(fruit)
+    def get_combo_actuel(self):
+        """
+        :Param: Retourne le nombre de fruits tranchés dans le combo en cours.
 
-                # Retourne 1 pour signaler qu'un fruit a été tranché
-                return 1
+        UTILITÉ :
+        - Permet d'afficher le combo en temps réel à l'écran
+        - Peut être utilisé pour des effets visuels (ex: texte "COMBO x3!")
 
-    # Aucune collision détectée
-    return None
+        Retourne:
+            int: Nombre de fruits tranchés dans le geste actuel
+        """
+        return self.combo_actuel
 
 
-def end_slice(mes_fruits, screen_width=None, nombre_de_joueurs=1):
+def zones_clavier(screen_width, screen_height):
     """
-    :Param: Termine le slicing quand le joueur relâche le bouton de la souris et calcule le score du combo.
+    :Param: Retourne les 4 zones du joueur 1 (moitié gauche), par touche.
 
     Args:
-        mes_fruits (list): Liste des fruits actuellement à l'écran
-        screen_width (int): Largeur de l'écran (pour gérer les 2 joueurs)
-        nombre_de_joueurs (int): Nombre de joueurs (1 ou 2)
+        screen_width (int): Largeur de l'écran
+        screen_height (int): Hauteur de l'écran
 
     Retourne:
-        int: le score total à ajouter (fruits tranchés + bonus combo). Retourne 0 si aucun fruit tranché.
+        dict: Touche (pygame.K_*) -> (x_min, y_min, x_max, y_max)
     """
-    global slicing, slice_points, combo_actuel
-
-    # Désactive le mode tranchage
-    slicing = False
-
-    # Réinitialise la traînée visuelle
-    slice_points = []
-
-    # Calcul du score basé sur le combo
-    if combo_actuel == 0:
-        # Aucun fruit tranché pendant ce geste
-        return 0
-
-    # Calcul du bonus
-    # max(0, x) retourne 0 si x est négatif, sinon retourne x
-    # Cela évite d'avoir un bonus négatif pour 1 ou 2 fruits
-    bonus = max(0, combo_actuel - 2)
-
-    # Score total = fruits tranchés + bonus
-    score_geste = combo_actuel + bonus
-
-    # Affiche le résultat du combo
-    if bonus > 0:
-        print(
-            f"COMBO x{combo_actuel} ! {combo_actuel} fruits + {bonus} bonus = {score_geste} points !"
-        )
-    elif combo_actuel > 0:
-        print(f"✓ {combo_actuel} fruit(s) tranché(s) = {score_geste} point(s)")
-
-    # Réinitialise le compteur pour le prochain geste
-    combo_actuel = 0
-
-    return score_geste
+    milieu_x = screen_width // 2
+    return {
+        pygame.K_z: (0, 0, milieu_x // 2, screen_height // 2),  # Haut-gauche
+        pygame.K_s: (0, screen_height // 2, milieu_x // 2, screen_height),  # Bas-gauche
+        pygame.K_d: (
+            milieu_x // 2,
+            screen_height // 2,
+            milieu_x,
+            screen_height,
+        ),  # Bas-droite (de la zone J1)
+        pygame.K_e: (
+            milieu_x // 2,
+            0,
+            milieu_x,
+            screen_height // 2,
+        ),  # Haut-droite (de la zone J1)
+    }
 
 
 def handle_keyboard_inputs(
-    mes_fruits, screen_width, screen_height, key, nombre_de_joueurs=1, morceaux_fruits=None
+    mes_fruits,
+    screen_width,
+    screen_height,
+    key,
+    nombre_de_joueurs=1,
+    morceaux_fruits=None,
+    rng=None,
 ):
     """
     :Param: Gère les entrées clavier pour le joueur 1 (ZSDE) en mode 2 joueurs.
@@ -261,12 +418,13 @@ def handle_keyboard_inputs(
     +-------+-------+
 
     Args:
-        mes_fruits (list): Liste des fruits actuellement à l'écran
+        mes_fruits (ObjetsVolants): Fruits, glaçons et bombes à l'écran
         screen_width (int): Largeur de l'écran
         screen_height (int): Hauteur de l'écran
         key (int): Touche appuyée (pygame.K_*)
         nombre_de_joueurs (int): Nombre de joueurs (1 ou 2)
-        morceaux_fruits (list): Liste pour stocker les morceaux de fruits coupés
+        morceaux_fruits (Morceaux): Reçoit les morceaux des fruits coupés
+        rng (Random): Générateur aléatoire des effets, pour les morceaux
     Retourne:
         str: "freeze" si un glaçon a été tranché
         str: "game_over" si une bombe a été tranchée
@@ -274,30 +432,11 @@ def handle_keyboard_inputs(
         int : le score total à ajouter (fruits tranchés + bonus combo). Retourne 0 si aucun fruit tranché.
     """
 
-    # Calcul du milieu de l'écran
-    milieu_x = screen_width // 2
-
     # Variable pour indiquer si un bonus a été activé
     bonus_active = None
 
     # Définition des 4 zones du joueur 1 (Gauche)
-    # Format: (x_min, y_min, x_max, y_max)
-    zones = {
-        pygame.K_z: (0, 0, milieu_x // 2, screen_height // 2),  # Haut-gauche
-        pygame.K_s: (0, screen_height // 2, milieu_x // 2, screen_height),  # Bas-gauche
-        pygame.K_d: (
-            milieu_x // 2,
-            screen_height // 2,
-            milieu_x,
-            screen_height,
-        ),  # Bas-droite (de la zone J1)
-        pygame.K_e: (
-            milieu_x // 2,
-            0,
-            milieu_x,
-            screen_height // 2,
-        ),  # Haut-droite (de la zone J1)
-    }
+    zones = zones_clavier(screen_width, screen_height)
 
     # Vérifie si la touche pressée correspond à une zone
     if key not in zones:
@@ -318,9 +457,11 @@ def handle_keyboard_inputs(
             # ================================================================
             # CAS BOMBE
             # ================================================================
-            if isinstance(fruit, Bombe) or fruit.type == "bombe":
+            effet = fruit.effet
+            if effet == "explosion":
                 mes_fruits.remove(fruit)
-                print("[J1 CLAVIER] Bombe tranchée ! GAME OVER !")
+                if journal.actif_info:
+                    journal.ecrire(journal.INFO, "clavier", "Bombe tranchée", touche=key)
                 bonus_active = "game_over"
                 # On continue quand même pour trancher les autres fruits
                 # (mais le jeu va s'arrêter après)
@@ -328,15 +469,15 @@ def handle_keyboard_inputs(
             # ================================================================
             # CAS GLAÇON
             # ================================================================
-            elif isinstance(fruit, Glacon) or fruit.type == "ice":
+            elif effet == "freeze":
                 mes_fruits.remove(fruit)
                 # En mode 2 joueurs, le clavier = Joueur 1
                 if nombre_de_joueurs == 2:
-                    print("[J1 CLAVIER] Glaçon tranché ! Freeze J1 !")
                     bonus_active = "freeze_j1"
                 else:
-                    print("[J1 CLAVIER] Glaçon tranché ! Temps gelé !")
                     bonus_active = "freeze"
+                if journal.actif_info:
+                    journal.ecrire(journal.INFO, "clavier", "Glaçon tranché", touche=key)
 
             # ================================================================
             # CAS FRUIT NORMAL - MODIFIÉ POUR LES MORCEAUX
@@ -351,22 +492,12 @@ def handle_keyboard_inputs(
                     # --------------------------------------------------------
                     # CRÉATION DES 2 MORCEAUX DE FRUIT
                     # --------------------------------------------------------
-                    morceau_gauche = MorceauFruit(
-                        x=infos_coupe["x"],
-                        y=infos_coupe["y"],
-                        image=infos_coupe["image"],
-                        direction="gauche"
+                    morceaux_fruits.creer(
+                        infos_coupe["x"], infos_coupe["y"], infos_coupe["image"], "gauche", rng
                     )
-                    
-                    morceau_droite = MorceauFruit(
-                        x=infos_coupe["x"],
-                        y=infos_coupe["y"],
-                        image=infos_coupe["image"],
-                        direction="droite"
+                    morceaux_fruits.creer(
+                        infos_coupe["x"], infos_coupe["y"], infos_coupe["image"], "droite", rng
                     )
-                    
-                    morceaux_fruits.append(morceau_gauche)
-                    morceaux_fruits.append(morceau_droite)
     
                 # Supprime le fruit original de la liste
                 mes_fruits.remove(fruit)
@@ -380,12 +511,10 @@ def handle_keyboard_inputs(
         bonus = max(0, fruits_tranches - 2)
         score_total = fruits_tranches + bonus
 
-        if bonus > 0:
-            print(
-                f"[J1 CLAVIER] COMBO x{fruits_tranches} ! +{bonus} bonus = {score_total} points !"
+        if journal.actif_info:
+            journal.ecrire(
+                journal.INFO, "clavier", "Zone tranchée", fruits=fruits_tranches, bonus=bonus, points=score_total
             )
-        else:
-            print(f"[J1 CLAVIER] {fruits_tranches} fruit(s) = {score_total} point(s)")
 
         # Si un effet spécial a été déclenché, on le retourne en priorité
         if bonus_active:
@@ -397,30 +526,110 @@ def handle_keyboard_inputs(
     return bonus_active
 
 
-def draw_slice(screen):
+# ============================================================================
+# RENDU DE LA TRAÎNÉE : BANDE DÉGRADÉE PRÉ-DESSINÉE
+# ============================================================================
+# La lame est dessinée avec des "tampons" ronds pris dans une bande d'images
+# calculée UNE seule fois : du plus fin et transparent (queue de la lame) au
+# plus épais et opaque (pointe). On pose un nombre BORNÉ de tampons le long
+# de la traînée, en un seul appel blits() : une traînée plus longue et plus
+# jolie coûte le même prix par frame.
+# ============================================================================
+NOMBRE_TAMPONS_BANDE = 12  # Nombre de tampons différents dans la bande
+RAYON_MIN_LAME = 1
+RAYON_MAX_LAME = 7
+ESPACEMENT_TAMPONS = 4  # Distance visée entre deux tampons, en pixels
+TAMPONS_MAX = 64  # Nombre maximum de tampons posés par frame
+
+# Tampons pré-dessinés (liste de (Surface, rayon)), créés au premier dessin
+_tampons_lame = None
+
+
+def _creer_tampons_lame():
     """
-    :Param: Dessine la traînée visuelle
-    Args:
-        screen (pygame.Surface): Surface de l'écran où dessiner
+    Dessine la bande dégradée et la découpe en tampons.
+
+    Retourne:
+        list: Liste de tuples (Surface, rayon), de la queue vers la pointe
     """
+    cote = RAYON_MAX_LAME * 2 + 2
+    bande = pygame.Surface((cote * NOMBRE_TAMPONS_BANDE, cote), pygame.SRCALPHA)
+    tampons = []
 
-    # On ne dessine que si on est en mode slicing et qu'il y a assez de points
-    if slicing and len(slice_points) > 1:
-        pygame.draw.lines(screen, (255, 255, 255), False, slice_points, 3)
+    for i in range(NOMBRE_TAMPONS_BANDE):
+        t = i / (NOMBRE_TAMPONS_BANDE - 1)
+        rayon = round(RAYON_MIN_LAME + (RAYON_MAX_LAME - RAYON_MIN_LAME) * t)
+        alpha = int(60 + 195 * t)
+        centre = (i * cote + cote // 2, cote // 2)
 
+        # Halo bleuté puis coeur blanc
+        pygame.draw.circle(bande, (170, 220, 255, alpha // 2), centre, rayon)
+        pygame.draw.circle(bande, (255, 255, 255, alpha), centre, max(1, rayon - 2))
 
-# ============================================================================
-# FONCTION : get_combo_actuel (utilitaire)
-# ============================================================================
-def get_combo_actuel():
-    """
-    :Param: Retourne le nombre de fruits tranchés dans le combo en cours.
+        # Sous-surface : partage les pixels de la bande, aucune copie
+        tampon = bande.subsurface((i * cote, 0, cote, cote))
+        tampons.append((tampon, cote // 2))
 
-    UTILITÉ :
-    - Permet d'afficher le combo en temps réel à l'écran
-    - Peut être utilisé pour des effets visuels (ex: texte "COMBO x3!")
+    return tampons
 
-    Retourne:
-        int: Nombre de fruits tranchés dans le geste actuel
+
+def dessiner_trainee(screen, trainee, temps=None, echelle=1.0):
     """
-    return combo_actuel
+    :Param: Dessine la traînée visuelle (lame effilée qui s'estompe)
+    Args:
+        screen (pygame.Surface): Surface de l'écran où dessiner
+        trainee (TraineeLame): Positions de la lame (dans le jeu)
+        temps (float): Horodatage en ms (par défaut pygame.time.get_ticks())
+        echelle (float): Taille de screen par rapport à celle du jeu
+    """
+    global _tampons_lame
+
+    # On ne dessine que s'il y a assez de points
+    if len(trainee) < 2:
+        return
+
+    points = trainee.points(pygame.time.get_ticks() if temps is None else temps)
+    if len(points) < 2:
+        return
+
+    if _tampons_lame is None:
+        _tampons_lame = _creer_tampons_lame()
+
+    # Longueur de chaque segment et longueur totale
+    longueurs = []
+    total = 0.0
+    for i in range(1, len(points)):
+        longueur = math.hypot(
+            points[i][0] - points[i - 1][0], points[i][1] - points[i - 1][1]
+        )
+        longueurs.append(longueur)
+        total += longueur
+
+    if total <= 0:
+        return
+
+    # Nombre de tampons : borné pour un coût constant
+    nombre = max(2, min(TAMPONS_MAX, int(total / ESPACEMENT_TAMPONS) + 1))
+
+    # On avance le long de la traînée en posant les tampons à intervalle régulier
+    elements = []
+    segment = 0
+    debut_segment = 0.0
+    for k in range(nombre):
+        distance = total * k / (nombre - 1)
+        while segment < len(longueurs) - 1 and debut_segment + longueurs[segment] < distance:
+            debut_segment += longueurs[segment]
+            segment += 1
+
+        longueur = longueurs[segment]
+        t = 0.0 if longueur == 0 else min(1.0, (distance - debut_segment) / longueur)
+        x0, y0 = points[segment]
+        x1, y1 = points[segment + 1]
+        x = x0 + (x1 - x0) * t
+        y = y0 + (y1 - y0) * t
+
+        # Queue de la lame = petits tampons transparents, pointe = gros tampons opaques
+        tampon, rayon = _tampons_lame[k * (NOMBRE_TAMPONS_BANDE - 1) // (nombre - 1)]
+        elements.append((tampon, (int(x * echelle) - rayon, int(y * echelle) - rayon)))
+
+    screen.blits(elements, doreturn=False)
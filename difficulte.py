@@ -0,0 +1,291 @@
+# ============================================================================
+# FICHIER : difficulte.py
+# DESCRIPTION : Tables de difficulté (lues depuis difficulte.json)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - La lecture du fichier de difficulté (FICHIER_DIFFICULTE) : une courbe
+#   par mode (1 ou 2 joueurs), plus des valeurs propres à certains niveaux
+# - Les courbes intégrées (CONFIG_PAR_DEFAUT), utilisées si le fichier
+#   manque ou est invalide
+# - La compilation de chaque courbe en tables, une ligne par niveau :
+#   gravité, délais entre deux lancers, chance d'objet spécial, nombre
+#   maximal d'objets à l'écran
+#
+# POURQUOI ?
+# Les formules de difficulté étaient écrites dans la simulation, et le mode
+# 2 joueurs avait ses propres valeurs en dur (délais 30 à 100, gravité 0.4).
+# Avec un fichier, on règle la difficulté d'une borne sans toucher au code.
+# Les tables sont calculées une fois au démarrage : monter de niveau ne
+# fait plus que changer d'indice dans les tables.
+#
+# UNE COURBE (un mode du fichier) :
+# - niveau = score // points_par_niveau + 1
+# - gravité = gravite_base + (niveau - 1) * gravite_par_niveau, plafonnée à gravite_max
+# - délai entre deux objets (en frames), tiré entre freq_min et freq_max :
+#   freq_min = max(freq_min_plancher, freq_min_base - (niveau - 1) * freq_min_pente)
+#   freq_max = max(freq_max_plancher, freq_max_base - (niveau - 1) * freq_max_pente)
+# - chance_special : pourcentage de bombes / glaçons parmi les objets lancés
+# - max_objets : objets volants à l'écran au plus (les lancers attendent)
+# - niveaux : valeurs imposées à un niveau, par exemple
+#   "niveaux": {"12": {"chance_special": 45, "max_objets": 12}}
+# Au-delà de niveau_max, le dernier niveau de la table s'applique.
+#
+# Pour l'équilibrer sans jouer à la main : python tuner.py
+#
+# ============================================================================
+
+import json
+
+from constantes import FICHIER_DIFFICULTE
+
+# Paramètres d'une courbe et leur type
+PARAMETRES = {
+    "points_par_niveau": int,
+    "gravite_base": float,
+    "gravite_par_niveau": float,
+    "gravite_max": float,
+    "freq_min_base": int,
+    "freq_min_pente": int,
+    "freq_min_plancher": int,
+    "freq_max_base": int,
+    "freq_max_pente": int,
+    "freq_max_plancher": int,
+    "chance_special": int,
+    "max_objets": int,
+}
+
+# Courbes intégrées (mêmes valeurs que le difficulte.json livré) : le jeu
+# démarre même sans fichier de difficulté, ou avec un fichier invalide
+CONFIG_PAR_DEFAUT = {
+    "niveau_max": 50,
+    "modes": {
+        "1": {
+            "points_par_niveau": 10,
+            "gravite_base": 0.4,
+            "gravite_par_niveau": 0.03,
+            "gravite_max": 1.0,
+            "freq_min_base": 50,
+            "freq_min_pente": 2,
+            "freq_min_plancher": 20,
+            "freq_max_base": 150,
+            "freq_max_pente": 3,
+            "freq_max_plancher": 40,
+            "chance_special": 30,
+            "max_objets": 30,
+            "niveaux": {},
+        },
+        "2": {
+            "points_par_niveau": 10,
+            "gravite_base": 0.4,
+            "gravite_par_niveau": 0.0,
+            "gravite_max": 0.4,
+            "freq_min_base": 30,
+            "freq_min_pente": 0,
+            "freq_min_plancher": 30,
+            "freq_max_base": 100,
+            "freq_max_pente": 0,
+            "freq_max_plancher": 100,
+            "chance_special": 30,
+            "max_objets": 20,
+            "niveaux": {},
+        },
+    },
+}
+
+# Colonnes des tables (valeurs qu'un niveau peut imposer) et leur type
+COLONNES = {
+    "gravite": float,
+    "freq_min": int,
+    "freq_max": int,
+    "chance_special": int,
+    "max_objets": int,
+}
+
+
+class TableDifficulte:
+    """
+    Difficulté d'un mode, niveau par niveau (ligne 0 = niveau 1).
+
+    Attributs:
+        courbe (dict): Courbe compilée (voir compiler_courbe), gardée pour
+            les replays : une partie se rejoue avec la difficulté d'origine
+        niveau_max (int): Dernier niveau de la table
+        points_par_niveau (int): Points à marquer pour monter d'un niveau
+        gravite (list): Gravité des objets lancés
+        freq_min, freq_max (list): Intervalle des délais entre deux lancers (frames)
+        chance_special (list): Pourcentage d'objets spéciaux
+        max_objets (list): Objets volants à l'écran au plus
+    """
+
+    def __init__(
+        self,
+        courbe,
+        niveau_max,
+        points_par_niveau,
+        gravite,
+        freq_min,
+        freq_max,
+        chance_special,
+        max_objets,
+    ):
+        self.courbe = courbe
+        self.niveau_max = niveau_max
+        self.points_par_niveau = points_par_niveau
+        self.gravite = gravite
+        self.freq_min = freq_min
+        self.freq_max = freq_max
+        self.chance_special = chance_special
+        self.max_objets = max_objets
+
+    def ligne(self, niveau):
+        """Ligne des tables pour un niveau (la dernière au-delà de la table)."""
+        return min(niveau, len(self.gravite)) - 1
+
+    def niveau_pour(self, score):
+        """Niveau atteint avec un score."""
+        return score // self.points_par_niveau + 1
+
+
+def compiler_courbe(courbe, niveau_max):
+    """
+    Calcule les tables d'une courbe jusqu'à un niveau.
+
+    Args:
+        courbe (dict): Paramètres de la courbe (voir PARAMETRES), plus
+            "niveaux" (facultatif) : niveau -> valeurs imposées (voir COLONNES)
+        niveau_max (int): Dernier niveau de la table
+
+    Retourne:
+        TableDifficulte: Les tables du mode
+    """
+    manquants = [cle for cle in PARAMETRES if cle not in courbe]
+    if manquants:
+        raise ValueError(f"Paramètres de difficulté manquants : {', '.join(manquants)}")
+    if courbe["points_par_niveau"] < 1:
+        raise ValueError("points_par_niveau doit être au moins 1")
+
+    colonnes = {nom: [] for nom in COLONNES}
+    for niveau in range(1, niveau_max + 1):
+        # Mêmes calculs que l'ancien code de la simulation (mêmes arrondis)
+        colonnes["gravite"].append(
+            min(
+                courbe["gravite_base"] + (niveau - 1) * courbe["gravite_par_niveau"],
+                courbe["gravite_max"],
+            )
+        )
+        colonnes["freq_min"].append(
+            int(
+                max(
+                    courbe["freq_min_plancher"],
+                    courbe["freq_min_base"] - (niveau - 1) * courbe["freq_min_pente"],
+                )
+            )
+        )
+        colonnes["freq_max"].append(
+            int(
+                max(
+                    courbe["freq_max_plancher"],
+                    courbe["freq_max_base"] - (niveau - 1) * courbe["freq_max_pente"],
+                )
+            )
+        )
+        colonnes["chance_special"].append(int(courbe["chance_special"]))
+        colonnes["max_objets"].append(int(courbe["max_objets"]))
+
+    for texte, valeurs in courbe.get("niveaux", {}).items():
+        niveau = int(texte)
+        if not 1 <= niveau <= niveau_max:
+            raise ValueError(f"Niveau {niveau} hors de la table (1 à {niveau_max})")
+        for nom, valeur in valeurs.items():
+            if nom not in COLONNES:
+                raise ValueError(f"Valeur inconnue au niveau {niveau} : {nom}")
+            colonnes[nom][niveau - 1] = COLONNES[nom](valeur)
+
+    for niveau, (mini, maxi) in enumerate(zip(colonnes["freq_min"], colonnes["freq_max"]), 1):
+        if mini > maxi:
+            raise ValueError(f"Niveau {niveau} : freq_min ({mini}) plus grand que freq_max ({maxi})")
+
+    return TableDifficulte(courbe, niveau_max, courbe["points_par_niveau"], **colonnes)
+
+
+def lire(chemin=FICHIER_DIFFICULTE):
+    """
+    Lit le fichier de difficulté.
+
+    Args:
+        chemin (str): Fichier JSON de difficulté
+
+    Retourne:
+        dict: Contenu du fichier ({"niveau_max": ..., "modes": {"1": ..., "2": ...}})
+    """
+    with open(chemin, "r", encoding="utf-8") as fichier:
+        return json.load(fichier)
+
+
+def compiler(config):
+    """
+    Compile les courbes de tous les modes.
+
+    Args:
+        config (dict): Contenu du fichier de difficulté (voir lire)
+
+    Retourne:
+        dict: Nombre de joueurs (1 ou 2) -> TableDifficulte
+    """
+    tables = {}
+    for mode in (1, 2):
+        courbe = config["modes"].get(str(mode))
+        if courbe is None:
+            raise ValueError(f"Pas de courbe de difficulté pour le mode {mode} joueur(s)")
+        try:
+            tables[mode] = compiler_courbe(courbe, config["niveau_max"])
+        except ValueError as e:
+            raise ValueError(f"Mode {mode} joueur(s) : {e}") from None
+    return tables
+
+
+def courbe_du_mode(nombre_de_joueurs):
+    """
+    Courbe d'un mode telle que lue au démarrage (pour la modifier).
+
+    Args:
+        nombre_de_joueurs (int): 1 ou 2
+
+    Retourne:
+        dict: Paramètres de la courbe (voir PARAMETRES) et "niveaux", copie
+    """
+    courbe = CONFIG["modes"][str(nombre_de_joueurs)]
+    copie = {cle: PARAMETRES[cle](courbe[cle]) for cle in PARAMETRES}
+    copie["niveaux"] = {niveau: dict(valeurs) for niveau, valeurs in courbe.get("niveaux", {}).items()}
+    return copie
+
+
+def recharger(chemin=FICHIER_DIFFICULTE):
+    """
+    Relit et compile le fichier de difficulté (rechargement à chaud). Les
+    parties commencées ensuite utilisent les nouvelles tables. Si le fichier
+    est invalide, une erreur est levée et les tables actuelles sont gardées.
+
+    Args:
+        chemin (str): Fichier JSON de difficulté
+    """
+    global CONFIG, NIVEAU_MAX, TABLES
+
+    config = lire(chemin)
+    try:
+        tables = compiler(config)
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Fichier de difficulté mal formé : {e!r}") from None
+    CONFIG, NIVEAU_MAX, TABLES = config, config["niveau_max"], tables
+
+
+# Tables compilées au démarrage : nombre de joueurs -> TableDifficulte.
+# Courbes intégrées d'abord, remplacées par celles du fichier s'il est valide
+CONFIG = CONFIG_PAR_DEFAUT
+NIVEAU_MAX = CONFIG["niveau_max"]
+TABLES = compiler(CONFIG)
+try:
+    recharger()
+except (OSError, ValueError) as e:
+    print(f"⚠️ Fichier de difficulté {FICHIER_DIFFICULTE} ignoré, courbes intégrées utilisées : {e}")
@@ -0,0 +1,255 @@
+# ============================================================================
+# FICHIER : evenements.py
+# DESCRIPTION : Événements de la partie et bus d'événements
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Les événements produits par la simulation, un type par événement
+#   (FruitTranche, BombeTouchee, GlaconTouche, FruitRate, NiveauMonte,
+#   FinPartie) : de simples tuples nommés, immuables
+# - L'état de la partie au moment d'un événement (EtatPartie), copié pour
+#   qu'un consommateur puisse le lire depuis un autre thread
+# - Le bus : les consommateurs s'abonnent à des types d'événements, le jeu
+#   publie les événements au fil de la frame et le bus les distribue une
+#   fois par frame, par lot
+# - Les files de travail (FileTravail) : un thread par consommateur lent
+#   (sauvegarde des scores et des replays, télémétrie)
+#
+# POURQUOI ?
+# Les événements étaient des tuples ("tranche", fruits, x, y, combo)
+# interprétés par un seul gros bloc de main.py qui jouait les sons,
+# sauvegardait le score et le replay, écrivait la télémétrie et passait à
+# l'écran Game Over. Avec le bus, chaque consommateur est une petite
+# fonction abonnée aux événements qui l'intéressent, et les écritures sur
+# le disque ne bloquent plus la frame.
+#
+# EXEMPLE :
+#     bus = BusEvenements()
+#     bus.abonner(FruitTranche, jouer_son)                    # thread du jeu
+#     bus.abonner(FinPartie, sauvegarder, file=persistance)   # autre thread
+#     bus.publier(simulation.etape(), etat_partie(simulation))
+#     bus.distribuer()                                        # une fois par frame
+#
+# ============================================================================
+
+import queue
+import threading
+from collections import namedtuple
+
+
+# ============================================================================
+# ÉVÉNEMENTS
+# ============================================================================
+# "nature" : nom court de l'événement (journal, télémétrie)
+class FruitTranche(namedtuple("FruitTranche", "fruits x y combo")):
+    """Fruit(s) tranché(s) en x, y ; combo = fruits du geste (souris) ou de la zone (clavier)."""
+
+    __slots__ = ()
+    nature = "tranche"
+
+
+class BombeTouchee(namedtuple("BombeTouchee", "x y")):
+    """Bombe tranchée (explosion en x, y)."""
+
+    __slots__ = ()
+    nature = "bombe"
+
+
+class GlaconTouche(namedtuple("GlaconTouche", "x y")):
+    """Glaçon tranché (éclats en x, y)."""
+
+    __slots__ = ()
+    nature = "glace"
+
+
+class FruitRate(namedtuple("FruitRate", "joueur vies")):
+    """Fruit raté par le joueur 1 ou 2 (vies restantes)."""
+
+    __slots__ = ()
+    nature = "rate"
+
+
+class NiveauMonte(namedtuple("NiveauMonte", "niveau")):
+    """Montée de niveau (mode 1 joueur)."""
+
+    __slots__ = ()
+    nature = "niveau"
+
+
+class FinPartie(namedtuple("FinPartie", "raison")):
+    """Partie terminée ("bombe" ou "vies")."""
+
+    __slots__ = ()
+    nature = "fin_partie"
+
+
+TYPES = (FruitTranche, BombeTouchee, GlaconTouche, FruitRate, NiveauMonte, FinPartie)
+
+
+# ============================================================================
+# ÉTAT DE LA PARTIE
+# ============================================================================
+# Mêmes noms d'attributs que Simulation : un consommateur peut recevoir
+# l'un ou l'autre (la télémétrie du bot lit directement la simulation).
+EtatPartie = namedtuple(
+    "EtatPartie",
+    "frame nombre_de_joueurs graine largeur hauteur score niveau vies_j1 vies_j2 "
+    "gagnant duree replay",
+)
+
+
+def etat_partie(simulation):
+    """
+    Copie l'état de la partie (lisible depuis un autre thread).
+
+    Args:
+        simulation (Simulation): La partie
+
+    Retourne:
+        EtatPartie: L'état ; replay = entrées enregistrées (bytes) si la
+        partie est terminée et enregistrée, sinon None
+    """
+    enregistreur = simulation.enregistreur
+    replay = None
+    if simulation.termine and enregistreur is not None and enregistreur.termine:
+        replay = bytes(enregistreur.corps)
+    return EtatPartie(
+        simulation.frame,
+        simulation.nombre_de_joueurs,
+        simulation.graine,
+        simulation.largeur,
+        simulation.hauteur,
+        simulation.score,
+        simulation.niveau,
+        simulation.vies_j1,
+        simulation.vies_j2,
+        simulation.gagnant,
+        simulation.duree_partie(),
+        replay,
+    )
+
+
+# ============================================================================
+# FILE DE TRAVAIL (THREAD D'UN CONSOMMATEUR LENT)
+# ============================================================================
+class FileTravail:
+    """
+    Un thread qui exécute, dans l'ordre, les appels qu'on lui soumet.
+
+    Attributs:
+        nom (str): Nom du thread
+    """
+
+    def __init__(self, nom):
+        self.nom = nom
+        self._file = queue.Queue()
+        self._thread = threading.Thread(target=self._executer, name=nom, daemon=True)
+        self._thread.start()
+
+    def soumettre(self, fonction, *arguments):
+        """Ajoute un appel fonction(*arguments) à la file (retourne tout de suite)."""
+        self._file.put((fonction, arguments))
+
+    def attendre(self):
+        """Attend que tous les appels soumis soient terminés."""
+        self._file.join()
+
+    def fermer(self):
+        """Termine les appels en attente puis arrête le thread."""
+        if self._thread is not None:
+            self._file.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _executer(self):
+        """Boucle du thread : un appel après l'autre."""
+        while True:
+            appel = self._file.get()
+            if appel is None:
+                self._file.task_done()
+                return
+            fonction, arguments = appel
+            try:
+                fonction(*arguments)
+            except Exception as e:
+                # Une sauvegarde ratée ne doit pas arrêter le thread
+                print(f"⚠️ Erreur dans le thread {self.nom} : {e!r}")
+            self._file.task_done()
+
+
+def _appeler(appels):
+    """Exécute un lot d'appels (fonction, evenement, etat), dans une file de travail ou le thread du jeu."""
+    for fonction, evenement, etat in appels:
+        try:
+            fonction(evenement, etat)
+        except Exception as e:
+            # Une erreur ne perd que son événement, pas le reste du lot
+            nom = getattr(fonction, "__qualname__", repr(fonction))
+            print(f"⚠️ Erreur de {nom} sur {type(evenement).__name__} : {e!r}")
+
+
+# ============================================================================
+# BUS D'ÉVÉNEMENTS
+# ============================================================================
+class BusEvenements:
+    """
+    Distribue les événements de la partie à leurs abonnés, par lot.
+
+    Attributs:
+        abonnes (dict): Type d'événement -> liste de (fonction, file de travail ou None)
+        lot (list): Événements publiés depuis la dernière distribution,
+            sous la forme (evenement, etat)
+    """
+
+    def __init__(self):
+        self.abonnes = {}
+        self.lot = []
+
+    def abonner(self, types, fonction, file=None):
+        """
+        Abonne une fonction à un ou plusieurs types d'événements.
+
+        Args:
+            types (type ou tuple): FruitTranche, (BombeTouchee, GlaconTouche)...
+            fonction (callable): Appelée avec (evenement, etat)
+            file (FileTravail): Thread où appeler la fonction (None = thread du jeu)
+        """
+        if not isinstance(types, tuple):
+            types = (types,)
+        for type_evenement in types:
+            self.abonnes.setdefault(type_evenement, []).append((fonction, file))
+
+    def publier(self, evenements, etat):
+        """
+        Ajoute des événements au lot de la frame (sans rien appeler).
+
+        Args:
+            evenements (list): Événements de la simulation
+            etat (EtatPartie): État de la partie au moment des événements
+        """
+        for evenement in evenements:
+            self.lot.append((evenement, etat))
+
+    def distribuer(self):
+        """
+        Appelle les abonnés des événements du lot (une fois par frame).
+        Chaque file de travail reçoit son lot en un seul envoi, puis les
+        abonnés du thread du jeu sont appelés, événement par événement. Une
+        erreur d'un abonné ne perd que son appel : ni les autres événements
+        de la frame, ni les envois aux files de travail.
+        """
+        if not self.lot:
+            return
+        lot, self.lot = self.lot, []
+
+        par_file = {}
+        sur_place = []  # Appels du thread du jeu
+        for evenement, etat in lot:
+            for fonction, file in self.abonnes.get(type(evenement), ()):
+                if file is None:
+                    sur_place.append((fonction, evenement, etat))
+                else:
+                    par_file.setdefault(file, []).append((fonction, evenement, etat))
+        for file, appels in par_file.items():
+            file.soumettre(_appeler, appels)
+        _appeler(sur_place)
@@ -0,0 +1,175 @@
+# ============================================================================
+# FICHIER : journal.py
+# DESCRIPTION : Journal des événements du jeu (niveaux, catégories, thread)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Des messages avec un niveau (DEBUG, INFO, AVERTISSEMENT, ERREUR), une
+#   catégorie ("tranchage", "apparition", "freeze"...) et des champs
+#   (combo=3, vies=2...)
+# - L'écriture dans un thread à part : le jeu ne fait que déposer le message
+#   dans une file, le thread les écrit par paquets (console ou fichier)
+#
+# POURQUOI ?
+# Avant, le jeu faisait des print() dans la boucle, parfois plusieurs par
+# frame pendant un combo. Sur une borne dont la console est lente (port
+# série, journald), chaque print peut bloquer la frame.
+#
+# COÛT QUAND LE JOURNAL EST COUPÉ (par défaut) :
+# Les appels sont protégés par un drapeau du module :
+#     if journal.actif_debug:
+#         journal.ecrire(journal.DEBUG, "tranchage", "Fruit tranché", combo=3)
+# Journal coupé = une seule lecture de booléen : le message n'est même pas
+# construit.
+#
+# ============================================================================
+
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+
+# ============================================================================
+# NIVEAUX
+# ============================================================================
+DEBUG = 10
+INFO = 20
+AVERTISSEMENT = 30
+ERREUR = 40
+
+NOMS_NIVEAUX = {DEBUG: "DEBUG", INFO: "INFO", AVERTISSEMENT: "AVERT", ERREUR: "ERREUR"}
+NIVEAUX_PAR_NOM = {"DEBUG": DEBUG, "INFO": INFO, "AVERTISSEMENT": AVERTISSEMENT, "ERREUR": ERREUR}
+
+# Drapeaux lus par les appels (mis à jour par configurer)
+actif_debug = False
+actif_info = False
+actif_avertissement = False
+actif_erreur = False
+
+# Configuration actuelle
+_categories = None  # None = toutes les catégories
+_format = "texte"
+_sortie = None
+_file = None
+_thread = None
+_debut = time.perf_counter()
+
+# Nombre maximum de messages écrits d'un coup par le thread
+TAILLE_PAQUET = 256
+
+
+def configurer(niveau=None, categories=None, fichier=None, format="texte"):
+    """
+    Active (ou coupe) le journal.
+
+    Args:
+        niveau (str ou int): "DEBUG", "INFO", "AVERTISSEMENT", "ERREUR",
+            ou None pour couper le journal
+        categories (list): Catégories à garder (None = toutes)
+        fichier (str): Fichier où écrire (None = la console)
+        format (str): "texte" (lisible) ou "json" (une ligne JSON par message)
+    """
+    global actif_debug, actif_info, actif_avertissement, actif_erreur
+    global _categories, _format, _sortie, _file, _thread
+
+    arreter()
+
+    if isinstance(niveau, str):
+        niveau = NIVEAUX_PAR_NOM[niveau.upper()]
+
+    actif_debug = niveau is not None and niveau <= DEBUG
+    actif_info = niveau is not None and niveau <= INFO
+    actif_avertissement = niveau is not None and niveau <= AVERTISSEMENT
+    actif_erreur = niveau is not None and niveau <= ERREUR
+    if niveau is None:
+        return
+
+    _categories = None if categories is None else set(categories)
+    _format = format
+    _sortie = open(fichier, "a", encoding="utf-8") if fichier else sys.stdout
+    _file = queue.SimpleQueue()
+    _thread = threading.Thread(target=_ecrivain, args=(_file, _sortie), daemon=True)
+    _thread.start()
+
+
+def ecrire(niveau, categorie, message, /, **champs):
+    """
+    Dépose un message dans la file (l'écriture se fait dans le thread).
+
+    Les appels du jeu vérifient d'abord le drapeau du niveau (actif_debug...) :
+    cette fonction n'est appelée que si le journal est actif. Les trois
+    premiers arguments sont positionnels : un champ peut s'appeler "niveau".
+
+    Args:
+        niveau (int): DEBUG, INFO, AVERTISSEMENT ou ERREUR
+        categorie (str): Partie du jeu ("tranchage", "freeze"...)
+        message (str): Texte du message
+        **champs: Valeurs associées (combo=3, vies=2...)
+    """
+    if _file is None:
+        return
+    if _categories is not None and categorie not in _categories:
+        return
+    _file.put((time.perf_counter() - _debut, niveau, categorie, message, champs))
+
+
+def _formater(temps, niveau, categorie, message, champs):
+    """Transforme un message en une ligne de texte."""
+    if _format == "json":
+        return json.dumps(
+            {
+                "t": round(temps, 4),
+                "niveau": NOMS_NIVEAUX[niveau],
+                "categorie": categorie,
+                "message": message,
+                **champs,
+            },
+            ensure_ascii=False,
+        )
+    details = " ".join(f"{cle}={valeur}" for cle, valeur in champs.items())
+    return f"{temps:9.3f} {NOMS_NIVEAUX[niveau]:<6} {categorie:<11} {message} {details}".rstrip()
+
+
+def _ecrivain(file, sortie):
+    """Thread d'écriture : vide la file par paquets."""
+    while True:
+        message = file.get()
+        paquet = []
+        termine = False
+        while message is not None:
+            paquet.append(_formater(*message))
+            if len(paquet) >= TAILLE_PAQUET:
+                break
+            try:
+                message = file.get_nowait()
+            except queue.Empty:
+                break
+        else:
+            termine = True
+
+        if paquet and sortie is not None:
+            try:
+                sortie.write("\n".join(paquet) + "\n")
+                sortie.flush()
+            except (OSError, ValueError):
+                # Sortie fermée ou pleine : on jette les messages, pas le jeu
+                sortie = None
+        if termine:
+            return
+
+
+def arreter():
+    """Écrit les messages en attente et arrête le thread d'écriture."""
+    global _file, _thread, _sortie
+    if _thread is None:
+        return
+    _file.put(None)
+    _thread.join(timeout=2)
+    if _sortie is not sys.stdout:
+        _sortie.close()
+    _file = _thread = _sortie = None
+
+
+atexit.register(arreter)
@@ -1,8 +1,57 @@
-import pygame, random
-from constantes import liste_fruits, liste_objets_speciaux, load_assets
-import controller
-from objets import Fruit, Glacon, Bombe, ParticuleExplosion, ParticuleGlace
+import pygame, time
+from constantes import (
+    load_assets,
+    recharger_image,
+    FICHIERS_IMAGES,
+    FICHIER_DIFFICULTE,
+    RECHARGEMENT_A_CHAUD,
+    RECHARGEMENT_INTERVALLE,
+    RESOLUTION_LOGIQUE,
+    QUALITE_ADAPTATIVE,
+    RENDU_THREADS_2J,
+    GRAINE_PARTIE,
+    ENREGISTRER_REPLAYS,
+    DOSSIER_REPLAYS,
+    REPLAYS_MAX,
+    BOT_AUTOMATIQUE,
+    BOT_JOUEURS,
+    BOT_REGLAGES,
+    BOT_DELAI_REJOUER,
+    PROFILEUR_VISIBLE,
+    PROFILEUR_TRACE,
+    JOURNAL_NIVEAU,
+    JOURNAL_CATEGORIES,
+    JOURNAL_FICHIER,
+    JOURNAL_FORMAT,
+    TELEMETRIE_DOSSIER,
+    MEMOIRE_DIAGNOSTIC,
+    MEMOIRE_INTERVALLE_FRAMES,
+)
+import difficulte
+import journal
+from objets import oublier_sprites, vider_cache_rotations, vider_cache_sprites
 from interface import Bouton, dessiner_regles, dessiner_scores
+from rendu import CibleRendu, FileRendu, RenduZones, oublier_images_reduites
+import qualite
+from qualite import ControleurQualite
+from profileur import Profileur
+from scenes import Scene, GestionnaireScenes
+from simulation import Simulation, appliquer_entree
+from bot import Bot, MesureEndurance
+from replay import EnregistreurReplay, ecrire_replay
+from telemetrie import EnregistreurTelemetrie
+from memoire import SurveillanceMemoire
+from evenements import (
+    TYPES,
+    BombeTouchee,
+    BusEvenements,
+    FileTravail,
+    FinPartie,
+    FruitTranche,
+    GlaconTouche,
+    etat_partie,
+)
+from rechargement import RechargementFichiers
 from scores import (
     creer_fichier_scores_si_absent,
     sauvegarder_score,
@@ -12,6 +61,18 @@ from scores import (
     est_nouveau_record
 )
 
+# Fonds d'écran : attribut -> (fichier, couleur du fond de secours)
+FONDS = {
+    # Fond pour le menu et le game over (gris foncé en secours)
+    "fond_menu": ("Assets/Images/Backgrounds/Background0.png", (30, 30, 40)),
+    # Fond pour le joueur 1 en mode 2 joueurs, côté gauche (rouge sombre)
+    "fond_2j_gauche": ("Assets/Images/Backgrounds/Background1.png", (100, 50, 50)),
+    # Fond pour le mode 1 joueur, plein écran (bleu sombre)
+    "fond_1j": ("Assets/Images/Backgrounds/Background2.png", (50, 50, 100)),
+    # Fond pour le joueur 2 en mode 2 joueurs, côté droit (vert sombre)
+    "fond_2j_droite": ("Assets/Images/Backgrounds/Background3.png", (50, 100, 50)),
+}
+
 # ============================================================================
 # CLASSE : GestionnaireEcran
 # ============================================================================
@@ -38,9 +99,16 @@ class GestionnaireEcran:
         cache_1j (Surface): Fond 1 joueur redimensionné (mis en cache)
         cache_2j_gauche (Surface): Fond J1 redimensionné (mis en cache)
         cache_2j_droite (Surface): Fond J2 redimensionné (mis en cache)
+        fonds_secours (bool): True si les fonds sont les fonds colorés de secours
         derniere_taille (tuple): Dernière taille d'écran connue (largeur, hauteur)
+        caches (dict): Taille -> fonds redimensionnés (menu, 1j, J1, J2)
     """
 
+    # Tailles gardées en cache : la fenêtre (menus) et la résolution logique
+    # (jeu, voir RESOLUTION_LOGIQUE), pour passer de l'une à l'autre sans
+    # tout redimensionner
+    TAILLES_EN_CACHE = 2
+
     def __init__(self):
         """
         Initialise le gestionnaire en chargeant les images de fond.
@@ -51,45 +119,7 @@ class GestionnaireEcran:
         # ====================================================================
         # CHARGEMENT DES IMAGES DE FOND
         # ====================================================================
-        try:
-            # Fond pour le menu et le game over
-            self.fond_menu = pygame.image.load(
-                "Assets/Images/Backgrounds/Background0.png"
-            ).convert()
-
-            # Fond pour le joueur 1 en mode 2 joueurs (côté gauche)
-            self.fond_2j_gauche = pygame.image.load(
-                "Assets/Images/Backgrounds/Background1.png"
-            ).convert()
-
-            # Fond pour le mode 1 joueur (plein écran)
-            self.fond_1j = pygame.image.load(
-                "Assets/Images/Backgrounds/Background2.png"
-            ).convert()
-
-            # Fond pour le joueur 2 en mode 2 joueurs (côté droit)
-            self.fond_2j_droite = pygame.image.load(
-                "Assets/Images/Backgrounds/Background3.png"
-            ).convert()
-
-            print("✅ Fonds d'écran chargés avec succès")
-
-        except pygame.error as e:
-            # Si les images n'existent pas, on crée des fonds colorés de secours
-            print(f"⚠️ Erreur chargement fonds : {e}")
-            print("📝 Création de fonds de secours...")
-
-            self.fond_menu = pygame.Surface((100, 100))
-            self.fond_menu.fill((30, 30, 40))  # Gris foncé pour le menu
-
-            self.fond_2j_gauche = pygame.Surface((100, 100))
-            self.fond_2j_gauche.fill((100, 50, 50))  # Rouge sombre
-
-            self.fond_1j = pygame.Surface((100, 100))
-            self.fond_1j.fill((50, 50, 100))  # Bleu sombre
-
-            self.fond_2j_droite = pygame.Surface((100, 100))
-            self.fond_2j_droite.fill((50, 100, 50))  # Vert sombre
+        self.charger_fonds()
 
         # ====================================================================
         # INITIALISATION DU CACHE
@@ -105,9 +135,52 @@ class GestionnaireEcran:
         # (0, 0) = jamais calculé, forcera le premier calcul
         self.derniere_taille = (0, 0)
 
+        # Fonds déjà redimensionnés, par taille d'écran
+        self.caches = {}
+
+    def charger_fonds(self):
+        """Charge les quatre fonds (ou des fonds colorés de secours)."""
+        try:
+            for nom, (chemin, _) in FONDS.items():
+                setattr(self, nom, pygame.image.load(chemin).convert())
+            self.fonds_secours = False
+            print("✅ Fonds d'écran chargés avec succès")
+
+        except (pygame.error, FileNotFoundError) as e:
+            # Si les images n'existent pas, on crée des fonds colorés de secours
+            print(f"⚠️ Erreur chargement fonds : {e}")
+            print("📝 Création de fonds de secours...")
+
+            for nom, (_, couleur) in FONDS.items():
+                fond = pygame.Surface((100, 100))
+                fond.fill(couleur)
+                setattr(self, nom, fond)
+            self.fonds_secours = True
+
+    def recharger_fond(self, chemin):
+        """
+        Recharge un fond dont le fichier a changé (rechargement à chaud).
+        Les fonds redimensionnés sont recalculés au prochain affichage.
+
+        Arguments:
+            chemin (str): Fichier du fond (voir FONDS)
+        """
+        if self.fonds_secours:
+            # Fonds de secours : le fichier manquant est peut-être arrivé
+            self.charger_fonds()
+        else:
+            for nom, (fichier, _) in FONDS.items():
+                if fichier == chemin:
+                    setattr(self, nom, pygame.image.load(chemin).convert())
+        # Les fonds redimensionnés sont ceux de l'ancienne image
+        self.caches.clear()
+        # (0, 0) : forcera le prochain calcul du cache
+        self.derniere_taille = (0, 0)
+
     def mettre_a_jour_cache(self, largeur, hauteur):
         """
-        Recalcule les fonds redimensionnés si la taille de l'écran a changé.
+        Recalcule les fonds redimensionnés si la taille de l'écran a changé
+        (sauf si cette taille est déjà en cache).
 
         EXPLICATION POUR LES DÉBUTANTS :
         Cette méthode vérifie si l'écran a changé de taille.
@@ -119,7 +192,7 @@ class GestionnaireEcran:
             hauteur (int): Hauteur actuelle de l'écran en pixels
 
         Retourne:
-            bool: True si le cache a été mis à jour, False sinon
+            bool: True si les fonds ont été redimensionnés, False sinon
         """
         taille_actuelle = (largeur, hauteur)
 
@@ -127,6 +200,20 @@ class GestionnaireEcran:
         if taille_actuelle == self.derniere_taille:
             return False  # Pas de mise à jour nécessaire
 
+        # Taille déjà vue (passage menu <-> jeu) : on reprend ses fonds, et
+        # elle redevient la plus récente du cache
+        if taille_actuelle in self.caches:
+            fonds = self.caches.pop(taille_actuelle)
+            self.caches[taille_actuelle] = fonds
+            (
+                self.cache_menu,
+                self.cache_1j,
+                self.cache_2j_gauche,
+                self.cache_2j_droite,
+            ) = fonds
+            self.derniere_taille = taille_actuelle
+            return False
+
         # La taille a changé ! On recalcule tout
         print(f"🖼️ Redimensionnement des fonds pour {largeur}x{hauteur}")
 
@@ -153,6 +240,17 @@ class GestionnaireEcran:
         # Mémorise la taille actuelle pour la prochaine comparaison
         self.derniere_taille = taille_actuelle
 
+        # Et ses fonds, en oubliant la plus ancienne taille s'il y en a trop
+        # (redimensionnements successifs de la fenêtre)
+        if len(self.caches) >= self.TAILLES_EN_CACHE:
+            del self.caches[next(iter(self.caches))]
+        self.caches[taille_actuelle] = (
+            self.cache_menu,
+            self.cache_1j,
+            self.cache_2j_gauche,
+            self.cache_2j_droite,
+        )
+
         return True  # Le cache a été mis à jour
 
     def afficher_fond_menu(self, screen):
@@ -212,25 +310,67 @@ class GestionnaireEcran:
             # Fond droit (Joueur 2)
             screen.blit(self.cache_2j_droite, (milieu_x, 0))
 
-            # Ligne de séparation blanche
-            pygame.draw.line(
-                screen,
-                (101, 67, 33),  # Couleur marron foncé
-                (milieu_x, 0),  # Point de départ (haut)
-                (milieu_x, hauteur),  # Point d'arrivée (bas)
-                4,  # Épaisseur en pixels
-            )
+            # Ligne de séparation
+            self.dessiner_separation(screen)
 
         # Retourne le milieu pour que le reste du code puisse l'utiliser
         return milieu_x
 
+    def fonds_2j(self, screen):
+        """
+        Retourne les fonds du mode 2 joueurs, sans les afficher.
+
+        Utilisé par le rendu parallèle : chaque thread affiche le fond de sa zone.
+
+        Arguments:
+            screen (Surface): L'écran Pygame (pour connaître sa taille)
+
+        Retourne:
+            tuple: (fond J1 gauche, fond J2 droite) à la bonne taille
+        """
+        self.mettre_a_jour_cache(screen.get_width(), screen.get_height())
+        return (self.cache_2j_gauche, self.cache_2j_droite)
+
+    def dessiner_separation(self, screen):
+        """
+        Dessine la ligne de séparation entre les deux joueurs.
+
+        Arguments:
+            screen (Surface): L'écran Pygame sur lequel dessiner
+        """
+        milieu_x = screen.get_width() // 2
+        pygame.draw.line(
+            screen,
+            (101, 67, 33),  # Couleur marron foncé
+            (milieu_x, 0),  # Point de départ (haut)
+            (milieu_x, screen.get_height()),  # Point d'arrivée (bas)
+            4,  # Épaisseur en pixels
+        )
+
 
 # INITIALISATION
+journal.configurer(JOURNAL_NIVEAU, JOURNAL_CATEGORIES, JOURNAL_FICHIER, JOURNAL_FORMAT)
 pygame.init()
 L_ecran = 1280
 H_ecran = 720
-screen = pygame.display.set_mode((L_ecran, H_ecran), pygame.RESIZABLE)
+fenetre = pygame.display.set_mode((L_ecran, H_ecran), pygame.RESIZABLE)
 pygame.display.set_caption("Fruit Slicer")
+# Surface sur laquelle on dessine : la fenêtre, ou la cible de rendu pendant le jeu
+screen = fenetre
+# Cible de rendu interne pour le jeu (inactive si RESOLUTION_LOGIQUE vaut None)
+cible_rendu = CibleRendu(RESOLUTION_LOGIQUE)
+# Contrôleur de qualité (ajuste les effets selon le temps de frame)
+controleur_qualite = ControleurQualite()
+# Temps de chaque phase de la frame (panneau F3, trace Chrome)
+profileur = Profileur(PROFILEUR_VISIBLE, PROFILEUR_TRACE)
+
+# Files d'affichage : une par couche, chacune dessinée en un seul appel blits()
+file_fruits = FileRendu()
+file_morceaux = FileRendu()
+file_particules = FileRendu()
+
+# Rendu parallèle des deux moitiés d'écran (mode 2 joueurs, optionnel)
+rendu_zones = RenduZones(nombre_couches=3)
 clock = pygame.time.Clock()
 load_assets()
 creer_fichier_scores_si_absent()
@@ -303,25 +443,41 @@ COULEURS = {
 gestionnaire_ecran = GestionnaireEcran()
 
 # --- ETAT DU JEU ---
-etat_jeu = "menu"
+# L'écran affiché (menu, jeu...) est la scène active : voir plus bas
 nombre_de_joueurs = 1
-start_ticks = 0
 
-# NOUVEAU : Vies séparées
-vies_j1 = 3
-vies_j2 = 3
+# La partie en cours (objets, vies, score, freeze...) : voir simulation.py
+simulation = Simulation(nombre_de_joueurs, L_ecran, H_ecran)
+if ENREGISTRER_REPLAYS:
+    simulation.enregistreur = EnregistreurReplay()
+simulation.profileur = profileur
+
+# Télémétrie des parties (temps de frame, objets, coupes...) : voir telemetrie.py
+telemetrie = EnregistreurTelemetrie(TELEMETRIE_DOSSIER) if TELEMETRIE_DOSSIER else None
+
+# Bus des événements de la partie (sons, sauvegardes, télémétrie, écran Game
+# Over) : voir evenements.py. Les écritures sur le disque (scores, replays,
+# télémétrie) se font chacune dans son thread, pas dans la frame.
+bus = BusEvenements()
+persistance = FileTravail("persistance")
+file_telemetrie = FileTravail("telemetrie") if telemetrie is not None else None
+
+# Diagnostic mémoire (fuites) : voir memoire.py
+surveillance_memoire = None
+if MEMOIRE_DIAGNOSTIC:
+    surveillance_memoire = SurveillanceMemoire(MEMOIRE_INTERVALLE_FRAMES)
+    surveillance_memoire.demarrer()
+
+# Joueur automatique (tests d'endurance) : voir bot.py
+bot = Bot(**BOT_REGLAGES) if BOT_AUTOMATIQUE else None
+mesure_endurance = MesureEndurance() if BOT_AUTOMATIQUE else None
+frames_game_over = 0
 
 # Variables pour la saisie du nom du joueur (si nouveau record)
 nom_joueur = ""
 saisie_nom_active = False
 score_sauvegarde = False
 
-# Variables pour l'animation d'explosion
-explosion_en_cours = False
-explosion_timer = 0
-EXPLOSION_DUREE = 60  # Durée de l'animation en frames
-is_bomb_exploded = False
-
 # ============================================================================
 # CRÉATION DES BOUTONS (couleurs harmonisées thème nature/fruits)
 # ============================================================================
@@ -401,303 +557,201 @@ bouton_menu_go = Bouton(
     (166, 118, 74),  # Marron clair
 )
 
-# Variables de jeu
-mes_fruits = []
-morceaux_fruits = []
-particules_explosion = []
-particules_glace = []
-frequence_lancer = random.randint(30, 100)
-compteur = 0
 running = True
-niveau = 1
-score = 0
-gravite_actuelle = 0.4
-
-# Variables pour le freeze (mode 2 joueurs)
-freeze_j1_actif = False
-freeze_j1_timer = 0
-freeze_j1_en_attente = False
-freeze_j1_delai_timer = 0
-
-freeze_j2_actif = False
-freeze_j2_timer = 0
-freeze_j2_en_attente = False
-freeze_j2_delai_timer = 0
-
-# Variables pour le mode 1 joueur (gardées pour compatibilité)
-freeze_actif = False
-freeze_timer = 0
-freeze_duree = 0
-freeze_en_attente = False
-freeze_delai_timer = 0
-FREEZE_DELAI_FRAMES = 120  # 2 secondes
-
-# Gestion du son
-try:
+
+# Gestion du son : nom -> (fichier, volume)
+FICHIERS_SONS = {
     # Un seul fichier qui contient "3... 2... 1... GO!"
-    son_decompte = pygame.mixer.Sound("Assets/Sounds/decompte_complet.wav")
-    son_decompte.set_volume(0.6)
-except (pygame.error, FileNotFoundError):
-    print("Son manquant, création d'un son vide.")
-    son_decompte = pygame.mixer.Sound(buffer=bytearray())
-    
-try:
-    son_sliced = pygame.mixer.Sound("Assets/Sounds/sliced.wav")
-    son_sliced.set_volume(0.5)
-except (pygame.error, FileNotFoundError):
-    print("Son manquant, création d'un son vide.")
-    son_sliced = pygame.mixer.Sound(buffer=bytearray())
-    
-try:
-    son_bomb = pygame.mixer.Sound("Assets/Sounds/bomb.wav")
-    son_bomb.set_volume(0.7)
-except (pygame.error, FileNotFoundError):
-    print("Son manquant, création d'un son vide.")
-    son_bomb = pygame.mixer.Sound(buffer=bytearray())
-    
-try:
-    son_freeze = pygame.mixer.Sound("Assets/Sounds/freeze.wav")
-    son_freeze.set_volume(0.5)
-except (pygame.error, FileNotFoundError):
-    print("Son manquant, création d'un son vide.")
-    son_freeze = pygame.mixer.Sound(buffer=bytearray())
-    
-try:
-    son_win = pygame.mixer.Sound("Assets/Sounds/win.mp3")
-    son_win.set_volume(0.6)
-except (pygame.error, FileNotFoundError):
-    print("Son manquant, création d'un son vide.")
-    son_win = pygame.mixer.Sound(buffer=bytearray())
-    
-def mettre_a_jour_score_et_niveau(points_gagnes):
+    "decompte": ("Assets/Sounds/decompte_complet.wav", 0.6),
+    "sliced": ("Assets/Sounds/sliced.wav", 0.5),
+    "bomb": ("Assets/Sounds/bomb.wav", 0.7),
+    "freeze": ("Assets/Sounds/freeze.wav", 0.5),
+    "win": ("Assets/Sounds/win.mp3", 0.6),
+}
+
+
+def charger_son(nom):
     """
-    Met à jour le score et vérifie si le joueur monte de niveau.
-    
+    Charge un son (un son vide s'il manque).
+
     Args:
-        points_gagnes (int): Nombre de points à ajouter
-    
-    Returns:
-        bool: True si le joueur a monté de niveau, False sinon
+        nom (str): Nom du son (voir FICHIERS_SONS)
+
+    Retourne:
+        Sound: Le son, avec son volume
     """
-    global score, niveau, gravite_actuelle
-    
-    score += points_gagnes
-    
-    # Vérifier montée de niveau tous les 10 points
-    nouveau_niveau = (score // 10) + 1
-    if nouveau_niveau > niveau:
-        niveau = nouveau_niveau
-        gravite_actuelle = min(0.4 + (niveau - 1) * 0.03, 1.0)
-        print(f"🎉 NIVEAU {niveau} ! Gravité: {gravite_actuelle:.2f}")
-        return True
-    
-    return False
-    
-# --- BOUCLE PRINCIPALE ---
-while running:
+    chemin, volume = FICHIERS_SONS[nom]
+    try:
+        son = pygame.mixer.Sound(chemin)
+        son.set_volume(volume)
+    except (pygame.error, FileNotFoundError):
+        print("Son manquant, création d'un son vide.")
+        son = pygame.mixer.Sound(buffer=bytearray())
+    return son
 
-    # 0. RE-CENTRAGE DYNAMIQUE
-    largeur_actuelle = screen.get_width()
-    hauteur_actuelle = screen.get_height()
-    centre_x = largeur_actuelle // 2
 
-    bouton_1j.rect.centerx = centre_x
-    bouton_2j.rect.centerx = centre_x
-    bouton_regles.rect.centerx = centre_x
-    bouton_scores.rect.centerx = centre_x
-    bouton_quitter.rect.centerx = centre_x
-    bouton_menu_go.rect.centerx = centre_x
-    bouton_menu_go.rect.y = hauteur_actuelle - 100
+sons = {nom: charger_son(nom) for nom in FICHIERS_SONS}
 
-    # 1. GESTION DES ÉVÉNEMENTS
-    events = pygame.event.get()
-    for event in events:
-        if event.type == pygame.QUIT:
-            running = False
 
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_f or event.key == pygame.K_F11:
-                if screen.get_flags() & pygame.FULLSCREEN:
-                    screen = pygame.display.set_mode((1280, 720), pygame.RESIZABLE)
-                else:
-                    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-
-        if etat_jeu == "menu":
-            if bouton_1j.est_clique(event):
-                nombre_de_joueurs = 1
-                etat_jeu = "jeu"
-                mes_fruits = []
-                morceaux_fruits = []
-                # Réinitialisation
-                vies_j1 = 3
-                start_ticks = pygame.time.get_ticks()
-
-                # Reset des variables de niveau pour un nouveau jeu
-                niveau = 1
-                score = 0
-                gravite_actuelle = 0.4
-
-                # Reset du freeze
-                freeze_actif = False
-                freeze_timer = 0
-                freeze_en_attente = False
-                freeze_delai_timer = 0
-                is_bomb_exploded = False
-
-                son_decompte.stop()  # Coupe le son s'il jouait déjà
-                son_decompte.play()
-
-            if bouton_2j.est_clique(event):
-                nombre_de_joueurs = 2
-                etat_jeu = "jeu"
-                mes_fruits = []
-                morceaux_fruits = []
-                # Réinitialisation des DEUX joueurs
-                vies_j1 = 3
-                vies_j2 = 3
-                # Réinitialision du score
-                score = 0
-                start_ticks = pygame.time.get_ticks()
-
-                # Reset complet du freeze (mode 2 joueurs - séparé)
-                freeze_j1_actif = False
-                freeze_j1_timer = 0
-                freeze_j1_en_attente = False
-                freeze_j1_delai_timer = 0
-
-                freeze_j2_actif = False
-                freeze_j2_timer = 0
-                freeze_j2_en_attente = False
-                freeze_j2_delai_timer = 0
-
-                is_bomb_exploded = False
-                son_decompte.stop()  # Coupe le son s'il jouait déjà
-                son_decompte.play()
-
-            if bouton_regles.est_clique(event):
-                etat_jeu = "regles"
-            if bouton_scores.est_clique(event):
-                etat_jeu = "scores"
-            if bouton_quitter.est_clique(event):
-                running = False
-
-        elif etat_jeu in ["regles", "scores"]:
-            if bouton_retour.est_clique(event):
-                etat_jeu = "menu"
-
-            # Touche R pour réinitialiser l'historique (seulement dans l'écran scores)
-            if (
-                etat_jeu == "scores"
-                and event.type == pygame.KEYDOWN
-                and event.key == pygame.K_r
-            ):
-                reinitialiser_scores()
-                print("🗑️ Historique des scores réinitialisé.")
-
-        elif etat_jeu == "game_over":
-            if bouton_menu_go.est_clique(event):
-                etat_jeu = "menu"
-
-        elif etat_jeu == "jeu":
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                etat_jeu = "menu"
-                mes_fruits = []
-                morceaux_fruits = []
-                son_decompte.stop()
-
-            seconds_ecoules = (pygame.time.get_ticks() - start_ticks) / 1000
-
-            if seconds_ecoules > 3:
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    controller.start_slice(pygame.mouse.get_pos())
-                if event.type == pygame.MOUSEBUTTONUP:
-                    score_geste = controller.end_slice(
-                        mes_fruits, screen.get_width(), nombre_de_joueurs
-                    )
-                    print(f"DEBUG: Score geste souris = {score_geste}, total avant = {score}")
-
-                    # Ajoute le score au total (mode 1 joueur uniquement)
-                    if (
-                        nombre_de_joueurs == 1
-                        and isinstance(score_geste, int)
-                        and score_geste > 0
-                    ):
-                        mettre_a_jour_score_et_niveau(score_geste)
-
-                if event.type == pygame.KEYDOWN:
-                    result = controller.handle_keyboard_inputs(
-                        mes_fruits,
-                        screen.get_width(),
-                        screen.get_height(),
-                        event.key,
-                        nombre_de_joueurs,
-                        morceaux_fruits
-                    )
-                    if result == "game_over":
-                        son_bomb.play() 
-                        
-                        # Créer les particules d'explosion (position clavier = centre zone J1)
-                        mx = screen.get_width() // 4  # Centre de la zone J1
-                        my = screen.get_height() // 2
-                        for _ in range(50):
-                            particules_explosion.append(ParticuleExplosion(mx, my))
-                        
-                        explosion_en_cours = True
-                        explosion_timer = EXPLOSION_DUREE
-                        is_bomb_exploded = True
-                        if nombre_de_joueurs == 1:
-                            duree_partie = (
-                                (pygame.time.get_ticks() - start_ticks) / 1000
-                            ) - 3
-                            sauvegarder_score(score, niveau, duree_partie)
-                        print("BOOM ! Bombe tranchée au clavier !")
-                        
-                    elif result == "freeze":
-                        son_freeze.play()
-                        # Particule de glace
-                        mx, my = pygame.mouse.get_pos()
-                        for _ in range(30):
-                            particules_glace.append(ParticuleGlace(mx, my))
-                        # Mode 1 joueur
-                        if not freeze_actif and not freeze_en_attente:
-                            freeze_en_attente = True
-                            freeze_delai_timer = FREEZE_DELAI_FRAMES
-
-                    elif result == "freeze_j1":
-                        son_freeze.play()
-                        mx, my = pygame.mouse.get_pos()
-                        for _ in range(30):
-                            particules_glace.append(ParticuleGlace(mx, my))
-                        # Freeze pour joueur 1 seulement
-                        if not freeze_j1_actif and not freeze_j1_en_attente:
-                            freeze_j1_en_attente = True
-                            freeze_j1_delai_timer = FREEZE_DELAI_FRAMES
-
-                    elif result == "freeze_j2":
-                        son_freeze.play()
-                        mx, my = pygame.mouse.get_pos()
-                        for _ in range(30):
-                            particules_glace.append(ParticuleGlace(mx, my))
-                        # Freeze pour joueur 2 seulement
-                        if not freeze_j2_actif and not freeze_j2_en_attente:
-                            freeze_j2_en_attente = True
-                            freeze_j2_delai_timer = FREEZE_DELAI_FRAMES
-                    elif isinstance(result, int) and result > 0:
-                        son_sliced.play()
-                    # Score en temps réel (mode 1 joueur)
-                    if nombre_de_joueurs == 1:
-                        # +1 point de base par fruit
-                        points_gagnes = 1
-                        # Bonus si combo >= 3
-                        combo = controller.get_combo_actuel()
-                        if combo >= 3:
-                            points_gagnes += 1  # +1 bonus
-                        
-                        mettre_a_jour_score_et_niveau(points_gagnes)
+def recharger_son(chemin):
+    """Recharge un son dont le fichier a changé (rechargement à chaud)."""
+    for nom, (fichier, volume) in FICHIERS_SONS.items():
+        if fichier == chemin:
+            son = pygame.mixer.Sound(chemin)
+            son.set_volume(volume)
+            sons[nom] = son
 
-    # 2. LOGIQUE ET DESSIN
 
-    if etat_jeu == "menu":
+def recharger_image_objet(chemin):
+    """Recharge l'image d'un objet et retire ses anciennes images des caches."""
+    oublier_sprites(recharger_image(chemin))
+
+
+def position_souris():
+    """
+    Retourne la position de la souris dans les coordonnées du jeu.
+
+    Si la cible de rendu est active, la position de la fenêtre est convertie
+    en position logique (sinon elle est retournée telle quelle).
+    """
+    return cible_rendu.vers_logique(pygame.mouse.get_pos())
+
+
+def preparer_rendu_partie():
+    """
+    Applique l'échelle de rendu de la qualité actuelle au début d'une partie.
+
+    Seule la surface interne est réduite : le terrain de jeu garde sa taille
+    (RESOLUTION_LOGIQUE ou la fenêtre), les positions sont converties au
+    dessin. L'échelle ne change qu'entre deux parties pour ne pas recréer les
+    images réduites en cours de partie.
+    """
+    cible_rendu.definir_echelle(qualite.reglages["echelle_rendu"])
+    oublier_images_reduites()
+
+
+def demarrer_partie(joueurs):
+    """
+    Lance une partie (boutons du menu, ou joueur automatique).
+
+    La remise à zéro de la partie est faite par la scène de jeu en entrant.
+
+    Args:
+        joueurs (int): 1 ou 2 joueurs
+    """
+    global nombre_de_joueurs
+
+    nombre_de_joueurs = joueurs
+    scenes.changer("jeu")
+
+
+def publier(evenements):
+    """
+    Publie les événements de la simulation sur le bus. Ils sont distribués
+    une fois par frame, après la mise à jour (voir la boucle principale).
+
+    La simulation ne fait que la logique : ce sont les abonnés du bus qui
+    jouent les sons, sauvegardent le score et passent à l'écran Game Over.
+
+    Args:
+        evenements (list): Événements retournés par la simulation
+    """
+    if evenements:
+        bus.publier(evenements, etat_partie(simulation))
+
+
+# Son joué pour chaque type d'événement
+SONS_EVENEMENTS = {
+    FruitTranche: "sliced",
+    BombeTouchee: "bomb",
+    GlaconTouche: "freeze",
+    FinPartie: "win",  # Son de fin
+}
+
+
+def jouer_son(evenement, etat):
+    """Joue le son d'un événement (voir SONS_EVENEMENTS)."""
+    sons[SONS_EVENEMENTS[type(evenement)]].play()
+
+
+def sauvegarder_partie(evenement, etat):
+    """Sauvegarde le score et le replay de la partie terminée (thread de persistance)."""
+    if etat.nombre_de_joueurs == 1:
+        sauvegarder_score(etat.score, etat.niveau, etat.duree, graine=etat.graine)
+    else:
+        sauvegarder_score(
+            0,
+            1,
+            etat.duree,
+            mode="2j",
+            gagnant=etat.gagnant,
+            graine=etat.graine,
+        )
+    if etat.replay is not None:
+        chemin = ecrire_replay(
+            etat.replay, etat.nombre_de_joueurs, etat.graine, DOSSIER_REPLAYS, REPLAYS_MAX
+        )
+        print(f"🎬 Replay : {chemin}")
+
+
+def afficher_game_over(evenement, etat):
+    """Passe à l'écran Game Over à la fin de la partie."""
+    scenes.changer("game_over")
+
+
+# Abonnés du bus, dans l'ordre d'appel
+if telemetrie is not None:
+    bus.abonner(TYPES, telemetrie.evenement, file=file_telemetrie)
+bus.abonner(tuple(SONS_EVENEMENTS), jouer_son)
+bus.abonner(FinPartie, sauvegarder_partie, file=persistance)
+bus.abonner(FinPartie, afficher_game_over)
+
+
+# ============================================================================
+# SCÈNES : un objet par écran (voir scenes.py)
+# ============================================================================
+# Chaque frame n'exécute que le code de la scène affichée. Les écrans fixes
+# (règles, scores) sont dessinés une fois en entrant, puis simplement copiés.
+# ============================================================================
+
+
+class SceneMenu(Scene):
+    """Menu principal (choix du mode, règles, scores, quitter)."""
+
+    nom = "menu"
+
+    def entrer(self):
+        # Retour au menu : les images du jeu (tailles, rotations) sont libérées
+        vider_cache_sprites()
+
+    def redimensionner(self, largeur, hauteur):
+        centre_x = largeur // 2
+        bouton_1j.rect.centerx = centre_x
+        bouton_2j.rect.centerx = centre_x
+        bouton_regles.rect.centerx = centre_x
+        bouton_scores.rect.centerx = centre_x
+        bouton_quitter.rect.centerx = centre_x
+
+    def evenement(self, event):
+        global running
+
+        if bouton_1j.est_clique(event):
+            demarrer_partie(1)
+        elif bouton_2j.est_clique(event):
+            demarrer_partie(2)
+        elif bouton_regles.est_clique(event):
+            scenes.changer("regles")
+        elif bouton_scores.est_clique(event):
+            scenes.changer("scores")
+        elif bouton_quitter.est_clique(event):
+            running = False
+
+    def mettre_a_jour(self):
+        # Joueur automatique : lance les parties tout seul
+        if bot is not None:
+            demarrer_partie(BOT_JOUEURS)
+
+    def dessiner(self, screen):
         # Affiche le fond du menu (Background0)
         gestionnaire_ecran.afficher_fond_menu(screen)
 
@@ -712,17 +766,96 @@ while running:
         bouton_scores.dessiner(screen)
         bouton_quitter.dessiner(screen)
 
-    elif etat_jeu == "regles":
-        dessiner_regles(screen)
-        bouton_retour.dessiner(screen)
 
-    elif etat_jeu == "scores":
-        dessiner_scores(screen)
+class SceneEcranFixe(Scene):
+    """
+    Écran qui ne change pas (règles, scores) avec un bouton Retour.
+
+    L'écran est dessiné une fois en entrant (et si la fenêtre change de
+    taille), puis copié à chaque frame : il est libéré en sortant.
+
+    Attributs:
+        fonction_dessin (function): Dessine l'écran sur une surface
+        image (Surface): L'écran déjà dessiné (None hors de la scène)
+    """
+
+    def __init__(self, nom, fonction_dessin):
+        self.nom = nom
+        self.fonction_dessin = fonction_dessin
+        self.image = None
+
+    def preparer(self):
+        """Dessine l'écran à la taille de la fenêtre."""
+        self.image = pygame.Surface(fenetre.get_size()).convert()
+        self.fonction_dessin(self.image)
+
+    def sortir(self):
+        self.image = None
+
+    def redimensionner(self, largeur, hauteur):
+        self.preparer()
+
+    def evenement(self, event):
+        if bouton_retour.est_clique(event):
+            scenes.changer("menu")
+
+    def dessiner(self, screen):
+        screen.blit(self.image, (0, 0))
         bouton_retour.dessiner(screen)
 
-    # --- ÉCRAN GAME OVER ---
-    elif etat_jeu == "game_over":
 
+class SceneScores(SceneEcranFixe):
+    """Historique des scores : lu sur le disque en entrant seulement."""
+
+    def __init__(self):
+        super().__init__("scores", dessiner_scores)
+
+    def entrer(self):
+        # Le score de la dernière partie est peut-être encore en cours
+        # d'écriture (thread de persistance)
+        persistance.attendre()
+
+    def evenement(self, event):
+        super().evenement(event)
+
+        # Touche R pour réinitialiser l'historique
+        if (
+            scenes.nom == "scores"
+            and event.type == pygame.KEYDOWN
+            and event.key == pygame.K_r
+        ):
+            reinitialiser_scores()
+            print("🗑️ Historique des scores réinitialisé.")
+            self.preparer()
+
+
+class SceneGameOver(Scene):
+    """Écran de fin de partie (score, gagnant) et retour au menu."""
+
+    nom = "game_over"
+
+    def __init__(self):
+        # Joueur automatique : frames passées sur cet écran avant de rejouer
+        self.frames = 0
+
+    def entrer(self):
+        self.frames = 0
+
+    def redimensionner(self, largeur, hauteur):
+        bouton_menu_go.rect.centerx = largeur // 2
+        bouton_menu_go.rect.y = hauteur - 100
+
+    def evenement(self, event):
+        if bouton_menu_go.est_clique(event):
+            scenes.changer("menu")
+
+    def mettre_a_jour(self):
+        if bot is not None:
+            self.frames += 1
+            if self.frames >= BOT_DELAI_REJOUER:
+                demarrer_partie(BOT_JOUEURS)
+
+    def dessiner(self, screen):
         gestionnaire_ecran.afficher_fond_menu(screen)
 
         milieu_x = screen.get_width() // 2
@@ -748,7 +881,7 @@ while running:
             txt_go = font_game_over.render("GAME OVER", True, COULEURS["game_over"])
             screen.blit(txt_go, (milieu_x - txt_go.get_width() // 2, y_titre))
 
-            if is_bomb_exploded:
+            if simulation.is_bomb_exploded:
                 txt_boom = font_game_over.render("BOOM !", True, COULEURS["boom"])
                 screen.blit(
                     txt_boom, (milieu_x - txt_boom.get_width() // 2, y_titre + 80)
@@ -762,14 +895,14 @@ while running:
                 )
 
                 txt_score = font_vies.render(
-                    f"Score final : {score}", True, COULEURS["score_final"]
+                    f"Score final : {simulation.score}", True, COULEURS["score_final"]
                 )
                 screen.blit(
                     txt_score, (milieu_x - txt_score.get_width() // 2, y_titre + 200)
                 )
 
                 txt_niveau = font_raison.render(
-                    f"Niveau atteint : {niveau}", True, COULEURS["niveau"]
+                    f"Niveau atteint : {simulation.niveau}", True, COULEURS["niveau"]
                 )
                 screen.blit(
                     txt_niveau, (milieu_x - txt_niveau.get_width() // 2, y_titre + 250)
@@ -783,14 +916,14 @@ while running:
                 )
 
                 txt_score = font_vies.render(
-                    f"Score final : {score}", True, COULEURS["score_final"]
+                    f"Score final : {simulation.score}", True, COULEURS["score_final"]
                 )
                 screen.blit(
                     txt_score, (milieu_x - txt_score.get_width() // 2, y_titre + 140)
                 )
 
                 txt_niveau = font_raison.render(
-                    f"Niveau atteint : {niveau}", True, COULEURS["niveau"]
+                    f"Niveau atteint : {simulation.niveau}", True, COULEURS["niveau"]
                 )
                 screen.blit(
                     txt_niveau, (milieu_x - txt_niveau.get_width() // 2, y_titre + 190)
@@ -800,7 +933,7 @@ while running:
         # MODE 2 JOUEURS
         # ====================================================================
         else:
-            if is_bomb_exploded:
+            if simulation.is_bomb_exploded:
                 txt_go_ombre = font_game_over.render(
                     "GAME OVER", True, COULEURS["titre_ombre"]
                 )
@@ -824,17 +957,13 @@ while running:
                     txt_egalite,
                     (milieu_x - txt_egalite.get_width() // 2, y_titre + 150),
                 )
-                if nombre_de_joueurs == 2:
-                    duree_partie = (
-                        (pygame.time.get_ticks() - start_ticks) / 1000) - 3
-                    sauvegarder_score(0, 1, duree_partie, mode="2j", gagnant="Égalité")
             else:
                 quart_gauche = milieu_x // 2
                 quart_droite = milieu_x + milieu_x // 2
                 centre_y = hauteur_ecran // 2 - 50
 
                 # Joueur 1 (Gauche)
-                if vies_j1 <= 0:
+                if simulation.vies_j1 <= 0:
                     txt_j1 = font_game_over.render("PERDU", True, COULEURS["perdant"])
                     txt_j1_label = font_raison.render(
                         "Joueur 1", True, COULEURS["message"]
@@ -854,7 +983,7 @@ while running:
                 )
 
                 # Joueur 2 (Droite)
-                if vies_j2 <= 0:
+                if simulation.vies_j2 <= 0:
                     txt_j2 = font_game_over.render("PERDU", True, COULEURS["perdant"])
                     txt_j2_label = font_raison.render(
                         "Joueur 2", True, COULEURS["message"]
@@ -876,343 +1005,126 @@ while running:
         # Repositionner le bouton plus bas
         bouton_menu_go.dessiner(screen)
 
-    # --- ÉCRAN DE JEU ---
-    elif etat_jeu == "jeu":
-
-        seconds_ecoules = (pygame.time.get_ticks() - start_ticks) / 1000
-        en_attente = seconds_ecoules < 3
 
-        # --- LOGIQUE ---
-
-        # étape 1 : Gestion du délai avant activation du freeze différé
-        if not en_attente:
-
-            # Gestion du freeze en fonction du mode
-            if nombre_de_joueurs == 1:
-                # Gestion du freeze différé en mode 1 joueur
-                if freeze_en_attente:
-                    freeze_delai_timer -= 1
-                    if freeze_delai_timer <= 0:
-                        # Le délai est écoulé, on active le freeze
-                        freeze_en_attente = False
-                        freeze_actif = True
-                        freeze_duree = random.randint(3, 5)  # Entre 3 et 5 secondes
-                        freeze_timer = (
-                            freeze_duree * 60
-                        )  # Conversion en frames (60 FPS)
-                        print(
-                            f"FREEZE activé pour {freeze_duree} secondes après le décompte !"
-                        )
-
-                # étape 2 : Gestion du freeze actif
-                if freeze_actif:
-                    freeze_timer -= 1
-                    if freeze_timer <= 0:
-                        freeze_actif = False
-                        print("Effet de freeze terminé.")
-            else:
-                # MODE 2 JOUEURS : freeze séparé pour chaque joueur
-
-                # Freeze Joueur 1
-                if freeze_j1_en_attente:
-                    freeze_j1_delai_timer -= 1
-                    if freeze_j1_delai_timer <= 0:
-                        freeze_j1_en_attente = False
-                        freeze_j1_actif = True
-                        freeze_j1_timer = random.randint(3, 5) * 60
-                        print("FREEZE J1 active !")
-
-                if freeze_j1_actif:
-                    freeze_j1_timer -= 1
-                    if freeze_j1_timer <= 0:
-                        freeze_j1_actif = False
-                        print("Freeze J1 termine.")
-
-                # Freeze Joueur 2
-                if freeze_j2_en_attente:
-                    freeze_j2_delai_timer -= 1
-                    if freeze_j2_delai_timer <= 0:
-                        freeze_j2_en_attente = False
-                        freeze_j2_actif = True
-                        freeze_j2_timer = random.randint(3, 5) * 60
-                        print("FREEZE J2 active !")
-
-                if freeze_j2_actif:
-                    freeze_j2_timer -= 1
-                    if freeze_j2_timer <= 0:
-                        freeze_j2_actif = False
-                        print("Freeze J2 termine.")
-                        
-            # ====================================================================
-            # GESTION DU DÉLAI D'EXPLOSION
-            # ====================================================================
-            if explosion_en_cours:
-                explosion_timer -= 1
-                if explosion_timer <= 0:
-                    explosion_en_cours = False
-                    son_win.play()  # Jouer le son de fin
-                    etat_jeu = "game_over"
-            
-            # Gestion de la souris
-            elif controller.slicing:
-                result = controller.update_slice(
-                    pygame.mouse.get_pos(),
-                    mes_fruits,
-                    screen.get_width(),
-                    nombre_de_joueurs,
-                    morceaux_fruits
-                )
+class SceneJeu(Scene):
+    """
+    La partie en cours : une frame de simulation, puis le dessin (objets,
+    HUD, freeze, décompte) sur la cible de rendu.
+    """
 
-                # --- TRAITEMENT DU RÉSULTAT ---
-                if result == "game_over":
-                    # Jouer le son de la bombe
-                    son_bomb.play()
-                    
-                    # Créer les particules d'explosion à la position de la souris
-                    mx, my = pygame.mouse.get_pos()
-                    for _ in range(50):  # 50 particules
-                        particules_explosion.append(ParticuleExplosion(mx, my))
-                        
-                    explosion_en_cours = True
-                    explosion_timer = EXPLOSION_DUREE
-                    is_bomb_exploded = True
-                    if nombre_de_joueurs == 1:
-                        duree_partie = (
-                            (pygame.time.get_ticks() - start_ticks) / 1000
-                        ) - 3
-                        sauvegarder_score(score, niveau, duree_partie)
-                    # La bombe a été tranchée : partie terminée
-                    print("BOOM ! Bombe tranchée !")
-
-                elif result == "freeze":
-                    # Jouer le son du freeze
-                    son_freeze.play()
-                    
-                    # Créer les particules de glace
-                    mx, my = pygame.mouse.get_pos()
-                    for _ in range(30):  # 30 particules
-                        particules_glace.append(ParticuleGlace(mx, my))
-                    # Le glaçon a été tranché : activation du freeze différé
-                    if not freeze_actif and not freeze_en_attente:
-                        freeze_en_attente = True
-                        freeze_delai_timer = FREEZE_DELAI_FRAMES  # 2 secondes de délai
-                        print("Glaçon tranché ! Freeze différé activé.")
-                        
-                elif result == "freeze_j1":
-                    # Freeze pour joueur 1 seulement
-                    if not freeze_j1_actif and not freeze_j1_en_attente:
-                        freeze_j1_en_attente = True
-                        freeze_j1_delai_timer = FREEZE_DELAI_FRAMES  # 2 secondes de délai
-                        print("Glaçon tranché J1 ! Freeze différé J1 activé.")
-                
-                elif result == "freeze_j2":
-                    # Freeze pour joueur 2 seulement
-                    if not freeze_j2_actif and not freeze_j2_en_attente:
-                        freeze_j2_en_attente = True
-                        freeze_j2_delai_timer = FREEZE_DELAI_FRAMES  # 2 secondes de délai
-                        print("Glaçon tranché J2 ! Freeze différé J2 activé.")
-
-                elif isinstance(result, int) and result > 0:
-                    son_sliced.play()
-                    # Score en temps réel (mode 1 joueur)
-                    if nombre_de_joueurs == 1:
-                        # +1 point de base par fruit
-                        points_gagnes = 1
-                        # Bonus si combo >= 3
-                        combo = controller.get_combo_actuel()
-                        if combo >= 3:
-                            points_gagnes += 1  # +1 bonus
-                        
-                        mettre_a_jour_score_et_niveau(points_gagnes)
-
-            compteur += 1
-
-            # Ajustement de la fréquence en fonction du niveau (uniquement en mode 1 joueur)
-            if nombre_de_joueurs == 1:
-                min_freq = max(
-                    20, 50 - (niveau - 1) * 2
-                )  # Fréquence minimale diminue avec le niveau
-                max_freq = max(40, 150 - (niveau - 1) * 3)  # Maximale aussi
-            else:
-                min_freq = 30  # Valeurs par défaut pour mode 2 joueurs
-                max_freq = 100
-            if compteur >= frequence_lancer and not explosion_en_cours:
-                # Gestion de la zone (2 joueurs ou non)
-                if nombre_de_joueurs == 2:
-                    zone_joueur = random.choice([1, 2])
-                else:
-                    zone_joueur = None
-
-                # Gravité selon le mode
-                gravite_pour_objet = gravite_actuelle if nombre_de_joueurs == 1 else 0.4
-
-                # --- 30% DE CHANCE D'OBJET SPÉCIAL (BOMBE OU ICE) ---
-                if random.randint(1, 100) <= 30:
-                    # Choix aléatoire entre bombe et ice
-                    type_special = random.choice(liste_objets_speciaux)
-
-                    if type_special == "bombe":
-                        mes_fruits.append(
-                            Bombe(
-                                screen.get_width(),
-                                screen.get_height(),
-                                zone_joueur,
-                                gravite_pour_objet,
-                            )
-                        )
-                        print("💣 Bombe apparue !")
-                    else:  # type_special == "ice"
-                        mes_fruits.append(
-                            Glacon(
-                                screen.get_width(),
-                                screen.get_height(),
-                                zone_joueur,
-                                gravite_pour_objet,
-                            )
-                        )
-                        print("❄️ Glaçon apparu !")
-                else:
-                    # 70% : Fruit normal
-                    type_fruit = random.choice(liste_fruits)
-                    mes_fruits.append(
-                        Fruit(
-                            type_fruit,
-                            screen.get_width(),
-                            screen.get_height(),
-                            zone_joueur,
-                            gravite_pour_objet,
-                        )
-                    )
+    nom = "jeu"
+
+    def entrer(self):
+        preparer_rendu_partie()
+        # Réinitialisation (vies, niveau, score, freeze des deux joueurs...)
+        simulation.largeur, simulation.hauteur = cible_rendu.taille_du_jeu(fenetre)
+        simulation.demarrer(nombre_de_joueurs, GRAINE_PARTIE)
+        if telemetrie is not None:
+            file_telemetrie.soumettre(telemetrie.commencer, etat_partie(simulation))
+
+        sons["decompte"].stop()  # Coupe le son s'il jouait déjà
+        sons["decompte"].play()
+
+    def sortir(self):
+        # Partie quittée avant la fin (Échap)
+        if not simulation.termine:
+            simulation.abandonner()
+            if telemetrie is not None:
+                file_telemetrie.soumettre(telemetrie.terminer, etat_partie(simulation), "abandon")
+            sons["decompte"].stop()
+
+    def surface(self, fenetre):
+        # Pendant le jeu, les tailles sont celles de la surface logique
+        return cible_rendu.preparer(fenetre)
+
+    def evenement(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            scenes.changer("menu")
+
+        # Les entrées sont ignorées par la simulation pendant le décompte
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            simulation.appuyer_souris(position_souris())
+        elif event.type == pygame.MOUSEBUTTONUP:
+            publier(simulation.relacher_souris())
+        elif event.type == pygame.KEYDOWN:
+            publier(simulation.appuyer_touche(event.key))
+
+    def mettre_a_jour(self):
+        # Le terrain de jeu a la taille logique (ou celle de la fenêtre), pas
+        # celle de la surface de dessin, réduite en qualité basse
+        simulation.definir_taille(*cible_rendu.taille_du_jeu(fenetre))
+        if bot is not None:
+            # Le bot passe par les mêmes entrées qu'un joueur humain
+            for entree in bot.pilote(simulation, simulation.frame):
+                publier(appliquer_entree(simulation, entree))
+            profileur.marquer("evenements")
+            publier(simulation.etape())
+        else:
+            publier(simulation.etape(position_souris()))
 
-                compteur = 0
-                frequence_lancer = random.randint(min_freq, max_freq)
+    def dessiner(self, screen):
+        seconds_ecoules = simulation.secondes_ecoulees
+        en_attente = simulation.en_attente
 
         # --- DESSIN ---
         largeur_ecran = screen.get_width()
         hauteur_ecran = screen.get_height()
-        milieu_x = gestionnaire_ecran.afficher_fond(
-            screen, nombre_de_joueurs, font_info
-        )
-
-        # --- GESTION FRUITS ET VIES SÉPARÉES ---
-        for f in mes_fruits[:]:
-            if not en_attente:
-                if nombre_de_joueurs == 1:
-                    # Les fruits ne bougent que si pas de freeze actif
-                    if not freeze_actif:
-                        f.update(screen.get_width())
-                else:
-                    # Mode 2J : freeze par zone
-                    #  Le fruit bouge seulement si son côté n'est pas en freeze
-                    fruit_a_gauche = f.x < milieu_x
-
-                    if fruit_a_gauche:
-                        if not freeze_j1_actif:
-                            f.update(screen.get_width())
-                    else:
-                        if not freeze_j2_actif:
-                            f.update(screen.get_width())
-            # Dessine le fruit
-            f.draw(screen)
-
-            # --- DÉTECTION FRUIT RATÉ ---
-            if f.y > screen.get_height() + 50:
-                mes_fruits.remove(f)
-
-                # ============================================================
-                # VÉRIFICATION : On n'enlève une vie QUE pour les FRUITS
-                # ============================================================
-                # Les glaçons et les bombes ratés ne pénalisent pas le joueur
-                # - Glaçon raté : pas de bonus freeze, mais pas de pénalité
-                # - Bombe ratée : c'est une BONNE chose de l'avoir évitée !
-                # ============================================================
-
-                # On vérifie que ce n'est PAS un glaçon et PAS une bombe
-                est_un_fruit = not isinstance(f, (Glacon, Bombe))
-
-                # On enlève une vie SEULEMENT si :
-                # 1. C'est un fruit (pas glaçon/bombe)
-                # 2. Il n'a pas été tranché
-                # 3. Le jeu n'est pas en attente (décompte)
-                if est_un_fruit and not f.sliced and not en_attente:
-                    if nombre_de_joueurs == 1:
-                        # Mode 1 joueur : on utilise vies_j1
-                        vies_j1 -= 1
-                        print(f"Fruit raté ! Vies restantes : {vies_j1}")
-                        if vies_j1 <= 0:
-                            son_win.play()
-                            duree_partie = (
-                                (pygame.time.get_ticks() - start_ticks) / 1000
-                            ) - 3
-                            sauvegarder_score(score, niveau, duree_partie)
-                            etat_jeu = "game_over"
-                    else:
-                        # Mode 2 joueurs : on regarde le côté
-                        if f.x < milieu_x:
-                            # C'est un fruit de GAUCHE (Joueur 1)
-                            vies_j1 -= 1
-                            print(f"J1 a raté ! Vies restantes : {vies_j1}")
-                        else:
-                            # C'est un fruit de DROITE (Joueur 2)
-                            vies_j2 -= 1
-                            print(f"J2 a raté ! Vies restantes : {vies_j2}")
-
-                            # Si l'un des deux meurt, c'est Game Over global
-                        if vies_j1 <= 0 or vies_j2 <= 0:
-                            # Détermine le gagnant
-                            if vies_j1 <= 0 and vies_j2 <= 0:
-                                gagnant = "egalite"
-                            elif vies_j1 <= 0:
-                                gagnant = "J2"
-                            else:
-                                gagnant = "J1"
-                            
-                            son_win.play()
-                            duree_partie = (
-                                (pygame.time.get_ticks() - start_ticks) / 1000
-                            ) - 3
-                            sauvegarder_score(
-                                0, 1, duree_partie, mode="2j", gagnant=gagnant
-                            )
-                            etat_jeu = "game_over"
-
-        # ====================================================================
-        # GESTION DES MORCEAUX DE FRUITS (NOUVEAU)
-        # ====================================================================
-        # Cette section gère les morceaux créés quand un fruit est tranché.
-        # Les morceaux ont leur propre physique (séparation, rotation, fade out).
-        # ====================================================================
-        
-        # Mise à jour de chaque morceau (physique + fade out)
-        for morceau in morceaux_fruits:
-            morceau.update()
-        
-        # Suppression des morceaux qui ont fini leur animation
-        morceaux_fruits = [m for m in morceaux_fruits if not m.est_termine()]
-        
-        # Affichage de chaque morceau
-        for morceau in morceaux_fruits:
-            morceau.draw(screen)
-            
-        # ====================================================================
-        # GESTION DES PARTICULES D'EXPLOSION ET DE GLACE
-        # ====================================================================
-        
-        # Mise à jour et affichage des particules d'explosion
-        for particule in particules_explosion[:]:
-            particule.update()
-            particule.draw(screen)
-            particles_explosion = [p for p in particules_explosion if not p.est_termine()]
-        
-        # Mise à jour et affichage des particules de glace
-        for particule in particules_glace[:]:
-            particule.update()
-            particule.draw(screen)
-            if particule.est_termine():
-                particules_glace.remove(particule)
+        # Mode 2 joueurs : chaque moitié peut être dessinée par son propre thread
+        rendu_parallele = RENDU_THREADS_2J and nombre_de_joueurs == 2
+        # Surface de dessin réduite (qualité basse) : les couches convertissent
+        # les positions du jeu
+        echelle = cible_rendu.echelle
+
+        if rendu_parallele:
+            # Les fonds sont dessinés par les threads, avec les couches
+            milieu_x = largeur_ecran // 2
+            rendu_zones.commencer(
+                screen, milieu_x, gestionnaire_ecran.fonds_2j(screen), echelle
+            )
+            couche_fruits, couche_morceaux, couche_particules = rendu_zones.couches
+        else:
+            milieu_x = gestionnaire_ecran.afficher_fond(
+                screen, nombre_de_joueurs, font_info
+            )
+            couche_fruits, couche_morceaux, couche_particules = (
+                file_fruits,
+                file_morceaux,
+                file_particules,
+            )
+            file_fruits.commencer(screen, echelle)
+            file_morceaux.commencer(screen, echelle)
+            file_particules.commencer(screen, echelle)
+        profileur.marquer("fond")
+
+        # Tous les fruits en un seul appel
+        simulation.mes_fruits.dessiner(couche_fruits)
+        if not rendu_parallele:
+            file_fruits.soumettre()
+        profileur.marquer("fruits")
+
+        # Affichage de tous les morceaux en un seul appel
+        simulation.morceaux_fruits.dessiner(couche_morceaux)
+        if not rendu_parallele:
+            file_morceaux.soumettre()
+        profileur.marquer("morceaux")
+
+        # Particules d'explosion et de glace
+        simulation.particules_explosion.dessiner(couche_particules)
+        simulation.particules_glace.dessiner(couche_particules)
+
+        # Affichage de toutes les particules en un seul appel
+        if rendu_parallele:
+            # Les deux threads dessinent leur moitié ; on attend qu'ils aient fini
+            rendu_zones.soumettre()
+            gestionnaire_ecran.dessiner_separation(screen)
+        else:
+            file_particules.soumettre()
 
         if not en_attente:
-            controller.draw_slice(screen)
+            simulation.controleur_souris.draw_slice(
+                screen, temps=simulation.temps_ms(), echelle=echelle
+            )
+        profileur.marquer("particules")
 
         # --- AFFICHAGE DES VIES ET NIVEAU (HUD) ---
 
@@ -1227,12 +1139,14 @@ while running:
             )
 
             # Vies
-            txt_vies = font_vies.render(f"VIES : {vies_j1}", True, COULEURS["hud_vies"])
+            txt_vies = font_vies.render(
+                f"VIES : {simulation.vies_j1}", True, COULEURS["hud_vies"]
+            )
             screen.blit(txt_vies, (largeur_ecran // 2 - txt_vies.get_width() // 2, 60))
 
             # Niveau
             txt_niveau = font_vies.render(
-                f"NIVEAU : {niveau}", True, COULEURS["hud_niveau"]
+                f"NIVEAU : {simulation.niveau}", True, COULEURS["hud_niveau"]
             )
             screen.blit(
                 txt_niveau, (largeur_ecran // 2 - txt_niveau.get_width() // 2, 105)
@@ -1240,7 +1154,7 @@ while running:
 
             # Score (optionnel, affiché pendant le jeu)
             txt_score = font_info.render(
-                f"Score : {score}", True, COULEURS["hud_score"]
+                f"Score : {simulation.score}", True, COULEURS["hud_score"]
             )
             screen.blit(
                 txt_score, (largeur_ecran // 2 - txt_score.get_width() // 2, 150)
@@ -1253,7 +1167,7 @@ while running:
 
             # Vies J1
             txt_vies_j1 = font_vies.render(
-                f"VIES : {vies_j1}", True, COULEURS["hud_vies"]
+                f"VIES : {simulation.vies_j1}", True, COULEURS["hud_vies"]
             )
             screen.blit(txt_vies_j1, (milieu_x // 2 - txt_vies_j1.get_width() // 2, 60))
 
@@ -1265,7 +1179,7 @@ while running:
 
             # Vies J2
             txt_vies_j2 = font_vies.render(
-                f"VIES : {vies_j2}", True, COULEURS["hud_vies"]
+                f"VIES : {simulation.vies_j2}", True, COULEURS["hud_vies"]
             )
             screen.blit(
                 txt_vies_j2,
@@ -1274,14 +1188,14 @@ while running:
 
         # --- AFFICHAGE DU FREEZE ---
         if nombre_de_joueurs == 1:
-            if freeze_actif:
+            if simulation.gele("partie"):
                 # Overlay bleu semi-transparent
                 overlay = pygame.Surface((largeur_ecran, hauteur_ecran))
                 overlay.set_alpha(60)
                 overlay.fill((173, 216, 230))  # Bleu clair
                 screen.blit(overlay, (0, 0))
 
-                temps_restant = freeze_timer / 60
+                temps_restant = simulation.temps_freeze("partie") / 60
                 txt_freeze = font_freeze.render(
                     "FREEZE", True, COULEURS["freeze_texte"]
                 )
@@ -1290,7 +1204,7 @@ while running:
                 )
 
                 # Clignotement
-                if (freeze_timer // 15) % 2 == 0:
+                if (simulation.temps_freeze("partie") // 15) % 2 == 0:
                     screen.blit(
                         txt_freeze,
                         (
@@ -1307,13 +1221,13 @@ while running:
                 )
         else:
             # Mode 2 joueurs - Freeze par zone
-            if freeze_j1_actif:
+            if simulation.gele("j1"):
                 overlay_j1 = pygame.Surface((milieu_x, hauteur_ecran))
                 overlay_j1.set_alpha(60)
                 overlay_j1.fill((173, 216, 230))
                 screen.blit(overlay_j1, (0, 0))
 
-                temps_j1 = freeze_j1_timer / 60
+                temps_j1 = simulation.temps_freeze("j1") / 60
                 txt_freeze_j1 = font_vies.render(
                     "FREEZE", True, COULEURS["freeze_texte"]
                 )
@@ -1321,7 +1235,7 @@ while running:
                     f"{temps_j1:.1f}s", True, COULEURS["freeze_timer"]
                 )
 
-                if (freeze_j1_timer // 15) % 2 == 0:
+                if (simulation.temps_freeze("j1") // 15) % 2 == 0:
                     screen.blit(
                         txt_freeze_j1,
                         (
@@ -1337,13 +1251,13 @@ while running:
                     ),
                 )
 
-            if freeze_j2_actif:
+            if simulation.gele("j2"):
                 overlay_j2 = pygame.Surface((largeur_ecran - milieu_x, hauteur_ecran))
                 overlay_j2.set_alpha(60)
                 overlay_j2.fill((173, 216, 230))
                 screen.blit(overlay_j2, (milieu_x, 0))
 
-                temps_j2 = freeze_j2_timer / 60
+                temps_j2 = simulation.temps_freeze("j2") / 60
                 txt_freeze_j2 = font_vies.render(
                     "FREEZE", True, COULEURS["freeze_texte"]
                 )
@@ -1351,7 +1265,7 @@ while running:
                     f"{temps_j2:.1f}s", True, COULEURS["freeze_timer"]
                 )
 
-                if (freeze_j2_timer // 15) % 2 == 0:
+                if (simulation.temps_freeze("j2") // 15) % 2 == 0:
                     screen.blit(
                         txt_freeze_j2,
                         (
@@ -1413,7 +1327,130 @@ while running:
                 screen.blit(surf_phrase, rect_phrase_j2)
                 screen.blit(surf_chrono, rect_chrono_j2)
 
+
+scenes = GestionnaireScenes()
+scenes.ajouter(SceneMenu())
+scenes.ajouter(SceneEcranFixe("regles", dessiner_regles))
+scenes.ajouter(SceneScores())
+scenes.ajouter(SceneJeu())
+scenes.ajouter(SceneGameOver())
+scenes.verifier_taille(fenetre.get_size())
+
+# Rechargement à chaud : les fichiers changés (images, fonds, sons,
+# difficulté) sont rechargés au changement de scène suivant (rechargement.py)
+rechargement = None
+if RECHARGEMENT_A_CHAUD:
+    rechargement = RechargementFichiers(RECHARGEMENT_INTERVALLE)
+    for fichiers in FICHIERS_IMAGES.values():
+        for chemin in fichiers.values() if isinstance(fichiers, dict) else [fichiers]:
+            rechargement.surveiller(chemin, recharger_image_objet)
+    for chemin, _ in FONDS.values():
+        rechargement.surveiller(chemin, gestionnaire_ecran.recharger_fond)
+    for chemin, _ in FICHIERS_SONS.values():
+        rechargement.surveiller(chemin, recharger_son)
+    rechargement.surveiller(FICHIER_DIFFICULTE, difficulte.recharger)
+    rechargement.demarrer()
+    scenes.a_chaque_changement(rechargement.appliquer)
+
+scenes.changer("menu")
+
+
+# --- BOUCLE PRINCIPALE ---
+while running:
+    # Début de la mesure du temps de travail de la frame (qualité adaptative)
+    debut_frame = time.perf_counter()
+    profileur.debut_frame()
+
+    # 0. RE-CENTRAGE (seulement si la fenêtre a changé de taille)
+    scenes.verifier_taille(fenetre.get_size())
+
+    # 1. GESTION DES ÉVÉNEMENTS
+    events = pygame.event.get()
+    for event in events:
+        if event.type == pygame.QUIT:
+            running = False
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_f or event.key == pygame.K_F11:
+                if fenetre.get_flags() & pygame.FULLSCREEN:
+                    fenetre = pygame.display.set_mode((1280, 720), pygame.RESIZABLE)
+                else:
+                    fenetre = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            elif event.key == pygame.K_F3:
+                profileur.basculer()
+
+        # Clics, touches... : seulement pour la scène affichée
+        scenes.evenement(event)
+
+    profileur.marquer("evenements")
+
+    # 2. LOGIQUE ET DESSIN
+    scenes.mettre_a_jour()
+
+    # Événements de la frame (entrées et simulation), distribués en un lot :
+    # sons, sauvegardes, télémétrie, écran Game Over (voir evenements.py)
+    bus.distribuer()
+
+    # Le jeu est dessiné sur la cible de rendu, les menus directement dans la fenêtre
+    screen = scenes.surface(fenetre)
+    scenes.dessiner(screen)
+
+    en_jeu = scenes.nom == "jeu"
+    # HUD en jeu (vies, freeze, décompte), écrans des menus sinon
+    profileur.marquer("hud" if en_jeu else "menus")
+
+    # Un seul scale de la surface logique vers la fenêtre
+    if screen is not fenetre:
+        cible_rendu.presenter(fenetre)
+        profileur.marquer("presentation")
+
+    profileur.dessiner(fenetre)
+    profileur.marquer("profileur")
+
     pygame.display.flip()
+    profileur.marquer("flip")
+    if en_jeu:
+        profileur.fin_frame(
+            {
+                "fruits": len(simulation.mes_fruits),
+                "morceaux": len(simulation.morceaux_fruits),
+                "particules": len(simulation.particules_explosion)
+                + len(simulation.particules_glace),
+            }
+        )
+    else:
+        profileur.fin_frame()
+
+    # Qualité adaptative : on mesure le temps de travail (sans l'attente de clock.tick)
+    duree_frame_ms = (time.perf_counter() - debut_frame) * 1000
+    if mesure_endurance is not None and en_jeu:
+        mesure_endurance.enregistrer(duree_frame_ms, simulation)
+    if telemetrie is not None and en_jeu:
+        file_telemetrie.soumettre(
+            telemetrie.ajouter_frame,
+            simulation.frame,
+            duree_frame_ms,
+            len(simulation.mes_fruits),
+            len(simulation.morceaux_fruits),
+            len(simulation.particules_explosion) + len(simulation.particules_glace),
+        )
+    if surveillance_memoire is not None and en_jeu:
+        surveillance_memoire.frame(simulation)
+    if QUALITE_ADAPTATIVE and en_jeu:
+        if controleur_qualite.enregistrer_frame(duree_frame_ms):
+            # Les rotations en cache ne correspondent plus aux nouveaux réglages
+            vider_cache_rotations()
+            cible_rendu.lisse = qualite.reglages["lissage"]
+
     clock.tick(60)
 
+rendu_zones.fermer()
+profileur.fermer()
+if rechargement is not None:
+    rechargement.arreter()
+if telemetrie is not None:
+    file_telemetrie.soumettre(telemetrie.terminer, etat_partie(simulation), "abandon")
+    file_telemetrie.fermer()
+# Les sauvegardes en attente sont écrites avant de quitter
+persistance.fermer()
 pygame.quit()
@@ -0,0 +1,341 @@
+# ============================================================================
+# FICHIER : memoire.py
+# DESCRIPTION : Diagnostic mémoire des longues sessions (fuites, allocations)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Des captures "tracemalloc" toutes les N frames : mémoire Python suivie,
+#   lignes du code dont la mémoire a le plus grossi depuis la capture
+#   précédente
+# - Le nombre d'éléments des listes et des caches du jeu (fruits, morceaux,
+#   particules, caches de rotations, de sprites, de cercles...) et des objets
+#   suivis par le ramasse-miettes (gc), avec ses collectes et leur durée
+# - Un test d'endurance (le bot joue des dizaines de parties) qui ÉCHOUE si
+#   la mémoire grossit de plus d'un seuil entre la fin de l'échauffement et
+#   la dernière partie
+#
+# POURQUOI ?
+# Chaque frame crée des Surfaces (particules, rotations des morceaux, voiles
+# de freeze, textes) et des listes comme particules_explosion peuvent
+# grossir sans limite. Sur une borne allumée toute la journée, une petite
+# fuite finit par faire ramer puis planter le jeu.
+#
+# ATTENTION :
+# - tracemalloc ralentit beaucoup le jeu : mode de diagnostic uniquement
+# - Les pixels des Surfaces sont alloués par SDL, pas par Python : tracemalloc
+#   ne voit que les objets Python. La mémoire du processus (RSS, sous Linux)
+#   est donc affichée et vérifiée à côté.
+#
+# TEST D'ENDURANCE :
+#   python memoire.py --parties 40 --echauffement 3 --seuil-ko 1024 --dessin
+#
+# ============================================================================
+
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+
+import objets
+
+# Captures sans les allocations du diagnostic (tracemalloc, historique des
+# captures) ni des imports
+FILTRES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def memoire_processus():
+    """
+    Retourne la mémoire résidente du processus (RSS), en octets, sans celle
+    utilisée par tracemalloc lui-même.
+
+    Retourne:
+        int: RSS, ou None si le système ne la donne pas (hors Linux)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return rss - tracemalloc.get_tracemalloc_memory()
+
+
+def compter_entites(simulation):
+    """
+    Compte les éléments des listes et des caches du jeu.
+
+    Args:
+        simulation (Simulation): La partie en cours
+
+    Retourne:
+        dict: Nom -> nombre d'éléments
+    """
+    return {
+        "fruits": len(simulation.mes_fruits),
+        "morceaux": len(simulation.morceaux_fruits),
+        "particules_explosion": len(simulation.particules_explosion),
+        "particules_glace": len(simulation.particules_glace),
+        "trainee": simulation.controleur_souris.trainee.taille,
+        **objets.tailles_caches(),
+        "objets_gc": len(gc.get_objects()),
+        "gc_garbage": len(gc.garbage),
+    }
+
+
+def _ko(octets):
+    """Formate un nombre d'octets en Ko (avec signe)."""
+    return f"{octets / 1024:+.1f} Ko"
+
+
+class SurveillanceMemoire:
+    """
+    Captures mémoire régulières pendant une longue session.
+
+    Attributs:
+        intervalle_frames (int): Frames entre deux captures (0 = à la demande)
+        nombre_sites (int): Nombre de lignes affichées dans chaque rapport
+        precedente (Snapshot): Capture précédente (pour la croissance)
+        historique (list): Résumé de chaque capture
+        collectes (dict): Génération -> collectes gc depuis la capture précédente
+        duree_gc_ms (float): Temps passé dans le gc depuis la capture précédente
+    """
+
+    def __init__(self, intervalle_frames=60 * 60, profondeur=1, nombre_sites=10):
+        self.intervalle_frames = intervalle_frames
+        self.profondeur = profondeur
+        self.nombre_sites = nombre_sites
+        self.frames = 0
+        self.precedente = None
+        self.historique = []
+        self.collectes = {0: 0, 1: 0, 2: 0}
+        self.duree_gc_ms = 0.0
+        self._debut_gc = 0.0
+
+    def demarrer(self):
+        """Démarre tracemalloc et l'écoute des collectes du gc."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.profondeur)
+        gc.callbacks.append(self._rappel_gc)
+
+    def arreter(self):
+        """Arrête tracemalloc et l'écoute du gc."""
+        if self._rappel_gc in gc.callbacks:
+            gc.callbacks.remove(self._rappel_gc)
+        tracemalloc.stop()
+
+    def _rappel_gc(self, phase, infos):
+        """Appelé par le gc au début et à la fin de chaque collecte."""
+        if phase == "start":
+            self._debut_gc = time.perf_counter()
+        else:
+            self.collectes[infos["generation"]] += 1
+            self.duree_gc_ms += (time.perf_counter() - self._debut_gc) * 1000
+
+    def frame(self, simulation):
+        """
+        À appeler à chaque frame : capture toutes les intervalle_frames frames.
+
+        Args:
+            simulation (Simulation): La partie en cours
+
+        Retourne:
+            dict: Le résumé si une capture vient d'être faite, sinon None
+        """
+        self.frames += 1
+        if not self.intervalle_frames or self.frames % self.intervalle_frames:
+            return None
+        return self.capturer(simulation)
+
+    def capturer(self, simulation, afficher=True):
+        """
+        Fait une capture et affiche ce qui a grossi depuis la précédente.
+
+        Args:
+            simulation (Simulation): La partie en cours
+            afficher (bool): Afficher le rapport dans la console
+
+        Retourne:
+            dict: Mémoire suivie, RSS, entités, collectes gc et sites qui ont grossi
+        """
+        # Collecte complète avant la capture : les cycles en attente ne sont
+        # pas des fuites. Elle n'est pas comptée dans les collectes du jeu.
+        gc.callbacks.remove(self._rappel_gc)
+        gc.collect()
+        gc.callbacks.append(self._rappel_gc)
+
+        capture = tracemalloc.take_snapshot().filter_traces(FILTRES)
+        # Mémoire du jeu seulement (les captures gardées sont filtrées)
+        suivie = sum(trace.size for trace in capture.traces)
+        pic = tracemalloc.get_traced_memory()[1]
+        sites = []
+        if self.precedente is not None:
+            for stat in capture.compare_to(self.precedente, "lineno"):
+                if stat.size_diff <= 0:
+                    continue
+                sites.append((str(stat.traceback[0]), stat.size_diff, stat.count_diff))
+                if len(sites) >= self.nombre_sites:
+                    break
+
+        resume = {
+            "capture": len(self.historique) + 1,
+            "frames": self.frames,
+            "suivie": suivie,
+            "pic": pic,
+            "rss": memoire_processus(),
+            "entites": compter_entites(simulation),
+            "collectes": dict(self.collectes),
+            "duree_gc_ms": self.duree_gc_ms,
+            "sites": sites,
+        }
+        self.historique.append(resume)
+        self.precedente = capture
+        self.collectes = {0: 0, 1: 0, 2: 0}
+        self.duree_gc_ms = 0.0
+
+        if afficher:
+            self.afficher(resume)
+        return resume
+
+    def afficher(self, resume):
+        """Affiche le rapport d'une capture."""
+        rss = "?" if resume["rss"] is None else f"{resume['rss'] / 1048576:.1f} Mo"
+        print(
+            f"🧠 Mémoire #{resume['capture']} (frame {resume['frames']}) :"
+            f" Python {resume['suivie'] / 1048576:.2f} Mo (pic {resume['pic'] / 1048576:.2f} Mo)"
+            f" | processus {rss}"
+            f" | gc {resume['collectes'][0]}/{resume['collectes'][1]}/{resume['collectes'][2]}"
+            f" en {resume['duree_gc_ms']:.1f} ms"
+        )
+        print("   " + ", ".join(f"{nom} {nombre}" for nom, nombre in resume["entites"].items()))
+        for site, taille, nombre in resume["sites"]:
+            print(f"   {_ko(taille):>12} {nombre:+6d} blocs  {site}")
+
+
+# ============================================================================
+# TEST D'ENDURANCE
+# ============================================================================
+def tester_endurance(
+    parties, echauffement, seuil_ko, joueurs=1, dessin=False, graine=0, nombre_sites=10
+):
+    """
+    Fait jouer le bot et vérifie que la mémoire ne grossit pas.
+
+    La référence est prise après les parties d'échauffement (les caches de
+    sprites et de rotations sont remplis), puis une capture est faite à la
+    fin de chaque partie.
+
+    Args:
+        parties (int): Nombre de parties après l'échauffement
+        echauffement (int): Parties jouées avant la capture de référence
+        seuil_ko (float): Croissance maximale autorisée (Ko), pour la mémoire
+            Python et pour celle du processus
+        joueurs (int): 1 ou 2 joueurs
+        dessin (bool): Dessiner chaque frame (Surfaces, rotations, textes)
+        graine (int): Graine de la première partie
+
+    Retourne:
+        bool: True si la mémoire est restée sous le seuil
+    """
+    # Imports locaux : simulation et bench importent tout le jeu
+    import pygame
+    from bot import Bot
+    from simulation import Simulation, appliquer_entree, initialiser_sans_affichage
+
+    initialiser_sans_affichage(charger_images=dessin)
+    simulation = Simulation(joueurs, effets=dessin, graine=graine)
+    bot = Bot(graine=graine)
+    dessinateur = None
+    if dessin:
+        from bench import TAILLE_ECRAN, DessinPartie
+
+        screen = pygame.display.set_mode(TAILLE_ECRAN)
+        simulation.definir_taille(*TAILLE_ECRAN)
+        dessinateur = DessinPartie(TAILLE_ECRAN)
+
+    surveillance = SurveillanceMemoire(intervalle_frames=0, nombre_sites=nombre_sites)
+    surveillance.demarrer()
+    reference = capture_reference = None
+    if echauffement == 0:
+        reference = surveillance.capturer(simulation, afficher=False)
+        capture_reference = surveillance.precedente
+    terminees = 0
+
+    while terminees < echauffement + parties:
+        for entree in bot.pilote(simulation, simulation.frame):
+            appliquer_entree(simulation, entree)
+        simulation.etape()
+        if dessinateur is not None:
+            dessinateur.dessiner(screen, simulation)
+        surveillance.frames += 1
+        if not simulation.termine:
+            continue
+
+        terminees += 1
+        simulation.demarrer(graine=graine + terminees)
+        bot.reinitialiser()
+        if terminees == echauffement:
+            reference = surveillance.capturer(simulation, afficher=False)
+            capture_reference = surveillance.precedente
+            print(
+                f"📌 Référence après {echauffement} partie(s) :"
+                f" Python {reference['suivie'] / 1048576:.2f} Mo"
+            )
+        elif terminees > echauffement:
+            resume = surveillance.capturer(simulation, afficher=False)
+            print(
+                f"Partie {terminees - echauffement}/{parties} :"
+                f" Python {_ko(resume['suivie'] - reference['suivie'])}"
+                + (
+                    ""
+                    if resume["rss"] is None or reference["rss"] is None
+                    else f" | processus {_ko(resume['rss'] - reference['rss'])}"
+                )
+                + f" | objets gc {resume['entites']['objets_gc'] - reference['entites']['objets_gc']:+d}"
+            )
+
+    final = surveillance.historique[-1]
+    croissances = {"Python": final["suivie"] - reference["suivie"]}
+    if final["rss"] is not None and reference["rss"] is not None:
+        croissances["processus"] = final["rss"] - reference["rss"]
+
+    # Sites qui ont grossi depuis la référence (et pas seulement depuis la
+    # dernière partie)
+    print("\nCroissance depuis la référence :")
+    for stat in surveillance.precedente.compare_to(capture_reference, "lineno")[:nombre_sites]:
+        if stat.size_diff > 0:
+            print(f"   {_ko(stat.size_diff):>12} {stat.count_diff:+6d} blocs  {stat.traceback[0]}")
+    surveillance.arreter()
+
+    reussi = True
+    for nom, croissance in croissances.items():
+        ok = croissance <= seuil_ko * 1024
+        reussi = reussi and ok
+        print(f"{'✅' if ok else '❌'} Mémoire {nom} : {_ko(croissance)} (seuil {seuil_ko:.0f} Ko)")
+    return reussi
+
+
+def main():
+    """Point d'entrée : test d'endurance mémoire."""
+    parser = argparse.ArgumentParser(description="Test d'endurance mémoire (fuites)")
+    parser.add_argument("--parties", type=int, default=20, help="Parties après l'échauffement")
+    parser.add_argument("--echauffement", type=int, default=3, help="Parties avant la référence")
+    parser.add_argument("--seuil-ko", type=float, default=1024, help="Croissance maximale (Ko)")
+    parser.add_argument("--joueurs", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--dessin", action="store_true", help="Dessiner les frames (Surfaces)")
+    parser.add_argument("--graine", type=int, default=0)
+    args = parser.parse_args()
+
+    if not tester_endurance(
+        args.parties, args.echauffement, args.seuil_ko, args.joueurs, args.dessin, args.graine
+    ):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,720 +1,989 @@
 import math
+from array import array
 import pygame, random
 from constantes import images
+import physique
+import qualite
 
 
-# Classe pour représenter un fruit dans le jeu
-class Fruit:
-    def __init__(self, type_de_fruit, largeur, hauteur, zone_joueur=None, gravity=0.4):
-        # Initialisation du type de fruit (ex: "pomme", "banane", etc.)
-        self.type = type_de_fruit
-        # Indicateur si le fruit a été tranché
-        self.sliced = False
-        # Rayon du fruit pour les collisions et l'affichage
-        self.radius = 60  # Légèrement réduit pour mieux coller aux fruits fins
-
-        # Stockage de la zone du joueur (1 pour gauche, 2 pour droite, None pour mode 1 joueur)
-        self.zone_joueur = zone_joueur
-
-        # --- GESTION INTELLIGENTE DES IMAGES ---
-        # Récupération de l'image brute depuis les constantes
-        raw_image = images.get(self.type)
-        # Dictionnaire pour stocker les variantes d'image (pour les poires avec états)
-        self.images_set = None
-
-        # Gravité appliquée au fruit
-        self.gravity = gravity
-
-        if isinstance(raw_image, dict):
-            # Cas d'un fruit avec plusieurs états (ex: poire avec "up", "down", "cut")
-            self.images_set = {}
-
-            # STRATÉGIE : On utilise l'image "cut" pour déterminer la taille cible
-            # Toutes les images auront la même LARGEUR que "cut" après redimensionnement
-
-            HAUTEUR_CIBLE = 160  # Hauteur fixe pour l'affichage
-
-            # 1. On redimensionne d'abord l'image "cut" avec la hauteur cible
-            if "cut" in raw_image:
-                img_cut = raw_image["cut"]
-                ratio_cut = img_cut.get_width() / img_cut.get_height()
-                largeur_cut = int(HAUTEUR_CIBLE * ratio_cut)
-                self.images_set["cut"] = pygame.transform.smoothscale(
-                    img_cut, (largeur_cut, HAUTEUR_CIBLE)
-                )
-
-                # 2. On redimensionne "up" et "down" pour avoir la MÊME LARGEUR que "cut"
-                for key in ["up", "down"]:
-                    if key in raw_image:
-                        img_orig = raw_image[key]
-                        # On force la même largeur que "cut", en calculant la hauteur proportionnelle
-                        ratio_orig = img_orig.get_width() / img_orig.get_height()
-                        hauteur_proportionnelle = int(largeur_cut / ratio_orig)
-
-                        # Si la hauteur calculée dépasse HAUTEUR_CIBLE, on ajuste
-                        if hauteur_proportionnelle > HAUTEUR_CIBLE:
-                            # On garde HAUTEUR_CIBLE et on recalcule la largeur
-                            self.images_set[key] = pygame.transform.smoothscale(
-                                img_orig,
-                                (int(HAUTEUR_CIBLE * ratio_orig), HAUTEUR_CIBLE),
-                            )
-                        else:
-                            # On utilise la largeur de "cut"
-                            self.images_set[key] = pygame.transform.smoothscale(
-                                img_orig, (largeur_cut, hauteur_proportionnelle)
-                            )
-            else:
-                # Fallback si pas d'image "cut"
-                for key, img_orig in raw_image.items():
-                    ratio = img_orig.get_width() / img_orig.get_height()
-                    nouvelle_largeur = int(HAUTEUR_CIBLE * ratio)
-                    self.images_set[key] = pygame.transform.smoothscale(
-                        img_orig, (nouvelle_largeur, HAUTEUR_CIBLE)
+# ============================================================================
+# CACHE DES SPRITES REDIMENSIONNÉS
+# ============================================================================
+# Avant, chaque objet refaisait un smoothscale de ses images à sa création.
+# Maintenant, on redimensionne UNE SEULE FOIS par (type, hauteur) et tous les
+# objets partagent les mêmes surfaces. Les tailles sont en pixels logiques :
+# le cache ne dépend pas de la taille de la fenêtre.
+# ============================================================================
+_cache_sprites = {}
+
+
+def _redimensionner(raw_image, hauteur_cible):
+    """
+    Redimensionne une image (ou un dictionnaire d'états) à la hauteur cible.
+
+    Args:
+        raw_image (Surface|dict|None): Image brute issue de constantes.images
+        hauteur_cible (int): Hauteur d'affichage en pixels
+
+    Retourne:
+        Surface, dict de Surfaces, ou None si pas d'image
+    """
+    if raw_image is None:
+        return None
+
+    if not isinstance(raw_image, dict):
+        # Calcul du ratio pour conserver les proportions
+        ratio = raw_image.get_width() / raw_image.get_height()
+        nouvelle_largeur = int(hauteur_cible * ratio)
+        return pygame.transform.smoothscale(raw_image, (nouvelle_largeur, hauteur_cible))
+
+    images_set = {}
+
+    # STRATÉGIE : On utilise l'image "cut" pour déterminer la taille cible
+    # Toutes les images auront la même LARGEUR que "cut" après redimensionnement
+    if "cut" in raw_image:
+        # 1. On redimensionne d'abord l'image "cut" avec la hauteur cible
+        img_cut = raw_image["cut"]
+        ratio_cut = img_cut.get_width() / img_cut.get_height()
+        largeur_cut = int(hauteur_cible * ratio_cut)
+        images_set["cut"] = pygame.transform.smoothscale(
+            img_cut, (largeur_cut, hauteur_cible)
+        )
+
+        # 2. On redimensionne "up" et "down" pour avoir la MÊME LARGEUR que "cut"
+        for key in ["up", "down"]:
+            if key in raw_image:
+                img_orig = raw_image[key]
+                # On force la même largeur que "cut", en calculant la hauteur proportionnelle
+                ratio_orig = img_orig.get_width() / img_orig.get_height()
+                hauteur_proportionnelle = int(largeur_cut / ratio_orig)
+
+                # Si la hauteur calculée dépasse la hauteur cible, on ajuste
+                if hauteur_proportionnelle > hauteur_cible:
+                    images_set[key] = pygame.transform.smoothscale(
+                        img_orig, (int(hauteur_cible * ratio_orig), hauteur_cible)
+                    )
+                else:
+                    images_set[key] = pygame.transform.smoothscale(
+                        img_orig, (largeur_cut, hauteur_proportionnelle)
                     )
+    else:
+        # Fallback si pas d'image "cut"
+        for key, img_orig in raw_image.items():
+            images_set[key] = _redimensionner(img_orig, hauteur_cible)
 
-            # Image initiale : état "up" (fruit montant)
-            self.image = self.images_set.get("up", self.images_set.get("cut"))
-
-        elif raw_image is not None:
-            # Cas d'un fruit simple (sans états multiples)
-            HAUTEUR_CIBLE = 160
-            # Calcul du ratio pour conserver les proportions
-            ratio = raw_image.get_width() / raw_image.get_height()
-            nouvelle_largeur = int(HAUTEUR_CIBLE * ratio)
-            # Redimensionnement
-            self.image = pygame.transform.smoothscale(
-                raw_image, (nouvelle_largeur, HAUTEUR_CIBLE)
-            )
-        else:
-            # Pas d'image disponible : on utilisera un cercle coloré
-            self.image = None
+    return images_set
 
-        # --- POSITIONNEMENT INITIAL ---
-        # Calcul du milieu de l'écran
-        milieu_x = largeur // 2
-        if zone_joueur == 1:
-            # Zone joueur 1 : côté gauche de l'écran
-            self.x = random.randint(100, milieu_x - 100)
-        elif zone_joueur == 2:
-            # Zone joueur 2 : côté droite de l'écran
-            self.x = random.randint(milieu_x + 100, largeur - 100)
+
+def obtenir_sprite(type_objet, hauteur_cible):
+    """
+    Retourne l'image (ou le dictionnaire d'images) redimensionnée d'un objet,
+    en la calculant seulement au premier appel.
+
+    Args:
+        type_objet (str): Clé dans constantes.images ("pomme", "bombe", "ice"...)
+        hauteur_cible (int): Hauteur d'affichage en pixels
+
+    Retourne:
+        Surface, dict de Surfaces, ou None si pas d'image
+    """
+    cle = (type_objet, hauteur_cible)
+    if cle not in _cache_sprites:
+        _cache_sprites[cle] = _redimensionner(images.get(type_objet), hauteur_cible)
+    return _cache_sprites[cle]
+
+
+def prechauffer(types_objets):
+    """
+    Prépare à l'avance les images des prochains objets (sprite redimensionné
+    et miroir de l'image "cut"), pour que leur lancer et leur coupe ne
+    fassent pas de smoothscale ni de flip.
+
+    Args:
+        types_objets (list): Types des objets à venir ("pomme", "bombe"...)
+    """
+    for type_objet in types_objets:
+        sprite = obtenir_sprite(type_objet, GENRES[genre_de(type_objet)]["hauteur_sprite"])
+        if isinstance(sprite, dict) and sprite.get("cut") is not None:
+            image = sprite["cut"]
+            if image not in _cache_miroirs:
+                _cache_miroirs[image] = pygame.transform.flip(image, True, False)
+
+
+def vider_cache_sprites():
+    """Vide le cache (à appeler si les images de constantes sont rechargées)."""
+    _cache_sprites.clear()
+    _cache_miroirs.clear()
+    vider_cache_rotations()
+
+
+def oublier_sprites(type_objet):
+    """
+    Retire des caches les images d'un seul type d'objet (son image dans
+    constantes.images a été rechargée) : les autres restent en cache.
+
+    Args:
+        type_objet (str): "pomme", "bombe"...
+    """
+    anciennes = set()
+    for cle in [cle for cle in _cache_sprites if cle[0] == type_objet]:
+        sprite = _cache_sprites.pop(cle)
+        if isinstance(sprite, dict):
+            anciennes.update(sprite.values())
+        elif sprite is not None:
+            anciennes.add(sprite)
+    # Les miroirs, puis les rotations des images et de leurs miroirs
+    miroirs = [_cache_miroirs.pop(image) for image in anciennes if image in _cache_miroirs]
+    anciennes.update(miroirs)
+    for cle in [cle for cle in _cache_rotations if cle[0] in anciennes]:
+        del _cache_rotations[cle]
+
+
+# ============================================================================
+# CACHE DES ROTATIONS DES MORCEAUX
+# ============================================================================
+# Tourner une image à chaque frame coûte cher. On arrondit l'angle à un
+# nombre limité de "paliers" (voir qualite.reglages["paliers_rotation"]) et on
+# garde chaque image tournée en mémoire.
+# Clé : (image, palier, nombre_de_paliers, lissage)
+# ============================================================================
+_cache_rotations = {}
+# Images miroir (morceau droit) : une seule copie par image
+_cache_miroirs = {}
+
+
+def vider_cache_rotations():
+    """Vide le cache des rotations (à appeler quand la qualité change)."""
+    _cache_rotations.clear()
+
+
+def tailles_caches():
+    """Retourne le nombre d'images de chaque cache (diagnostic mémoire)."""
+    return {
+        "cache_sprites": len(_cache_sprites),
+        "cache_rotations": len(_cache_rotations),
+        "cache_miroirs": len(_cache_miroirs),
+        "cache_cercles": len(_cache_cercles),
+    }
+
+
+def image_tournee(image, angle):
+    """
+    Retourne l'image tournée à l'angle le plus proche d'un palier.
+
+    Args:
+        image (Surface): Image d'origine (partagée, issue du cache de sprites)
+        angle (float): Angle souhaité en degrés
+
+    Retourne:
+        Surface: Image tournée (partagée, ne pas la modifier)
+    """
+    paliers = qualite.reglages["paliers_rotation"]
+    lissage = qualite.reglages["lissage"]
+    pas = 360 / paliers
+    palier = int(round(angle / pas)) % paliers
+
+    cle = (image, palier, paliers, lissage)
+    resultat = _cache_rotations.get(cle)
+    if resultat is None:
+        if lissage:
+            # rotozoom filtre l'image (bords plus doux, plus lent)
+            resultat = pygame.transform.rotozoom(image, palier * pas, 1)
         else:
-            # Mode 1 joueur : position aléatoire sur tout l'écran
-            self.x = random.randint(100, largeur - 100)
-
-        # Position verticale initiale : en haut de l'écran
-        self.y = hauteur
-        # Vitesses initiales (aléatoires pour un mouvement naturel)
-        self.speed_x = random.uniform(-10, 10)  # Vitesse horizontale
-        self.speed_y = random.uniform(
-            -20, -10
-        )  # Vitesse verticale (vers le haut au départ)
-        # Gravité pour simuler la chute
-        self.gravity = gravity
-
-        # Couleur de secours si pas d'image (pour debug)
-        self.color = (255, 0, 0)
-        if self.type == "banane":
-            self.color = (255, 255, 0)
-        elif self.type == "orange":
-            self.color = (255, 165, 0)
-
-    def update(self, largeur_ecran, speed_factor=1):
-        # Mise à jour de la physique du fruit
-        # Application de la gravité à la vitesse verticale
-        self.speed_y += self.gravity * speed_factor
-        # Mise à jour des positions basées sur les vitesses
-        self.x += self.speed_x * speed_factor
-        self.y += self.speed_y * speed_factor
-
-        # Changement d'image pour les fruits avec états (ex: poire)
-        if self.images_set and not self.sliced:
-            if self.speed_y < 0:
-                self.image = self.images_set.get(
-                    "up", self.images_set.get("cut")
-                )  # Fruit montant
-            else:
-                self.image = self.images_set.get(
-                    "down", self.images_set.get("cut")
-                )  # Fruit descendant
-
-        # --- REBONDS SUR LES BORDS DE L'ÉCRAN ---
-        # Bord gauche : rebond si le fruit sort à gauche
-        if self.x - self.radius < 0:
-            self.x = self.radius
-            self.speed_x *= -1  # Inversion de la direction horizontale
-
-        # Bord droit : rebond si le fruit sort à droite
-        if self.x + self.radius > largeur_ecran:
-            self.x = largeur_ecran - self.radius
-            self.speed_x *= -1
-
-        # --- CONFINEMENT AUX ZONES EN MODE 2 JOUEURS ---
-        # Si le fruit est assigné à une zone spécifique (mode 2 joueurs), il ne peut pas traverser le milieu
-        if self.zone_joueur is not None:
-            milieu_x = largeur_ecran // 2
-            if self.zone_joueur == 1:
-                # Zone joueur 1 (gauche) : rebond sur le bord droit de sa zone
-                if self.x + self.radius > milieu_x:
-                    self.x = milieu_x - self.radius
-                    self.speed_x *= -1
-            elif self.zone_joueur == 2:
-                # Zone joueur 2 (droite) : rebond sur le bord gauche de sa zone
-                if self.x - self.radius < milieu_x:
-                    self.x = milieu_x + self.radius
-                    self.speed_x *= -1
+            resultat = pygame.transform.rotate(image, palier * pas)
+        _cache_rotations[cle] = resultat
+    return resultat
 
-    def couper(self):
+
+# ============================================================================
+# OBJETS DU JEU : COMPOSANTS ET SYSTÈMES
+# ============================================================================
+# Avant, chaque objet était une instance de sa classe (Fruit, Glacon, Bombe,
+# MorceauFruit, ParticuleExplosion, ParticuleGlace) qui recopiait presque le
+# même constructeur et le même update(). Maintenant :
+# - Un "magasin" de composants range chaque attribut dans son propre tableau
+#   (x[i], y[i], vx[i]...) : une ligne par objet
+# - Des "systèmes" (gravité, rebonds, zones, fruits ratés, dessin) font une
+#   passe sur toutes les lignes d'un coup
+# - Les sortes d'objets volants sont décrites par des données (GENRES) : un
+#   nouveau genre d'objet n'a pas besoin d'une nouvelle classe
+#
+# Les objets volants gardent une "vue" (ObjetVolant) qui se lit comme les
+# anciennes instances (objet.x, objet.radius, objet.couper()...) : le
+# contrôleur et le bot les utilisent sans connaître les tableaux.
+# ============================================================================
+
+
+# Dessins de secours (objet sans image), en (x, y) sur la surface donnée,
+# tailles multipliées par echelle (voir rendu.FileRendu)
+def _secours_fruit(surface, x, y, echelle, objet):
+    """Dessin de secours d'un fruit sans image : cercle de sa couleur."""
+    couleur = GENRES["fruit"]["couleurs"].get(objet.type, (255, 0, 0))
+    pygame.draw.circle(surface, couleur, (int(x), int(y)), int(objet.radius * echelle))
+
+
+def _secours_glacon(surface, x, y, echelle, objet):
+    """Dessin de secours d'un glaçon : cercle bleu avec reflet."""
+    x, y, reflet = int(x), int(y), int(10 * echelle)
+    pygame.draw.circle(surface, (173, 216, 230), (x, y), int(objet.radius * echelle))
+    pygame.draw.circle(surface, (255, 255, 255), (x - reflet, y - reflet), reflet)
+
+
+def _secours_bombe(surface, x, y, echelle, objet):
+    """Dessin de secours d'une bombe : cercle noir avec mèche."""
+    x, y, rayon = int(x), int(y), int(objet.radius * echelle)
+    meche = int(20 * echelle)
+    pygame.draw.circle(surface, (50, 50, 50), (x, y), rayon)
+    pygame.draw.line(surface, (255, 255, 255), (x, y - rayon), (x, y - rayon - meche), 3)
+
+
+# Genres d'objets volants. Le genre d'un objet est son type s'il est dans ce
+# dictionnaire ("ice", "bombe"), sinon "fruit" ("pomme", "banane"...).
+#   rayon            : rayon de collision (pixels)
+#   hauteur_sprite   : hauteur d'affichage de l'image
+#   vitesse_x/_y     : intervalles des vitesses de lancer
+#   effet            : ce que fait la coupe ("morceaux", "freeze", "explosion")
+#   coute_une_vie    : un objet raté (non tranché) fait perdre une vie
+#   saut_coupe       : vitesse verticale donnée par la coupe (None = aucune)
+#   secours          : dessin quand l'image manque
+GENRES = {
+    "fruit": {
+        "rayon": 60,  # Légèrement réduit pour mieux coller aux fruits fins
+        "hauteur_sprite": 160,
+        "vitesse_x": (-10, 10),
+        "vitesse_y": (-20, -10),
+        "effet": "morceaux",
+        "coute_une_vie": True,
+        "saut_coupe": None,
+        "secours": _secours_fruit,
+        "couleurs": {"banane": (255, 255, 0), "orange": (255, 165, 0)},
+    },
+    "ice": {
+        "rayon": 40,
+        "hauteur_sprite": 120,
+        "vitesse_x": (-8, 8),
+        "vitesse_y": (-18, -12),
+        "effet": "freeze",
+        "coute_une_vie": False,
+        "saut_coupe": -5,  # Petit saut visuel vers le haut après la coupe
+        "secours": _secours_glacon,
+    },
+    "bombe": {
+        "rayon": 40,
+        "hauteur_sprite": 80,
+        "vitesse_x": (-10, 10),
+        "vitesse_y": (-20, -10),
+        "effet": "explosion",
+        "coute_une_vie": False,
+        "saut_coupe": None,
+        "secours": _secours_bombe,
+    },
+}
+
+
+def genre_de(type_objet):
+    """Retourne le genre d'un type d'objet ("pomme" -> "fruit", "ice" -> "ice")."""
+    return type_objet if type_objet in GENRES else "fruit"
+
+
+class Composants:
+    """
+    Magasin de composants : une colonne (tableau) par attribut, une ligne par
+    objet. Les sous-classes listent leurs colonnes.
+
+    Attributs de classe:
+        COLONNES_REELS (tuple): Colonnes de nombres à virgule (array "d")
+        COLONNES_ENTIERS (tuple): Colonnes d'entiers (array "l")
+        COLONNES_OBJETS (tuple): Colonnes d'objets Python (list : images...)
+
+    Attributs:
+        nombre (int): Nombre de lignes (d'objets)
+    """
+
+    COLONNES_REELS = ()
+    COLONNES_ENTIERS = ()
+    COLONNES_OBJETS = ()
+
+    def __init__(self):
+        for nom in self.COLONNES_REELS:
+            setattr(self, nom, array("d"))
+        for nom in self.COLONNES_ENTIERS:
+            setattr(self, nom, array("l"))
+        for nom in self.COLONNES_OBJETS:
+            setattr(self, nom, [])
+        self.nombre = 0
+
+    def __len__(self):
+        return self.nombre
+
+    def _ajouter_ligne(self, valeurs):
         """
-        Méthode appelée lorsque le fruit est tranché par le joueur.
-        
-        CHANGEMENT PAR RAPPORT À L'ANCIENNE VERSION :
-        Avant : Cette méthode changeait simplement l'image du fruit vers "cut"
-        Maintenant : Elle retourne les informations nécessaires pour créer 2 morceaux séparés (objets MorceauFruit)
-        
-        Le fruit original sera supprimé de la liste mes_fruits par le controller,
-        et 2 nouveaux MorceauFruit seront créés à la place.
-        
-        Returns:
-            dict: Dictionnaire contenant les infos pour créer les morceaux
-                - "x": position X du fruit au moment de la coupe
-                - "y": position Y du fruit au moment de la coupe  
-                - "image": l'image "cut" du fruit (moitié)
-                
-            None: Si le fruit n'a pas d'image "cut" disponible
-        
-        Exemple de retour:
-            {
-                "x": 450.5,
-                "y": 320.0,
-                "image": <Surface 80x80>
-            }
+        Ajoute un objet à la fin de toutes les colonnes.
+
+        Args:
+            valeurs (dict): Nom de colonne -> valeur
+
+        Retourne:
+            int: L'indice de la nouvelle ligne
         """
-        # Marque le fruit comme tranché (empêche de le couper à nouveau)
-        self.sliced = True
-
-        # Vérifie si le fruit a un ensemble d'images (avec une version "cut")
-        if self.images_set and "cut" in self.images_set:
-            # Retourne les informations nécessaires pour créer les 2 morceaux
-            return {
-                "x": self.x,           # Position X actuelle du fruit
-                "y": self.y,           # Position Y actuelle du fruit
-                "image": self.images_set["cut"]  # Image de la moitié de fruit
-            }
-        
-        # Si pas d'image "cut", retourne None
-        # Dans ce cas, le controller supprimera simplement le fruit
-        return None
+        for nom, valeur in valeurs.items():
+            getattr(self, nom).append(valeur)
+        self.nombre += 1
+        return self.nombre - 1
 
-    def draw(self, screen):
-        # Affichage du fruit sur l'écran
-        if self.image:
-            # Centrage de l'image sur la position x,y
-            rect = self.image.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.image, rect)
-        else:
-            # Affichage de secours : cercle coloré
-            pygame.draw.circle(
-                screen, self.color, (int(self.x), int(self.y)), self.radius
-            )
+    def _garder(self, indices):
+        """
+        Ne garde que les lignes données, dans le même ordre.
 
+        Args:
+            indices (list): Indices des lignes à garder (croissants)
+        """
+        if len(indices) == self.nombre:
+            return
+        for nom in self.COLONNES_REELS + self.COLONNES_ENTIERS:
+            colonne = getattr(self, nom)
+            colonne[:] = array(colonne.typecode, [colonne[i] for i in indices])
+        for nom in self.COLONNES_OBJETS:
+            colonne = getattr(self, nom)
+            colonne[:] = [colonne[i] for i in indices]
+        self.nombre = len(indices)
 
-class Glacon:
-    def __init__(self, largeur, hauteur, zone_joueur=None, gravity=0.4):
-        self.type = "ice"
-        self.sliced = False
-        self.images_set = None
-        self.zone_joueur = zone_joueur
-
-        self.radius = 40
-        self.color = (173, 216, 230)  # Bleu clair
-
-        # Gestion de l'image du glaçon
-        raw_image = images.get("ice")
-        if raw_image is not None:
-            HAUTEUR_CIBLE = 120
-            ratio = raw_image.get_width() / raw_image.get_height()
-            nouvelle_largeur = int(HAUTEUR_CIBLE * ratio)
-            self.image = pygame.transform.smoothscale(
-                raw_image, (nouvelle_largeur, HAUTEUR_CIBLE)
-            )
-        else:
-            self.image = None
 
-        # Positionnement initial
-        milieu_x = largeur // 2
-        if zone_joueur == 1:
-            self.x = random.randint(100, milieu_x - 100)
-        elif zone_joueur == 2:
-            self.x = random.randint(milieu_x + 100, largeur - 100)
-        else:
-            self.x = random.randint(100, largeur - 100)
-
-        self.y = hauteur
-        self.speed_x = random.uniform(-8, 8)
-        self.speed_y = random.uniform(-18, -12)
-        self.gravity = gravity
-
-    def update(self, largeur_ecran, speed_factor=1):
-        """Met à jour le glaçon"""
-        # Le glaçon est aussi affecté par le speed_factor (il peut s'auto-geler si on veut)
-        self.speed_y += self.gravity * speed_factor
-        self.x += self.speed_x * speed_factor
-        self.y += self.speed_y * speed_factor
-
-        if self.x - self.radius < 0:
-            self.x = self.radius
-            self.speed_x *= -1
-
-        if self.x + self.radius > largeur_ecran:
-            self.x = largeur_ecran - self.radius
-            self.speed_x *= -1
-
-        # Confinement aux zones en mode 2 joueurs
-        if self.zone_joueur is not None:
-            milieu_x = largeur_ecran // 2
-            if self.zone_joueur == 1:
-                if self.x + self.radius > milieu_x:
-                    self.x = milieu_x - self.radius
-                    self.speed_x *= -1
-            elif self.zone_joueur == 2:
-                if self.x - self.radius < milieu_x:
-                    self.x = milieu_x + self.radius
-                    self.speed_x *= -1
-
-    def draw(self, surface):
-        """Afficher l'image si disponible, sinon cercle bleu"""
-        if self.image:
-            rect = self.image.get_rect(center=(int(self.x), int(self.y)))
-            surface.blit(self.image, rect)
-        else:
-            # Fallback : cercle bleu avec reflet
-            pygame.draw.circle(
-                surface, self.color, (int(self.x), int(self.y)), self.radius
-            )
-            pygame.draw.circle(
-                surface, (255, 255, 255), (int(self.x - 10), int(self.y - 10)), 10
-            )
+def systeme_mouvement(composants, indices=None):
+    """
+    Gravité puis déplacement : vy += gravite, x += vx, y += vy.
 
-    # Méthode appelée quand le glaçon est tranché
-    def couper(self):
-        """Méthode appelée quand le glaçon est tranché"""
-        self.sliced = True
-
-        # On peut ajouter un effet visuel ici si besoin
-        self.speed_y = -5  # Petit saut visuel vers le haut après la coupe
-        # Optionnel : changer l'image pour un glaçon brisé si disponible
-        # (non implémenté ici pour simplification)
-
-
-class Bombe:
-    def __init__(self, largeur, hauteur, zone_joueur=None, gravity=0.4):
-        self.type = "bombe"
-        self.sliced = False
-        self.images_set = None
-        self.zone_joueur = zone_joueur
-
-        self.radius = 40
-        self.color = (50, 50, 50)  # Gris foncé (fallback)
-
-        # --- Gestion de l'image bombe.png ---
-        raw_image = images.get("bombe")
-        if raw_image is not None:
-            HAUTEUR_CIBLE = 80
-            ratio = raw_image.get_width() / raw_image.get_height()
-            nouvelle_largeur = int(HAUTEUR_CIBLE * ratio)
-            self.image = pygame.transform.smoothscale(
-                raw_image, (nouvelle_largeur, HAUTEUR_CIBLE)
-            )
+    Args:
+        composants (Composants): Magasin avec les colonnes x, y, vx, vy, gravite
+        indices (list): Lignes à déplacer (None = toutes)
+    """
+    x, y, vx, vy, gravite = (
+        composants.x,
+        composants.y,
+        composants.vx,
+        composants.vy,
+        composants.gravite,
+    )
+    for i in range(composants.nombre) if indices is None else indices:
+        vy[i] += gravite[i]
+        x[i] += vx[i]
+        y[i] += vy[i]
+
+
+# ============================================================================
+# OBJETS VOLANTS (fruits, glaçons, bombes)
+# ============================================================================
+class ObjetsVolants(Composants):
+    """
+    Les objets lancés à l'écran.
+
+    Se parcourt comme l'ancienne liste mes_fruits : for objet in objets,
+    len(objets), objets[:], objets.remove(objet). Chaque élément est une vue
+    (ObjetVolant) sur sa ligne.
+
+    Un objet retiré (remove) n'est d'abord que marqué : toutes les lignes
+    marquées sont enlevées en un seul _garder au prochain accès (nombre,
+    len, parcours), donc une fois pour tout un combo, dans le même ordre.
+
+    Attributs:
+        analytique (bool): Trajectoires analytiques (voir trajectoires.py) :
+            les positions sont calculées depuis les segments et l'âge, et
+            chaque changement de vitesse ou de position commence un segment
+        retires (list): Lignes marquées, pas encore enlevées
+    """
+
+    COLONNES_REELS = ("x", "y", "vx", "vy", "gravite", "rayon")
+    # descente : sens de l'image affichée (0 = "up", 1 = "down"), lu par physique.py
+    # age : frames vécues hors freeze ; segments : (age, x, y, vx, vy) du
+    # lancer puis de chaque rebond (voir trajectoires.py)
+    COLONNES_ENTIERS = ("zone", "tranche", "descente", "age")
+    COLONNES_OBJETS = ("genre", "type", "sprite", "image", "vues", "segments")
+
+    def __init__(self, analytique=False):
+        super().__init__()
+        self.analytique = analytique
+        self.retires = []
+        # Dernières valeurs des objets retirés (un seul magasin, voir _detacher)
+        self._cimetiere = None
+
+    @property
+    def nombre(self):
+        """Nombre d'objets (les lignes marquées sont enlevées d'abord)."""
+        if self.retires:
+            self._compacter()
+        return self._nombre
+
+    @nombre.setter
+    def nombre(self, valeur):
+        self._nombre = valeur
+
+    def creer(self, type_objet, largeur, hauteur, zone_joueur=None, gravite=0.4, rng=None):
+        """
+        Lance un nouvel objet depuis le bas de l'écran.
+
+        Args:
+            type_objet (str): "pomme", "banane"... ou "ice", "bombe"
+            largeur, hauteur (int): Taille du terrain de jeu
+            zone_joueur (int): 1 (gauche), 2 (droite) ou None (mode 1 joueur)
+            gravite (float): Gravité appliquée à l'objet
+            rng (Random): Générateur aléatoire de la partie (module random par défaut)
+
+        Retourne:
+            ObjetVolant: La vue du nouvel objet
+        """
+        rng = rng or random
+        genre = genre_de(type_objet)
+        donnees = GENRES[genre]
+
+        # Les images redimensionnées viennent du cache de sprites : le
+        # smoothscale n'est fait qu'une seule fois par type
+        sprite = obtenir_sprite(type_objet, donnees["hauteur_sprite"])
+        if isinstance(sprite, dict):
+            # Plusieurs états (ex: poire avec "up", "down", "cut") : on part en montant
+            image = sprite.get("up", sprite.get("cut"))
         else:
-            self.image = None
+            image = sprite
 
-        # --- Positionnement (même logique que Fruit) ---
+        # Position de départ selon la zone du joueur
         milieu_x = largeur // 2
         if zone_joueur == 1:
-            self.x = random.randint(100, milieu_x - 100)
+            x = rng.randint(100, milieu_x - 100)
         elif zone_joueur == 2:
-            self.x = random.randint(milieu_x + 100, largeur - 100)
-        else:
-            self.x = random.randint(100, largeur - 100)
-
-        self.y = hauteur
-        self.speed_x = random.uniform(-10, 10)
-        self.speed_y = random.uniform(-20, -10)
-        self.gravity = gravity
-
-    def update(self, largeur_ecran, speed_factor=1):
-        """Met à jour la bombe"""
-        self.speed_y += self.gravity * speed_factor
-        self.x += self.speed_x * speed_factor
-        self.y += self.speed_y * speed_factor
-
-        # Rebonds
-        if self.x - self.radius < 0:
-            self.x = self.radius
-            self.speed_x *= -1
-
-        if self.x + self.radius > largeur_ecran:
-            self.x = largeur_ecran - self.radius
-            self.speed_x *= -1
-
-        # Confinement aux zones
-        if self.zone_joueur is not None:
-            milieu_x = largeur_ecran // 2
-            if self.zone_joueur == 1:
-                if self.x + self.radius > milieu_x:
-                    self.x = milieu_x - self.radius
-                    self.speed_x *= -1
-            elif self.zone_joueur == 2:
-                if self.x - self.radius < milieu_x:
-                    self.x = milieu_x + self.radius
-                    self.speed_x *= -1
-
-    def draw(self, surface):
-        """Affiche la bombe"""
-        if self.image:
-            rect = self.image.get_rect(center=(int(self.x), int(self.y)))
-            surface.blit(self.image, rect)
+            x = rng.randint(milieu_x + 100, largeur - 100)
         else:
-            # Fallback : cercle noir avec mèche
-            pygame.draw.circle(
-                surface, self.color, (int(self.x), int(self.y)), self.radius
-            )
-            # Mèche blanche
-            pygame.draw.line(
-                surface,
-                (255, 255, 255),
-                (int(self.x), int(self.y) - self.radius),
-                (int(self.x), int(self.y) - self.radius - 20),
-                3,
-            )
+            x = rng.randint(100, largeur - 100)
 
-    def couper(self):
-        """Méthode appelée quand la bombe est tranchée"""
-        self.sliced = True
+        vx = rng.uniform(*donnees["vitesse_x"])
+        vy = rng.uniform(*donnees["vitesse_y"])  # Vers le haut au départ
 
-class MorceauFruit:
-    """
-    Représente un morceau de fruit après tranchage.
-    
-    Attributs:
-        x, y (float): Position du morceau sur l'écran
-        image (Surface): Image du morceau (moitié de fruit)
-        alpha (int): Opacité actuelle (255 = opaque, 0 = invisible)
-        speed_x, speed_y (float): Vitesses horizontale et verticale
-        gravity (float): Force de gravité appliquée
-        angle (float): Angle de rotation actuel en degrés
-        rotation_speed (float): Vitesse de rotation en degrés par frame
-        fade_speed (int): Vitesse de disparition (réduction d'alpha par frame)
-    """
+        vue = ObjetVolant(self, self.nombre)
+        self._ajouter_ligne(
+            {
+                "x": x,
+                "y": hauteur,
+                "vx": vx,
+                "vy": vy,
+                "gravite": gravite,
+                "rayon": donnees["rayon"],
+                "zone": zone_joueur or 0,
+                "tranche": 0,
+                "descente": 0,
+                "age": 0,
+                "genre": genre,
+                "type": type_objet,
+                "sprite": sprite,
+                "image": image,
+                "vues": vue,
+                "segments": [(0, x, hauteur, vx, vy)],
+            }
+        )
+        return vue
+
+    def __iter__(self):
+        if self.retires:
+            self._compacter()
+        return iter(self.vues)
+
+    def __getitem__(self, indice):
+        if self.retires:
+            self._compacter()
+        return self.vues[indice]
 
-    def __init__(self, x, y, image, direction="gauche"):
+    def remove(self, vue):
         """
-        Crée un nouveau morceau de fruit.
-        
+        Retire un objet (tranché). La ligne est seulement marquée (voir la
+        docstring de la classe). La vue reste lisible jusqu'à la frame
+        suivante : elle garde ses dernières valeurs (voir _detacher).
+
         Args:
-            x (float): Position X initiale (position du fruit au moment de la coupe)
-            y (float): Position Y initiale (position du fruit au moment de la coupe)
-            image (Surface): Image du fruit coupé (sera inversée si direction="droite")
-            direction (str): "gauche" ou "droite" - détermine le sens de déplacement
-        
-        Exemple d'utilisation:
-            # Quand un fruit est coupé, on crée 2 morceaux :
-            morceau_gauche = MorceauFruit(fruit.x, fruit.y, image_cut, "gauche")
-            morceau_droite = MorceauFruit(fruit.x, fruit.y, image_cut, "droite")
+            vue (ObjetVolant): L'objet à retirer
         """
-        
-        # Les 2 morceaux démarrent au même endroit (là où était le fruit)
-        self.x = x
-        self.y = y
-
-        # ====================================================================
-        # GESTION DE L'IMAGE SELON LA DIRECTION
-        # ====================================================================
-        # Pour le morceau GAUCHE : on garde l'image telle quelle
-        # Pour le morceau DROIT : on inverse l'image horizontalement (miroir)
-        # Cela donne l'illusion de 2 moitiés différentes !
-        #
-        # pygame.transform.flip(image, flip_x, flip_y)
-        #   - flip_x = True  → inverse horizontalement (effet miroir)
-        #   - flip_y = False → pas d'inversion verticale
-        if direction == "gauche":
-            self.image = image
-        else:
-            # Crée une copie inversée horizontalement pour le morceau droit
-            self.image = pygame.transform.flip(image, True, False)
-
-        # ====================================================================
-        # OPACITÉ POUR L'EFFET FADE OUT
-        # ====================================================================
-        # L'alpha va de 255 (totalement visible) à 0 (invisible)
-        # On le diminue progressivement à chaque frame
-        self.alpha = 255
-
-        # ====================================================================
-        # PHYSIQUE DU MORCEAU - VITESSES
-        # ====================================================================
-        # Les vitesses sont OPPOSÉES selon la direction pour créer l'effet
-        # de séparation (les 2 morceaux s'écartent l'un de l'autre)
-        #
-        # random.uniform(a, b) retourne un nombre décimal aléatoire entre a et b
-        # Cela ajoute de la variété à chaque coupe !
-        if direction == "gauche":
-            # Morceau gauche : va vers la GAUCHE (vitesse X négative)
-            self.speed_x = random.uniform(-6, -3)
-            # Rotation dans le sens anti-horaire (négatif)
-            self.rotation_speed = random.uniform(-8, -4)
-        else:
-            # Morceau droit : va vers la DROITE (vitesse X positive)
-            self.speed_x = random.uniform(3, 6)
-            # Rotation dans le sens horaire (positif)
-            self.rotation_speed = random.uniform(4, 8)
-
-        # Vitesse verticale initiale : légèrement vers le HAUT
-        # Cela crée un petit "saut" avant que la gravité ne fasse retomber le morceau
-        # Valeur négative = vers le haut (en pygame, Y augmente vers le bas)
-        self.speed_y = random.uniform(-10, -5)
-
-        # ====================================================================
-        # PHYSIQUE DU MORCEAU - GRAVITÉ
-        # ====================================================================
-        # La gravité est ajoutée à speed_y à chaque frame
-        # Plus la valeur est grande, plus le morceau tombe vite
-        self.gravity = 0.6
-
-        # ====================================================================
-        # ROTATION
-        # ====================================================================
-        # L'angle de rotation commence à 0° et change à chaque frame
-        # selon rotation_speed (défini ci-dessus selon la direction)
-        self.angle = 0
-
-        # ====================================================================
-        # VITESSE DE DISPARITION (FADE OUT)
-        # ====================================================================
-        # À chaque frame, on soustrait fade_speed à alpha
-        # Avec alpha=255 et fade_speed=6, le morceau disparaît en ~42 frames
-        # À 60 FPS, cela fait environ 0.7 secondes
-        # 
-        # on peut ajuster cette valeur :
-        #   - Plus grand (ex: 10) = disparition plus rapide
-        #   - Plus petit (ex: 3) = disparition plus lente
-        self.fade_speed = 6
-
-    def update(self):
+        indice = vue.index
+        self._detacher(indice)
+        self.retires.append(indice)
+
+    def _compacter(self):
+        """Enlève en une fois toutes les lignes marquées par remove()."""
+        retires = set(self.retires)
+        self.retires = []
+        self._garder([i for i in range(self._nombre) if i not in retires])
+
+    def _detacher(self, indice):
+        """
+        Copie la ligne à la fin du cimetière, un magasin partagé par tous les
+        objets retirés, et y rattache sa vue.
         """
-        Met à jour la physique du morceau à chaque frame.
-        
-        Cette méthode doit être appelée une fois par frame dans la boucle
-        principale du jeu. Elle gère :
-            1. La gravité (le morceau accélère vers le bas)
-            2. Le déplacement (position mise à jour selon les vitesses)
-            3. La rotation (l'angle augmente/diminue)
-            4. Le fade out (l'opacité diminue progressivement)
-        
-        Note: Pas besoin de passer de paramètres, tout est géré en interne.
+        if self._cimetiere is None:
+            self._cimetiere = ObjetsVolants(self.analytique)
+        cimetiere = self._cimetiere
+        colonnes = self.COLONNES_REELS + self.COLONNES_ENTIERS + self.COLONNES_OBJETS
+        vue = self.vues[indice]
+        vue.composants = cimetiere
+        vue.index = cimetiere._ajouter_ligne({nom: getattr(self, nom)[indice] for nom in colonnes})
+
+    def oublier_retires(self):
         """
-        # ====================================================================
-        # ÉTAPE 1 : APPLIQUER LA GRAVITÉ
-        # ====================================================================
-        # On ajoute la gravité à la vitesse verticale
-        # Cela simule l'accélération de la chute (comme dans la vraie vie !)
-        # Chaque frame, le morceau tombe un peu plus vite
-        self.speed_y += self.gravity
-
-        # ====================================================================
-        # ÉTAPE 2 : METTRE À JOUR LA POSITION
-        # ====================================================================
-        # On déplace le morceau selon ses vitesses actuelles
-        # speed_x déplace horizontalement (gauche/droite)
-        # speed_y déplace verticalement (haut/bas)
-        self.x += self.speed_x
-        self.y += self.speed_y
-
-        # ====================================================================
-        # ÉTAPE 3 : METTRE À JOUR LA ROTATION
-        # ====================================================================
-        # On ajoute la vitesse de rotation à l'angle actuel
-        # Le morceau tourne continuellement sur lui-même
-        self.angle += self.rotation_speed
-
-        # ====================================================================
-        # ÉTAPE 4 : APPLIQUER LE FADE OUT
-        # ====================================================================
-        # On diminue l'opacité progressivement
-        # max(0, ...) empêche alpha de devenir négatif
-        # Une fois à 0, le morceau est complètement invisible
-        self.alpha = max(0, self.alpha - self.fade_speed)
-
-    def draw(self, screen):
+        Vide le cimetière (début de frame) : les vues des objets retirés
+        avant ne doivent plus être lues.
         """
-        Dessine le morceau sur l'écran avec rotation et transparence.
-        
-        Cette méthode doit être appelée une fois par frame, APRÈS update().
-        Elle gère :
-            1. La rotation de l'image
-            2. L'application de la transparence (alpha)
-            3. Le centrage correct de l'image
-        
+        if self._cimetiere is not None and self._cimetiere.nombre:
+            self._cimetiere._garder([])
+
+    def _rebaser(self, indice):
+        """Mode analytique : la position ou la vitesse a changé, nouveau segment."""
+        if self.analytique:
+            self.segments[indice].append(
+                (self.age[indice], self.x[indice], self.y[indice], self.vx[indice], self.vy[indice])
+            )
+
+    def dessiner(self, file):
+        """
+        Ajoute les objets à la file d'affichage de leur couche (voir rendu.FileRendu).
+
         Args:
-            screen (Surface): L'écran pygame sur lequel dessiner
-        
-        Note: Si alpha <= 0, rien n'est dessiné (optimisation)
+            file (FileRendu): File de la couche des fruits
         """
-        # Si le morceau est complètement invisible, on ne dessine rien
-        # Cela évite des calculs inutiles
-        if self.alpha <= 0:
-            return
+        x, y, image = self.x, self.y, self.image
+        for i in range(self.nombre):
+            if image[i]:
+                file.ajouter(image[i], x[i], y[i])
+            else:
+                # Pas d'image : dessin de secours, fait avec la couche (en
+                # mode 2 joueurs, par le thread de la zone, après son fond)
+                file.ajouter_dessin(GENRES[self.genre[i]]["secours"], x[i], y[i], self.vues[i])
+
+    def _garder(self, indices):
+        super()._garder(indices)
+        for i, vue in enumerate(self.vues):
+            vue.index = i
+
 
-        # ====================================================================
-        # ÉTAPE 1 : ROTATION DE L'IMAGE
-        # ====================================================================
-        # pygame.transform.rotate(image, angle) retourne une NOUVELLE image
-        # tournée de 'angle' degrés dans le sens anti-horaire
-        # 
-        # ATTENTION : La rotation change la taille de l'image !
-        # Une image 100x100 tournée de 45° devient ~141x141
-        # C'est pour ça qu'on recalcule le rect après
-        image_tournee = pygame.transform.rotate(self.image, self.angle)
-
-        # ====================================================================
-        # ÉTAPE 2 : APPLICATION DE LA TRANSPARENCE
-        # ====================================================================
-        # Pour appliquer l'alpha à une image, on doit d'abord la convertir
-        # avec convert_alpha() pour supporter la transparence par pixel
-        #
-        # IMPORTANT : On crée une copie pour ne pas modifier l'original
-        # car set_alpha() modifie l'image en place
-        image_avec_alpha = image_tournee.copy()
-        image_avec_alpha.set_alpha(self.alpha)
-
-        # ====================================================================
-        # ÉTAPE 3 : CENTRAGE ET AFFICHAGE
-        # ====================================================================
-        # On récupère le rectangle de l'image et on le centre sur (x, y)
-        # Cela garantit que la rotation se fait autour du centre du morceau
-        # (sinon l'image "sauterait" à chaque changement d'angle)
-        rect = image_avec_alpha.get_rect(center=(int(self.x), int(self.y)))
-
-        # On dessine l'image sur l'écran à la position calculée
-        screen.blit(image_avec_alpha, rect)
-
-    def est_termine(self):
+class ObjetVolant:
+    """
+    Vue sur une ligne d'ObjetsVolants, avec les noms des anciennes classes.
+
+    Attributs:
+        composants (ObjetsVolants): Le magasin de l'objet
+        index (int): Sa ligne dans le magasin
+    """
+
+    __slots__ = ("composants", "index")
+
+    def __init__(self, composants, index):
+        self.composants = composants
+        self.index = index
+
+    @property
+    def x(self):
+        return self.composants.x[self.index]
+
+    @x.setter
+    def x(self, valeur):
+        self.composants.x[self.index] = valeur
+        self.composants._rebaser(self.index)
+
+    @property
+    def y(self):
+        return self.composants.y[self.index]
+
+    @y.setter
+    def y(self, valeur):
+        self.composants.y[self.index] = valeur
+        self.composants._rebaser(self.index)
+
+    @property
+    def speed_x(self):
+        return self.composants.vx[self.index]
+
+    @speed_x.setter
+    def speed_x(self, valeur):
+        self.composants.vx[self.index] = valeur
+        self.composants._rebaser(self.index)
+
+    @property
+    def speed_y(self):
+        return self.composants.vy[self.index]
+
+    @speed_y.setter
+    def speed_y(self, valeur):
+        self.composants.vy[self.index] = valeur
+        self.composants._rebaser(self.index)
+
+    @property
+    def gravity(self):
+        return self.composants.gravite[self.index]
+
+    @property
+    def radius(self):
+        return self.composants.rayon[self.index]
+
+    @property
+    def age(self):
+        """Frames vécues hors freeze (mode analytique, 0 sinon ; voir trajectoires.py)."""
+        return self.composants.age[self.index]
+
+    @property
+    def segments(self):
+        """Segments de trajectoire (age, x, y, vx, vy), du lancer au dernier rebond."""
+        return self.composants.segments[self.index]
+
+    @property
+    def zone_joueur(self):
+        """1 (gauche), 2 (droite) ou None (mode 1 joueur)."""
+        return self.composants.zone[self.index] or None
+
+    @property
+    def sliced(self):
+        return bool(self.composants.tranche[self.index])
+
+    @property
+    def genre(self):
+        """"fruit", "ice" ou "bombe" (voir GENRES)."""
+        return self.composants.genre[self.index]
+
+    @property
+    def effet(self):
+        """Effet de la coupe : "morceaux", "freeze" ou "explosion"."""
+        return GENRES[self.composants.genre[self.index]]["effet"]
+
+    @property
+    def type(self):
+        return self.composants.type[self.index]
+
+    @property
+    def image(self):
+        return self.composants.image[self.index]
+
+    @property
+    def images_set(self):
+        """Images des états ("up", "down", "cut") ou None pour une image simple."""
+        sprite = self.composants.sprite[self.index]
+        return sprite if isinstance(sprite, dict) else None
+
+    def couper(self):
         """
-        Vérifie si le morceau doit être supprimé.
-        
-        Un morceau est considéré comme "terminé" quand il est devenu
-        complètement invisible (alpha <= 0). À ce moment, il peut être
-        retiré de la liste des morceaux pour libérer de la mémoire.
-        
-        Returns:
-            bool: True si le morceau est invisible et doit être supprimé, False sinon
-        
-        Exemple d'utilisation dans la boucle principale:
-            # Supprimer les morceaux terminés
-            morceaux_fruits = [m for m in morceaux_fruits if not m.est_termine()]
+        Marque l'objet comme tranché.
+
+        Retourne:
+            dict: {"x", "y", "image"} pour créer les 2 morceaux (image "cut"),
+            ou None si l'objet n'a pas d'image "cut" (glaçon, bombe...)
         """
-        return self.alpha <= 0
-    
+        composants, i = self.composants, self.index
+        composants.tranche[i] = 1
+        saut = GENRES[composants.genre[i]]["saut_coupe"]
+        if saut is not None:
+            composants.vy[i] = saut
+            composants._rebaser(i)
+
+        images_set = self.images_set
+        if images_set and "cut" in images_set:
+            return {"x": composants.x[i], "y": composants.y[i], "image": images_set["cut"]}
+        return None
+
+
+def systeme_etats_sprite(objets, indices):
+    """
+    Image "up" en montant, "down" en descendant (objets à plusieurs états).
+
+    Args:
+        objets (ObjetsVolants): Les objets
+        indices (list): Lignes déplacées cette frame
+    """
+    sprite, image, vy, tranche = objets.sprite, objets.image, objets.vy, objets.tranche
+    for i in indices:
+        etats = sprite[i]
+        if isinstance(etats, dict) and not tranche[i]:
+            image[i] = etats.get("up" if vy[i] < 0 else "down", etats.get("cut"))
+
+
+def systeme_rebonds(objets, indices, largeur_ecran):
+    """
+    Rebonds sur les bords de l'écran, puis sur le milieu en mode 2 joueurs :
+    un objet assigné à une zone ne peut pas la quitter.
+
+    Args:
+        objets (ObjetsVolants): Les objets
+        indices (list): Lignes déplacées cette frame
+        largeur_ecran (int): Largeur du terrain de jeu
+    """
+    x, vx, rayon, zone = objets.x, objets.vx, objets.rayon, objets.zone
+    milieu_x = largeur_ecran // 2
+    for i in indices:
+        r = rayon[i]
+        # Bords gauche et droit : inversion de la direction horizontale
+        if x[i] - r < 0:
+            x[i] = r
+            vx[i] *= -1
+        if x[i] + r > largeur_ecran:
+            x[i] = largeur_ecran - r
+            vx[i] *= -1
+
+        # Confinement aux zones (mode 2 joueurs)
+        if zone[i] == 1:
+            if x[i] + r > milieu_x:
+                x[i] = milieu_x - r
+                vx[i] *= -1
+        elif zone[i] == 2:
+            if x[i] - r < milieu_x:
+                x[i] = milieu_x + r
+                vx[i] *= -1
+
+
+def systeme_rates(objets, limite_y):
+    """
+    Retire les objets tombés sous la limite.
+
+    Args:
+        objets (ObjetsVolants): Les objets
+        limite_y (float): Ordonnée au-delà de laquelle l'objet est raté
+
+    Retourne:
+        list: Les vues des objets retirés, dans l'ordre (lisibles jusqu'à la
+        frame suivante)
+    """
+    y = objets.y
+    if physique.utiliser(objets, physique.SEUIL_OBJETS):
+        rates = physique.indices_rates(objets, limite_y)
+    else:
+        rates = [i for i in range(objets.nombre) if y[i] > limite_y]
+    if not rates:
+        return []
+    vues = [objets.vues[i] for i in rates]
+    for i in rates:
+        objets._detacher(i)
+    objets._garder([i for i in range(objets.nombre) if y[i] <= limite_y])
+    return vues
+
+
 # ============================================================================
-# CLASSE : ParticuleExplosion
+# MORCEAUX DE FRUITS
 # ============================================================================
-class ParticuleExplosion:
-    """Particule pour l'animation d'explosion de la bombe"""
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        # Vitesse aléatoire dans toutes les directions
-        angle = random.uniform(0, 2 * 3.14159)
-        vitesse = random.uniform(5, 15)
-        self.speed_x = vitesse * math.cos(angle)
-        self.speed_y = vitesse * math.sin(angle)
-        self.gravity = 0.3
-        # Taille qui diminue
-        self.taille = random.randint(8, 20)
-        # Couleur orange/rouge/jaune
-        self.couleur = random.choice([
-            (255, 100, 0),   # Orange
-            (255, 50, 0),    # Rouge-orange
-            (255, 200, 0),   # Jaune
-            (200, 50, 0),    # Rouge foncé
-        ])
-        self.alpha = 255
-        self.duree_vie = random.randint(30, 60)  # Frames
-        self.age = 0
-    
-    def update(self):
-        self.speed_y += self.gravity
-        self.x += self.speed_x
-        self.y += self.speed_y
-        self.age += 1
-        # Fade out progressif
-        self.alpha = max(0, 255 - (self.age * 255 // self.duree_vie))
-        self.taille = max(1, self.taille - 0.3)
-    
-    def draw(self, surface):
-        if self.alpha > 0:
-            s = pygame.Surface((int(self.taille * 2), int(self.taille * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*self.couleur, self.alpha), 
-            (int(self.taille), int(self.taille)), int(self.taille))
-            surface.blit(s, (int(self.x - self.taille), int(self.y - self.taille)))
-    
-    def est_termine(self):
-        return self.age >= self.duree_vie
+# Réduction de l'opacité par frame : 255 / 6 = ~42 frames (0,7 s à 60 FPS)
+VITESSE_FONDU = 6
+
+
+class Morceaux(Composants):
+    """
+    Les moitiés de fruits tranchés : elles s'écartent, tournent et
+    disparaissent en fondu.
+    """
+
+    COLONNES_REELS = ("x", "y", "vx", "vy", "gravite", "angle", "vitesse_rotation")
+    COLONNES_ENTIERS = ("alpha",)
+    COLONNES_OBJETS = ("image",)
+
+    def creer(self, x, y, image, direction="gauche", rng=None):
+        """
+        Ajoute un morceau de fruit.
+
+        Args:
+            x, y (float): Position du fruit au moment de la coupe
+            image (Surface): Image "cut" du fruit (en miroir pour le morceau droit)
+            direction (str): "gauche" ou "droite" - sens de déplacement
+            rng (Random): Générateur aléatoire des effets (module random par défaut)
+        """
+        rng = rng or random
+
+        if direction == "gauche":
+            # Vers la gauche, rotation anti-horaire
+            vx = rng.uniform(-6, -3)
+            vitesse_rotation = rng.uniform(-8, -4)
+        else:
+            # Copie inversée horizontalement (calculée une fois par image)
+            if image not in _cache_miroirs:
+                _cache_miroirs[image] = pygame.transform.flip(image, True, False)
+            image = _cache_miroirs[image]
+            # Vers la droite, rotation horaire
+            vx = rng.uniform(3, 6)
+            vitesse_rotation = rng.uniform(4, 8)
+
+        # Petit saut vers le haut avant de retomber
+        vy = rng.uniform(-10, -5)
+
+        self._ajouter_ligne(
+            {
+                "x": x,
+                "y": y,
+                "vx": vx,
+                "vy": vy,
+                "gravite": 0.6,
+                "angle": 0,
+                "vitesse_rotation": vitesse_rotation,
+                "alpha": 255,
+                "image": image,
+            }
+        )
+
+    def mettre_a_jour(self):
+        """Physique, rotation et fondu, puis retrait des morceaux invisibles."""
+        if physique.utiliser(self, physique.SEUIL_MORCEAUX):
+            self._garder(physique.mettre_a_jour_morceaux(self, VITESSE_FONDU))
+            return
+        systeme_mouvement(self)
+        angle, vitesse_rotation, alpha = self.angle, self.vitesse_rotation, self.alpha
+        for i in range(self.nombre):
+            angle[i] += vitesse_rotation[i]
+            alpha[i] = max(0, alpha[i] - VITESSE_FONDU)
+        self._garder([i for i in range(self.nombre) if alpha[i] > 0])
+
+    def dessiner(self, file):
+        """
+        Ajoute les morceaux (tournés, transparents) à la file de leur couche.
+
+        Args:
+            file (FileRendu): File de la couche des morceaux
+        """
+        x, y, angle, alpha, image = self.x, self.y, self.angle, self.alpha, self.image
+        for i in range(self.nombre):
+            if alpha[i] <= 0:
+                continue
+            # Rotation au palier le plus proche (cache) ; la file applique la
+            # transparence sur une copie, sans modifier l'image partagée
+            file.ajouter(image_tournee(image[i], angle[i]), x[i], y[i], alpha[i])
 
 
 # ============================================================================
-# CLASSE : ParticuleGlace
+# PARTICULES (explosion de la bombe, éclats du glaçon)
 # ============================================================================
-class ParticuleGlace:
-    """Particule pour l'animation de brisure du glaçon (éclats de glace)"""
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        # Vitesse aléatoire (plus lente que l'explosion)
-        angle = random.uniform(0, 2 * 3.14159)
-        vitesse = random.uniform(3, 8)
-        self.speed_x = vitesse * math.cos(angle)
-        self.speed_y = vitesse * math.sin(angle) - 3  # Légèrement vers le haut
-        self.gravity = 0.2
-        # Taille variable pour les éclats
-        self.taille = random.randint(5, 15)
-        # Nuances de bleu clair / blanc
-        self.couleur = random.choice([
-            (173, 216, 230),  # Bleu clair
-            (200, 230, 255),  # Bleu très clair
-            (255, 255, 255),  # Blanc
-            (135, 206, 250),  # Bleu ciel
-        ])
-        self.alpha = 255
-        self.duree_vie = random.randint(40, 70)
-        self.age = 0
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-10, 10)
-    
-    def update(self):
-        self.speed_y += self.gravity
-        self.x += self.speed_x
-        self.y += self.speed_y
-        self.rotation += self.rotation_speed
-        self.age += 1
-        self.alpha = max(0, 255 - (self.age * 255 // self.duree_vie))
-    
-    def draw(self, surface):
-        if self.alpha > 0:
-            # Dessine un losange (éclat de glace)
-            s = pygame.Surface((int(self.taille * 2), int(self.taille * 2)), pygame.SRCALPHA)
-            points = [
-                (self.taille, 0),
-                (self.taille * 2, self.taille),
-                (self.taille, self.taille * 2),
-                (0, self.taille)
-            ]
-            pygame.draw.polygon(s, (*self.couleur, self.alpha), points)
-            # Rotation
-            s = pygame.transform.rotate(s, self.rotation)
-            rect = s.get_rect(center=(int(self.x), int(self.y)))
-            surface.blit(s, rect)
-    
-    def est_termine(self):
-        return self.age >= self.duree_vie
\ No newline at end of file
+# Cercles déjà dessinés, clé : (couleur, rayon, palier d'alpha)
+_cache_cercles = {}
+
+COULEURS_EXPLOSION = [
+    (255, 100, 0),  # Orange
+    (255, 50, 0),  # Rouge-orange
+    (255, 200, 0),  # Jaune
+    (200, 50, 0),  # Rouge foncé
+]
+COULEURS_GLACE = [
+    (173, 216, 230),  # Bleu clair
+    (200, 230, 255),  # Bleu très clair
+    (255, 255, 255),  # Blanc
+    (135, 206, 250),  # Bleu ciel
+]
+
+
+class Particules(Composants):
+    """
+    Particules d'une forme :
+    - "cercle" : explosion de la bombe (cercles qui rétrécissent)
+    - "eclat"  : brisure du glaçon (losanges qui tournent)
+
+    Attributs:
+        forme (str): "cercle" ou "eclat"
+    """
+
+    COLONNES_REELS = (
+        "x",
+        "y",
+        "vx",
+        "vy",
+        "gravite",
+        "taille",
+        "rotation",
+        "vitesse_rotation",
+    )
+    COLONNES_ENTIERS = ("alpha", "age", "duree_vie")
+    COLONNES_OBJETS = ("couleur",)
+
+    def __init__(self, forme):
+        super().__init__()
+        self.forme = forme
+
+    def creer(self, x, y, rng=None):
+        """
+        Ajoute une particule partant de (x, y) dans une direction au hasard.
+
+        Args:
+            x, y (float): Point de départ (explosion, glaçon tranché)
+            rng (Random): Générateur aléatoire des effets (module random par défaut)
+        """
+        rng = rng or random
+        angle = rng.uniform(0, 2 * 3.14159)
+        if self.forme == "cercle":
+            vitesse = rng.uniform(5, 15)
+            vx = vitesse * math.cos(angle)
+            vy = vitesse * math.sin(angle)
+            gravite = 0.3
+            taille = rng.randint(8, 20)  # Taille qui diminue
+            couleur = rng.choice(COULEURS_EXPLOSION)
+            duree_vie = rng.randint(30, 60)  # Frames
+            rotation = vitesse_rotation = 0
+        else:
+            # Plus lent que l'explosion, légèrement vers le haut
+            vitesse = rng.uniform(3, 8)
+            vx = vitesse * math.cos(angle)
+            vy = vitesse * math.sin(angle) - 3
+            gravite = 0.2
+            taille = rng.randint(5, 15)
+            couleur = rng.choice(COULEURS_GLACE)
+            duree_vie = rng.randint(40, 70)
+            rotation = rng.uniform(0, 360)
+            vitesse_rotation = rng.uniform(-10, 10)
+
+        self._ajouter_ligne(
+            {
+                "x": x,
+                "y": y,
+                "vx": vx,
+                "vy": vy,
+                "gravite": gravite,
+                "taille": taille,
+                "rotation": rotation,
+                "vitesse_rotation": vitesse_rotation,
+                "alpha": 255,
+                "age": 0,
+                "duree_vie": duree_vie,
+                "couleur": couleur,
+            }
+        )
+
+    def mettre_a_jour(self):
+        """Physique, vieillissement (fondu), puis retrait des particules finies."""
+        systeme_mouvement(self)
+        age, duree_vie, alpha = self.age, self.duree_vie, self.alpha
+        for i in range(self.nombre):
+            age[i] += 1
+            alpha[i] = max(0, 255 - (age[i] * 255 // duree_vie[i]))
+        if self.forme == "cercle":
+            taille = self.taille
+            for i in range(self.nombre):
+                taille[i] = max(1, taille[i] - 0.3)
+        else:
+            rotation, vitesse_rotation = self.rotation, self.vitesse_rotation
+            for i in range(self.nombre):
+                rotation[i] += vitesse_rotation[i]
+        self._garder([i for i in range(self.nombre) if age[i] < duree_vie[i]])
+
+    def dessiner(self, file):
+        """
+        Ajoute les particules visibles à la file de leur couche.
+
+        Args:
+            file (FileRendu): File de la couche des particules
+        """
+        x, y, alpha = self.x, self.y, self.alpha
+        for i in range(self.nombre):
+            if alpha[i] > 0:
+                file.ajouter(self._image(i), x[i], y[i])
+
+    def _image(self, i):
+        """Retourne l'image de la particule i."""
+        taille, couleur, alpha = self.taille[i], self.couleur[i], self.alpha[i]
+        if self.forme == "cercle":
+            # L'alpha est arrondi par paliers de 16 : les particules de même
+            # couleur et taille partagent la même petite surface
+            cle = (couleur, int(taille), alpha // 16)
+            s = _cache_cercles.get(cle)
+            if s is None:
+                rayon = int(taille)
+                s = pygame.Surface((rayon * 2, rayon * 2), pygame.SRCALPHA)
+                pygame.draw.circle(s, (*couleur, (alpha // 16) * 16), (rayon, rayon), rayon)
+                _cache_cercles[cle] = s
+            return s
+
+        # Losange (éclat de glace), tourné
+        taille = int(taille)
+        s = pygame.Surface((taille * 2, taille * 2), pygame.SRCALPHA)
+        points = [(taille, 0), (taille * 2, taille), (taille, taille * 2), (0, taille)]
+        pygame.draw.polygon(s, (*couleur, alpha), points)
+        return pygame.transform.rotate(s, self.rotation[i])
@@ -0,0 +1,155 @@
+# ============================================================================
+# FICHIER : ordonnanceur.py
+# DESCRIPTION : Minuteries du jeu (freeze, explosion, apparitions...)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Les minuteries : "appelle cette fonction dans N frames"
+# - Les zones de temps : chaque zone a sa propre horloge et sa vitesse
+#   (échelle), par exemple une zone par joueur en mode 2 joueurs
+# - Les ordres d'exécution : la simulation exécute les minuteries dues par
+#   étapes (freeze, puis explosion, puis apparitions), dans le même ordre
+#   que l'ancien code
+#
+# POURQUOI ?
+# Chaque effet minuté avait ses propres variables (freeze_j1_en_attente,
+# freeze_j1_delai_timer, freeze_j1_actif, freeze_j1_timer... puis les mêmes
+# pour J2 et le mode 1 joueur, explosion_timer, compteur/frequence_lancer),
+# décrémentées à la main à chaque frame. Ici, les minuteries sont rangées
+# dans un tas (heapq) par échéance : une frame ne regarde que la première
+# de chaque tas, les minuteries qui attendent ne coûtent rien, et un nouvel
+# effet minuté n'a besoin que d'un appel à programmer().
+#
+# EXEMPLE :
+#     ordonnanceur = Ordonnanceur(zones=("partie", "j1", "j2"))
+#     fin = ordonnanceur.programmer(180, terminer_freeze, "j1", zone="j1")
+#     ...
+#     ordonnanceur.avancer()        # une fois par frame
+#     ordonnanceur.executer(0)      # minuteries d'ordre 0 arrivées à échéance
+#     fin.restant                   # frames avant l'appel
+#
+# ============================================================================
+
+import heapq
+from itertools import count
+
+
+class ZoneTemps:
+    """
+    Horloge d'une zone : avance de "echelle" à chaque frame.
+
+    Attributs:
+        nom (str): Nom de la zone
+        temps (float): Temps de la zone (en frames de la zone)
+        echelle (float): Vitesse du temps (1 = normale, 0.5 = deux fois plus
+            lent, 0 = arrêté)
+        tas (dict): Ordre d'exécution -> tas des minuteries (échéance, numéro, minuterie)
+    """
+
+    def __init__(self, nom):
+        self.nom = nom
+        self.temps = 0
+        self.echelle = 1
+        self.tas = {}
+
+
+class Minuterie:
+    """
+    Un appel programmé.
+
+    Attributs:
+        zone (ZoneTemps): Zone dont l'horloge décide de l'échéance
+        echeance (float): Temps de la zone auquel l'appel a lieu
+        rappel (callable): Fonction appelée
+        arguments (tuple): Ses arguments
+        annulee (bool): True si la minuterie a été annulée
+    """
+
+    __slots__ = ("zone", "echeance", "rappel", "arguments", "annulee")
+
+    def __init__(self, zone, echeance, rappel, arguments):
+        self.zone = zone
+        self.echeance = echeance
+        self.rappel = rappel
+        self.arguments = arguments
+        self.annulee = False
+
+    @property
+    def restant(self):
+        """Temps de la zone avant l'appel (0 ou moins = échue)."""
+        return self.echeance - self.zone.temps
+
+
+class Ordonnanceur:
+    """
+    Exécute les minuteries à leur échéance.
+
+    Attributs:
+        zones (dict): Nom -> ZoneTemps, dans l'ordre d'exécution (à même
+            échéance, les minuteries d'une zone passent avant celles des
+            zones suivantes)
+    """
+
+    def __init__(self, zones=("partie",)):
+        self.zones = {nom: ZoneTemps(nom) for nom in zones}
+        # Départage les minuteries de même échéance : ordre de programmation
+        self._numeros = count()
+
+    def definir_echelle(self, zone, echelle):
+        """
+        Change la vitesse du temps d'une zone (les échéances ne bougent pas,
+        c'est l'horloge qui les atteint plus ou moins vite).
+
+        Args:
+            zone (str): Nom de la zone
+            echelle (float): 1 = normale, 0.5 = deux fois plus lent, 0 = arrêté
+        """
+        self.zones[zone].echelle = echelle
+
+    def programmer(self, delai, rappel, *arguments, zone="partie", ordre=0):
+        """
+        Programme un appel dans "delai" frames de la zone.
+
+        Args:
+            delai (float): Frames (de la zone) avant l'appel
+            rappel (callable): Fonction appelée : rappel(*arguments)
+            zone (str): Zone dont l'horloge compte le délai
+            ordre (int): Étape de la frame où l'appel a lieu (voir executer)
+
+        Retourne:
+            Minuterie: La minuterie (pour l'annuler ou lire le temps restant)
+        """
+        zone_temps = self.zones[zone]
+        minuterie = Minuterie(zone_temps, zone_temps.temps + delai, rappel, arguments)
+        tas = zone_temps.tas.setdefault(ordre, [])
+        heapq.heappush(tas, (minuterie.echeance, next(self._numeros), minuterie))
+        return minuterie
+
+    def annuler(self, minuterie):
+        """Annule une minuterie (elle reste dans le tas et sera ignorée)."""
+        minuterie.annulee = True
+
+    def avancer(self):
+        """Avance l'horloge de chaque zone d'une frame."""
+        for zone in self.zones.values():
+            zone.temps += zone.echelle
+
+    def executer(self, ordre=0):
+        """
+        Appelle les minuteries d'un ordre arrivées à échéance, zone par zone
+        et par échéance. Une minuterie programmée pendant l'exécution (même
+        ordre, déjà échue) est appelée dans la foulée.
+
+        Args:
+            ordre (int): Étape de la frame à exécuter
+        """
+        for zone in self.zones.values():
+            tas = zone.tas.get(ordre)
+            while tas and tas[0][0] <= zone.temps:
+                minuterie = heapq.heappop(tas)[2]
+                if not minuterie.annulee:
+                    minuterie.rappel(*minuterie.arguments)
+
+    def __len__(self):
+        """Nombre de minuteries en attente (annulées comprises)."""
+        return sum(len(tas) for zone in self.zones.values() for tas in zone.tas.values())
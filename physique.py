@@ -0,0 +1,159 @@
+# ============================================================================
+# FICHIER : physique.py
+# DESCRIPTION : Physique vectorisée (NumPy) des objets volants et des morceaux
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - La détection de NumPy (facultatif : sans lui, le jeu garde la physique
+#   Python de objets.py)
+# - Une passe NumPy sur TOUS les objets volants d'un coup : gravité,
+#   déplacement, images "up"/"down", rebonds sur les bords et sur le milieu
+#   (mode 2 joueurs), avec des masques au lieu d'une boucle par objet
+# - Les fruits ratés (tombés sous la limite) trouvés en une comparaison
+# - La même passe pour les morceaux de fruits (physique, rotation, fondu)
+#
+# POURQUOI ?
+# Aux niveaux élevés, et quand les morceaux s'accumulent, la boucle Python
+# par objet coûte cher. NumPy travaille DIRECTEMENT dans les colonnes des
+# magasins (array "d" / "l", voir objets.Composants) : np.frombuffer ne
+# copie rien, les calculs écrivent dans les mêmes tableaux.
+#
+# ATTENTION :
+# - Un array ne peut pas changer de taille tant qu'une vue NumPy existe sur
+#   lui (BufferError). Les vues ne vivent donc que dans ces fonctions : les
+#   lignes à retirer sont rendues sous forme de liste d'indices, et c'est
+#   l'appelant qui les retire ensuite.
+# - Les opérations sont faites dans le même ordre que le code Python
+#   (vy += gravité, x += vx, y += vy, puis les rebonds un par un) : les
+#   nombres sont identiques au bit près, les replays restent valables.
+# - Pour quelques objets, l'appel à NumPy coûte plus que la boucle : sous
+#   un seuil de lignes (mesuré, voir plus bas), on garde le code Python.
+#
+# ============================================================================
+
+from constantes import PHYSIQUE_NUMPY
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# True si la passe NumPy est utilisable (NumPy installé et option activée)
+ACTIF = np is not None and PHYSIQUE_NUMPY
+
+# En dessous de ces nombres de lignes, la boucle Python est plus rapide
+# (mesuré : la passe des objets volants fait une trentaine d'appels NumPy
+# avec les rebonds, celle des morceaux moins de dix)
+SEUIL_OBJETS = 40
+SEUIL_MORCEAUX = 16
+
+
+def utiliser(composants, seuil):
+    """
+    Indique si un magasin doit passer par NumPy cette frame.
+
+    Args:
+        composants (Composants): Le magasin (objets volants, morceaux...)
+        seuil (int): Nombre de lignes à partir duquel NumPy est plus rapide
+
+    Retourne:
+        bool: True si NumPy est actif et qu'il y a assez de lignes
+    """
+    return ACTIF and composants.nombre >= seuil
+
+
+def _colonnes(composants, *noms):
+    """Vues NumPy (sans copie) sur les colonnes d'un magasin."""
+    colonnes = [getattr(composants, nom) for nom in noms]
+    return [np.frombuffer(colonne, dtype=colonne.typecode) for colonne in colonnes]
+
+
+def deplacer_objets(objets, largeur_ecran, gel_gauche, gel_droite):
+    """
+    Déplace les objets volants : gravité, déplacement, images selon le sens,
+    rebonds sur les bords puis sur le milieu (objets assignés à une zone).
+
+    Args:
+        objets (ObjetsVolants): Les objets
+        largeur_ecran (int): Largeur du terrain de jeu
+        gel_gauche (bool): La moitié gauche est gelée (objets immobiles)
+        gel_droite (bool): La moitié droite est gelée
+    """
+    x, y, vx, vy, gravite, rayon = _colonnes(objets, "x", "y", "vx", "vy", "gravite", "rayon")
+    zone, tranche, descente = _colonnes(objets, "zone", "tranche", "descente")
+    milieu_x = largeur_ecran // 2
+
+    # Lignes qui bougent : le côté de l'objet (avant déplacement) n'est pas
+    # gelé. Sans gel, on calcule sur les colonnes entières (plus rapide
+    # qu'un masque) : lignes = toutes, actifs = True dans les masques.
+    if gel_gauche == gel_droite:
+        if gel_gauche:
+            return
+        lignes, actifs = slice(None), True
+    else:
+        lignes = actifs = (x < milieu_x) != gel_gauche
+
+    vy[lignes] += gravite[lignes]
+    x[lignes] += vx[lignes]
+    y[lignes] += vy[lignes]
+
+    # Images "up"/"down" : seulement pour les objets dont le sens a changé
+    # (la colonne descente garde le sens de l'image affichée)
+    sens = (vy >= 0).astype(descente.dtype)
+    for i in np.flatnonzero(actifs & (tranche == 0) & (descente != sens)).tolist():
+        descente[i] = sens[i]
+        etats = objets.sprite[i]
+        if isinstance(etats, dict):
+            objets.image[i] = etats.get("down" if sens[i] else "up", etats.get("cut"))
+
+    # Rebonds, dans le même ordre que systeme_rebonds : chaque test voit la
+    # position corrigée par le précédent
+    masque = actifs & (x - rayon < 0)
+    x[masque] = rayon[masque]
+    vx[masque] *= -1
+    masque = actifs & (x + rayon > largeur_ecran)
+    x[masque] = largeur_ecran - rayon[masque]
+    vx[masque] *= -1
+    masque = actifs & (zone == 1) & (x + rayon > milieu_x)
+    x[masque] = milieu_x - rayon[masque]
+    vx[masque] *= -1
+    masque = actifs & (zone == 2) & (x - rayon < milieu_x)
+    x[masque] = milieu_x + rayon[masque]
+    vx[masque] *= -1
+
+
+def indices_rates(objets, limite_y):
+    """
+    Trouve les objets tombés sous la limite.
+
+    Args:
+        objets (ObjetsVolants): Les objets
+        limite_y (float): Ordonnée au-delà de laquelle l'objet est raté
+
+    Retourne:
+        list: Indices des lignes ratées (croissants)
+    """
+    (y,) = _colonnes(objets, "y")
+    return np.flatnonzero(y > limite_y).tolist()
+
+
+def mettre_a_jour_morceaux(morceaux, vitesse_fondu):
+    """
+    Physique, rotation et fondu de tous les morceaux.
+
+    Args:
+        morceaux (Morceaux): Les morceaux de fruits
+        vitesse_fondu (int): Opacité perdue par frame
+
+    Retourne:
+        list: Indices des morceaux encore visibles (à garder)
+    """
+    x, y, vx, vy, gravite, angle, vitesse_rotation, alpha = _colonnes(
+        morceaux, "x", "y", "vx", "vy", "gravite", "angle", "vitesse_rotation", "alpha"
+    )
+    vy += gravite
+    x += vx
+    y += vy
+    angle += vitesse_rotation
+    np.maximum(alpha - vitesse_fondu, 0, out=alpha)
+    return np.flatnonzero(alpha > 0).tolist()
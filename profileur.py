@@ -0,0 +1,248 @@
+# ============================================================================
+# FICHIER : profileur.py
+# DESCRIPTION : Profileur par phase de la frame (affichage + trace Chrome)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - La mesure du temps de chaque phase de la frame : événements, collisions,
+#   apparitions, objets, fond, fruits, morceaux, particules, HUD, flip...
+# - Un panneau de développement (touche F3) : médiane, 95e et 99e centiles
+#   glissants de chaque phase et un graphique du temps de frame
+# - Un fichier de trace au format "Trace Event" de Chrome : on l'ouvre dans
+#   chrome://tracing ou https://ui.perfetto.dev pour voir quelle phase a
+#   explosé pendant une mauvaise session
+#
+# COMMENT ÇA MARCHE ?
+# Les phases se suivent : marquer("fruits") termine la phase "fruits",
+# commencée au marquage précédent. Un seul appel à perf_counter() par phase.
+# Quand le panneau est caché et la trace désactivée, marquer() ne fait rien.
+#
+# ============================================================================
+
+import json
+import time
+from collections import deque
+
+import pygame
+
+# Nombre de frames des centiles glissants et du graphique
+FRAMES_HISTORIQUE = 300
+# Les centiles et les textes du panneau sont recalculés toutes les N frames
+FRAMES_RAFRAICHISSEMENT = 30
+BUDGET_MS = 1000 / 60
+
+
+class Profileur:
+    """
+    Mesure le temps de chaque phase de la frame.
+
+    Attributs:
+        visible (bool): Panneau affiché (bascule avec F3)
+        chemin_trace (str): Fichier de trace Chrome (None = pas de trace)
+        durees (dict): Phase -> deque des dernières durées (ms)
+        durees_frame (deque): Derniers temps de frame complets (ms)
+        phases_frame (list): Phases de la frame en cours (nom, début, fin)
+    """
+
+    def __init__(self, visible=False, chemin_trace=None):
+        self.visible = visible
+        self.chemin_trace = chemin_trace
+        self.durees = {}
+        self.vue = {}  # Phase -> numéro de la dernière frame où elle a été mesurée
+        self.durees_frame = deque(maxlen=FRAMES_HISTORIQUE)
+        self.phases_frame = []
+        self.debut = 0.0
+        self.dernier = 0.0
+        self.numero_frame = 0
+        self.lignes = []  # Textes du panneau déjà rendus
+        self.police = None
+        self.origine = time.perf_counter()
+
+        self.fichier_trace = None
+        if chemin_trace:
+            self.fichier_trace = open(chemin_trace, "w", encoding="utf-8")
+            # Format "tableau JSON" : le lecteur accepte un tableau non fermé,
+            # la trace reste lisible même si le jeu plante
+            self.fichier_trace.write("[\n")
+
+    @property
+    def actif(self):
+        """True si les phases doivent être mesurées."""
+        return self.visible or self.fichier_trace is not None
+
+    def basculer(self):
+        """Affiche ou cache le panneau (touche F3)."""
+        self.visible = not self.visible
+        self.durees_frame.clear()
+        self.durees.clear()
+        self.vue.clear()
+        self.lignes = []
+
+    # ========================================================================
+    # MESURE
+    # ========================================================================
+    def debut_frame(self):
+        """À appeler au tout début de la frame."""
+        if not self.actif:
+            return
+        self.debut = self.dernier = time.perf_counter()
+        self.phases_frame.clear()
+
+    def marquer(self, phase):
+        """
+        Termine une phase, commencée au marquage précédent.
+
+        Args:
+            phase (str): Nom de la phase qui vient de se terminer
+        """
+        if not self.actif:
+            return
+        maintenant = time.perf_counter()
+        self.phases_frame.append((phase, self.dernier, maintenant))
+        self.dernier = maintenant
+
+    def fin_frame(self, compteurs=None):
+        """
+        Enregistre la frame (centiles, graphique, trace).
+
+        Args:
+            compteurs (dict): Valeurs à suivre dans la trace (nombre d'objets...)
+        """
+        if not self.actif:
+            return
+        self.numero_frame += 1
+        self.durees_frame.append((self.dernier - self.debut) * 1000)
+
+        # Une même phase peut apparaître plusieurs fois dans une frame : on cumule
+        cumul = {}
+        for phase, debut, fin in self.phases_frame:
+            cumul[phase] = cumul.get(phase, 0.0) + (fin - debut) * 1000
+        for phase, duree in cumul.items():
+            if phase not in self.durees:
+                self.durees[phase] = deque(maxlen=FRAMES_HISTORIQUE)
+            self.durees[phase].append(duree)
+            self.vue[phase] = self.numero_frame
+
+        if self.fichier_trace is not None:
+            self._ecrire_trace(compteurs)
+
+    def _ecrire_trace(self, compteurs):
+        """Ajoute les événements de la frame au fichier de trace."""
+        def microsecondes(t):
+            return round((t - self.origine) * 1_000_000, 1)
+
+        evenements = [
+            {
+                "name": f"frame {self.numero_frame}",
+                "cat": "frame",
+                "ph": "X",
+                "ts": microsecondes(self.debut),
+                "dur": round((self.dernier - self.debut) * 1_000_000, 1),
+                "pid": 1,
+                "tid": 1,
+            }
+        ]
+        for phase, debut, fin in self.phases_frame:
+            evenements.append(
+                {
+                    "name": phase,
+                    "cat": "phase",
+                    "ph": "X",
+                    "ts": microsecondes(debut),
+                    "dur": round((fin - debut) * 1_000_000, 1),
+                    "pid": 1,
+                    "tid": 1,
+                }
+            )
+        if compteurs:
+            evenements.append(
+                {
+                    "name": "objets",
+                    "ph": "C",
+                    "ts": microsecondes(self.debut),
+                    "pid": 1,
+                    "args": compteurs,
+                }
+            )
+        for evenement in evenements:
+            self.fichier_trace.write(json.dumps(evenement) + ",\n")
+
+    def fermer(self):
+        """Ferme le fichier de trace (à appeler en quittant le jeu)."""
+        if self.fichier_trace is not None:
+            # Événement final sans virgule : le tableau JSON est complet
+            self.fichier_trace.write(
+                json.dumps({"name": "fin", "ph": "i", "ts": 0, "pid": 1, "s": "g"}) + "\n]\n"
+            )
+            self.fichier_trace.close()
+            self.fichier_trace = None
+            print(f"📈 Trace écrite dans {self.chemin_trace}")
+
+    # ========================================================================
+    # PANNEAU
+    # ========================================================================
+    def _centiles(self, valeurs):
+        """Retourne (p50, p95, p99) d'une suite de durées."""
+        triees = sorted(valeurs)
+        n = len(triees) - 1
+        return triees[n // 2], triees[n * 95 // 100], triees[n * 99 // 100]
+
+    def _preparer_lignes(self):
+        """Recalcule les centiles et rend les lignes du panneau."""
+        if self.police is None:
+            self.police = pygame.font.Font(None, 22)
+        lignes = [("phase (ms)", "p50", "p95", "p99")]
+        for phase, durees in self.durees.items():
+            # Phases d'un autre écran (menu pendant le jeu...) : plus affichées
+            if self.numero_frame - self.vue[phase] > FRAMES_RAFRAICHISSEMENT:
+                continue
+            lignes.append((phase, *(f"{v:.2f}" for v in self._centiles(durees))))
+        if self.durees_frame:
+            lignes.append(("FRAME", *(f"{v:.2f}" for v in self._centiles(self.durees_frame))))
+        self.lignes = [self._rendre_ligne(colonnes) for colonnes in lignes]
+
+    def _rendre_ligne(self, colonnes):
+        """Rend une ligne du tableau (nom à gauche, nombres alignés à droite)."""
+        surface = pygame.Surface((260, self.police.get_linesize()), pygame.SRCALPHA)
+        surface.blit(self.police.render(colonnes[0], True, (230, 230, 230)), (0, 0))
+        for index, colonne in enumerate(colonnes[1:]):
+            rendu = self.police.render(colonne, True, (230, 230, 230))
+            surface.blit(rendu, (150 + index * 50 - rendu.get_width(), 0))
+        return surface
+
+    def dessiner(self, surface):
+        """
+        Dessine le panneau (en haut à gauche) si il est visible.
+
+        Args:
+            surface (Surface): La fenêtre
+        """
+        if not self.visible:
+            return
+        if not self.lignes or self.numero_frame % FRAMES_RAFRAICHISSEMENT == 0:
+            self._preparer_lignes()
+
+        hauteur_ligne = self.police.get_linesize()
+        hauteur_graphe = 60
+        largeur = 270
+        hauteur = 10 + hauteur_ligne * len(self.lignes) + hauteur_graphe + 10
+
+        fond = pygame.Surface((largeur, hauteur), pygame.SRCALPHA)
+        fond.fill((0, 0, 0, 170))
+        surface.blit(fond, (10, 10))
+        for i, ligne in enumerate(self.lignes):
+            surface.blit(ligne, (15, 15 + i * hauteur_ligne))
+
+        # Graphique du temps de frame : une barre par frame, échelle 2x le budget
+        haut_graphe = 15 + hauteur_ligne * len(self.lignes) + 5
+        bas_graphe = haut_graphe + hauteur_graphe
+        echelle = hauteur_graphe / (2 * BUDGET_MS)
+        y_budget = bas_graphe - int(BUDGET_MS * echelle)
+        pygame.draw.line(surface, (255, 200, 0), (15, y_budget), (15 + largeur - 10, y_budget))
+        debut_x = 15 + (largeur - 10) - len(self.durees_frame) * (largeur - 10) // FRAMES_HISTORIQUE
+        pas = (largeur - 10) / FRAMES_HISTORIQUE
+        for i, duree in enumerate(self.durees_frame):
+            hauteur_barre = min(hauteur_graphe, int(duree * echelle))
+            couleur = (90, 220, 90) if duree <= BUDGET_MS else (230, 70, 70)
+            x = debut_x + int(i * pas)
+            pygame.draw.line(surface, couleur, (x, bas_graphe), (x, bas_graphe - hauteur_barre))
@@ -0,0 +1,147 @@
+# ============================================================================
+# FICHIER : qualite.py
+# DESCRIPTION : Qualité adaptative des effets selon le temps de frame
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Les niveaux de qualité (particules, lissage, rotations, résolution)
+# - Les réglages ACTUELS, lus par objets.py et main.py
+# - Un contrôleur qui surveille la moyenne glissante du temps de frame et
+#   baisse (ou remonte) le niveau de qualité
+#
+# POURQUOI ?
+# Quand il y a beaucoup de morceaux + une explosion + un freeze, le jeu perd
+# des frames. Comme les collisions sont testées une fois par frame, le
+# tranchage devient moins précis. On préfère réduire les effets visuels.
+#
+# ============================================================================
+
+from collections import deque
+
+# ============================================================================
+# NIVEAUX DE QUALITÉ (du meilleur au plus léger)
+# ============================================================================
+# - facteur_particules : multiplicateur du nombre de particules par explosion
+# - lissage : True = rotozoom/smoothscale (filtré), False = rotate/scale (rapide)
+# - paliers_rotation : nombre d'angles pré-calculés pour les morceaux
+# - echelle_rendu : facteur de la résolution interne (appliqué à la partie
+#   suivante ; le terrain de jeu garde sa taille, seul le dessin est réduit,
+#   voir rendu.CibleRendu)
+# ============================================================================
+NIVEAUX_QUALITE = [
+    {
+        "nom": "maximale",
+        "facteur_particules": 1.0,
+        "lissage": True,
+        "paliers_rotation": 36,
+        "echelle_rendu": 1.0,
+    },
+    {
+        "nom": "haute",
+        "facteur_particules": 0.6,
+        "lissage": True,
+        "paliers_rotation": 24,
+        "echelle_rendu": 1.0,
+    },
+    {
+        "nom": "moyenne",
+        "facteur_particules": 0.4,
+        "lissage": False,
+        "paliers_rotation": 16,
+        "echelle_rendu": 1.0,
+    },
+    {
+        "nom": "basse",
+        "facteur_particules": 0.25,
+        "lissage": False,
+        "paliers_rotation": 8,
+        "echelle_rendu": 0.75,
+    },
+]
+
+# Réglages actuellement utilisés par le jeu (modifiés par ControleurQualite)
+reglages = dict(NIVEAUX_QUALITE[0])
+
+
+def nombre_particules(nombre_max):
+    """
+    Retourne le nombre de particules à créer selon la qualité actuelle.
+
+    Args:
+        nombre_max (int): Nombre de particules en qualité maximale
+
+    Retourne:
+        int: Nombre ajusté (au moins 1)
+    """
+    return max(1, int(nombre_max * reglages["facteur_particules"]))
+
+
+class ControleurQualite:
+    """
+    Ajuste le niveau de qualité selon la moyenne glissante du temps de frame.
+
+    Attributs:
+        budget_ms (float): Temps de frame visé (16.7 ms = 60 FPS)
+        marge_remontee (float): On remonte si moyenne < budget * marge_remontee
+        frames_mesure (int): Nombre de frames de la moyenne glissante
+        niveau (int): Index actuel dans NIVEAUX_QUALITE (0 = meilleur)
+        durees (deque): Dernières durées de frame en millisecondes
+    """
+
+    def __init__(self, budget_ms=1000 / 60, marge_remontee=0.6, frames_mesure=60):
+        self.budget_ms = budget_ms
+        self.marge_remontee = marge_remontee
+        self.frames_mesure = frames_mesure
+        self.niveau = 0
+        self.durees = deque(maxlen=frames_mesure)
+        self.somme = 0.0
+
+    def moyenne_ms(self):
+        """Retourne la moyenne glissante du temps de frame (0 si aucune mesure)."""
+        if not self.durees:
+            return 0.0
+        return self.somme / len(self.durees)
+
+    def enregistrer_frame(self, duree_ms):
+        """
+        Ajoute la durée d'une frame et change de niveau si nécessaire.
+
+        On attend d'avoir une fenêtre complète de mesures avant de décider,
+        puis on repart de zéro après chaque changement (évite les oscillations).
+
+        Args:
+            duree_ms (float): Temps de travail de la frame en millisecondes
+
+        Retourne:
+            bool: True si le niveau de qualité a changé
+        """
+        if len(self.durees) == self.durees.maxlen:
+            self.somme -= self.durees[0]
+        self.durees.append(duree_ms)
+        self.somme += duree_ms
+
+        if len(self.durees) < self.frames_mesure:
+            return False
+
+        moyenne = self.moyenne_ms()
+        if moyenne > self.budget_ms and self.niveau < len(NIVEAUX_QUALITE) - 1:
+            self.appliquer_niveau(self.niveau + 1)
+            return True
+        if moyenne < self.budget_ms * self.marge_remontee and self.niveau > 0:
+            self.appliquer_niveau(self.niveau - 1)
+            return True
+        return False
+
+    def appliquer_niveau(self, niveau):
+        """
+        Applique un niveau de qualité et remet la mesure à zéro.
+
+        Args:
+            niveau (int): Index dans NIVEAUX_QUALITE
+        """
+        self.niveau = max(0, min(niveau, len(NIVEAUX_QUALITE) - 1))
+        reglages.clear()
+        reglages.update(NIVEAUX_QUALITE[self.niveau])
+        self.durees.clear()
+        self.somme = 0.0
+        print(f"⚙️ Qualité {reglages['nom']} (niveau {self.niveau})")
@@ -0,0 +1,152 @@
+# ============================================================================
+# FICHIER : rechargement.py
+# DESCRIPTION : Rechargement à chaud des fichiers (images, sons, difficulté)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - La surveillance de fichiers par un thread à part : toutes les
+#   RECHARGEMENT_INTERVALLE secondes, il relit la date de modification et la
+#   taille de chaque fichier (os.stat) et note ceux qui ont changé
+# - Le rechargement des fichiers changés, et d'eux seuls, à la frontière de
+#   scène suivante (voir scenes.GestionnaireScenes.a_chaque_changement)
+#
+# POURQUOI ?
+# Pour changer une image ou la difficulté d'une borne, il fallait relancer
+# le jeu : toutes les images rechargées, la fenêtre recréée, plusieurs
+# secondes d'écran noir. Ici, on remplace le fichier et le jeu le reprend
+# tout seul au prochain changement d'écran.
+#
+# POURQUOI À LA FRONTIÈRE DE SCÈNE ?
+# - Les images se chargent avec pygame (convert_alpha) : dans le thread
+#   principal, pas dans celui de la surveillance
+# - Une partie en cours garde ses images et sa difficulté jusqu'au bout
+#   (la partie suivante part des nouvelles)
+#
+# EXEMPLE :
+#     rechargement = RechargementFichiers(1.0)
+#     rechargement.surveiller("difficulte.json", difficulte.recharger)
+#     rechargement.demarrer()
+#     scenes.a_chaque_changement(rechargement.appliquer)
+#
+# ============================================================================
+
+import os
+import threading
+
+import journal
+
+
+def signature(chemin):
+    """
+    Date de modification et taille d'un fichier.
+
+    Args:
+        chemin (str): Chemin du fichier
+
+    Retourne:
+        tuple: (date en nanosecondes, taille), None si le fichier n'existe pas
+    """
+    try:
+        etat = os.stat(chemin)
+    except OSError:
+        return None
+    return etat.st_mtime_ns, etat.st_size
+
+
+class RechargementFichiers:
+    """
+    Surveille des fichiers et les recharge quand ils changent.
+
+    Attributs:
+        intervalle (float): Secondes entre deux relevés des fichiers
+        rappels (dict): Chemin -> fonction de rechargement, appelée avec le chemin
+        signatures (dict): Chemin -> dernière signature vue (thread de surveillance)
+        changes (set): Chemins changés, pas encore rechargés
+    """
+
+    def __init__(self, intervalle=1.0):
+        self.intervalle = intervalle
+        self.rappels = {}
+        self.signatures = {}
+        self.changes = set()
+        self._verrou = threading.Lock()
+        self._arret = threading.Event()
+        self._thread = None
+
+    def surveiller(self, chemin, recharger):
+        """
+        Ajoute un fichier à surveiller (avant demarrer).
+
+        Args:
+            chemin (str): Chemin du fichier
+            recharger (callable): Appelée avec le chemin quand le fichier a
+                changé (dans le thread principal, voir appliquer)
+        """
+        self.rappels[chemin] = recharger
+        self.signatures[chemin] = signature(chemin)
+
+    def demarrer(self):
+        """Lance le thread de surveillance."""
+        if self._thread is None:
+            self._arret.clear()
+            self._thread = threading.Thread(target=self._surveillance, name="rechargement", daemon=True)
+            self._thread.start()
+
+    def arreter(self):
+        """Arrête le thread de surveillance."""
+        if self._thread is not None:
+            self._arret.set()
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def relever(self):
+        """
+        Relit la signature de chaque fichier et note ceux qui ont changé.
+
+        Retourne:
+            set: Chemins changés depuis le relevé précédent
+        """
+        changes = set()
+        for chemin, ancienne in self.signatures.items():
+            nouvelle = signature(chemin)
+            # Un fichier supprimé (en cours de copie) sera repris quand il reviendra
+            if nouvelle != ancienne and nouvelle is not None:
+                changes.add(chemin)
+            self.signatures[chemin] = nouvelle
+        if changes:
+            with self._verrou:
+                self.changes |= changes
+        return changes
+
+    def _surveillance(self):
+        """Thread de surveillance : un relevé toutes les intervalle secondes."""
+        while not self._arret.wait(self.intervalle):
+            self.relever()
+
+    def appliquer(self):
+        """
+        Recharge les fichiers changés (à appeler depuis le thread principal,
+        à la frontière de scène).
+
+        Retourne:
+            list: Chemins rechargés
+        """
+        if not self.changes:
+            return []
+        with self._verrou:
+            changes, self.changes = self.changes, set()
+
+        recharges = []
+        for chemin in sorted(changes):
+            try:
+                self.rappels[chemin](chemin)
+            except Exception as e:
+                # Un fichier à moitié écrit ne doit pas arrêter le jeu : on
+                # garde l'ancienne version, et il sera repris au prochain changement
+                print(f"⚠️ Rechargement impossible de {chemin} : {e}")
+                continue
+            recharges.append(chemin)
+            print(f"🔄 Rechargé : {chemin}")
+        if journal.actif_info and recharges:
+            journal.ecrire(journal.INFO, "rechargement", "Fichiers rechargés", fichiers=len(recharges))
+        return recharges
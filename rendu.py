@@ -0,0 +1,461 @@
+# ============================================================================
+# FICHIER : rendu.py
+# DESCRIPTION : Cible de rendu interne à résolution fixe
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Une surface hors écran de taille logique fixe (ex: 1280x720)
+# - La conversion des coordonnées de la fenêtre vers les coordonnées logiques
+# - La mise à l'échelle UNIQUE de cette surface vers la fenêtre à chaque frame
+# - Les files d'affichage par couche (un seul appel blits() par couche)
+# - Le rendu parallèle des deux moitiés d'écran en mode 2 joueurs
+#
+# POURQUOI ?
+# - Les tailles des objets (rayon, hauteur des sprites, marges) sont en pixels :
+#   en dessinant toujours sur la même surface, le jeu a le même aspect quelle
+#   que soit la fenêtre, et les caches (fonds, sprites) ne sont jamais recalculés
+#   quand on passe en plein écran
+# - Une machine modeste peut dessiner en 960x540 et laisser le scale agrandir
+#
+# ÉCHELLE DE RENDU (qualité "basse", voir qualite.py) :
+# La surface interne est plus petite que la taille du jeu (x0.75), mais la
+# partie garde sa taille : les positions et les images du jeu sont réduites
+# au moment du dessin (FileRendu), et la souris est reconvertie en
+# coordonnées du jeu. La qualité ne change jamais le déroulement d'une partie.
+#
+# ============================================================================
+
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CibleRendu:
+    """
+    Surface de rendu hors écran, présentée dans la fenêtre avec un seul scale.
+
+    Attributs:
+        taille_logique (tuple): (largeur, hauteur) du jeu, ou None pour la
+            taille de la fenêtre (comportement d'origine)
+        echelle (float): Taille de la surface interne par rapport à celle du
+            jeu (1 = même taille ; 0.75 = rendu réduit, voir qualite.py)
+        lisse (bool): True = smoothscale (plus joli), False = scale (plus rapide)
+        surface (Surface): La surface interne (None si inactive)
+        taille_jeu (tuple): Taille du jeu à la dernière frame préparée
+        destination (Rect): Zone de la fenêtre où la surface est affichée
+        derniere_taille_fenetre (tuple): Taille de fenêtre utilisée pour destination
+    """
+
+    def __init__(self, taille_logique=None, lisse=True):
+        """
+        Arguments:
+            taille_logique (tuple): (largeur, hauteur) ou None
+            lisse (bool): Utiliser smoothscale pour la présentation
+        """
+        self.lisse = lisse
+        self.surface = None
+        self.taille_logique = None
+        self.echelle = 1.0
+        self.taille_jeu = None
+        self.destination = None
+        self.derniere_taille_fenetre = (0, 0)
+        self.definir_taille(taille_logique)
+
+    @property
+    def actif(self):
+        """True si le jeu est dessiné hors écran puis mis à l'échelle."""
+        return self.taille_logique is not None or self.echelle < 1
+
+    def definir_taille(self, taille_logique):
+        """
+        Change la résolution logique (None = dessin direct dans la fenêtre).
+
+        Arguments:
+            taille_logique (tuple): (largeur, hauteur) ou None
+        """
+        if taille_logique is not None:
+            taille_logique = (int(taille_logique[0]), int(taille_logique[1]))
+
+        if taille_logique == self.taille_logique:
+            return
+
+        self.taille_logique = taille_logique
+        # La surface sera (re)créée par preparer()
+        self.surface = None
+        self.derniere_taille_fenetre = (0, 0)
+
+    def definir_echelle(self, echelle):
+        """
+        Change l'échelle de la surface interne (la taille du jeu ne change pas).
+
+        Arguments:
+            echelle (float): 1 = pleine résolution, 0.75 = rendu réduit
+        """
+        echelle = min(1.0, echelle)
+        if echelle != self.echelle:
+            self.echelle = echelle
+            self.surface = None
+            self.derniere_taille_fenetre = (0, 0)
+
+    def taille_du_jeu(self, fenetre):
+        """
+        Taille du terrain de jeu (celle de la simulation), quelle que soit l'échelle.
+
+        Arguments:
+            fenetre (Surface): La surface de la fenêtre
+
+        Retourne:
+            tuple: La taille logique, ou celle de la fenêtre
+        """
+        return self.taille_logique or fenetre.get_size()
+
+    def _mettre_a_jour_destination(self, fenetre):
+        """
+        Calcule (une fois par taille de fenêtre) le rectangle où afficher la
+        surface interne, en gardant ses proportions (bandes noires si besoin).
+        """
+        taille_fenetre = fenetre.get_size()
+        if taille_fenetre == self.derniere_taille_fenetre:
+            return
+
+        largeur_logique, hauteur_logique = self.taille_jeu
+        largeur_fenetre, hauteur_fenetre = taille_fenetre
+
+        # On prend le plus petit facteur pour que tout rentre dans la fenêtre
+        echelle = min(
+            largeur_fenetre / largeur_logique, hauteur_fenetre / hauteur_logique
+        )
+        largeur = max(1, int(largeur_logique * echelle))
+        hauteur = max(1, int(hauteur_logique * echelle))
+
+        self.destination = pygame.Rect(0, 0, largeur, hauteur)
+        self.destination.center = (largeur_fenetre // 2, hauteur_fenetre // 2)
+        self.derniere_taille_fenetre = taille_fenetre
+
+    def preparer(self, fenetre):
+        """
+        Retourne la surface sur laquelle dessiner cette frame.
+
+        Arguments:
+            fenetre (Surface): La surface de la fenêtre (pygame.display)
+
+        Retourne:
+            Surface: La surface interne si active, sinon la fenêtre elle-même
+        """
+        if not self.actif:
+            return fenetre
+
+        taille_jeu = self.taille_du_jeu(fenetre)
+        if self.surface is None or taille_jeu != self.taille_jeu:
+            # Sans taille logique, le jeu suit la fenêtre (plein écran)
+            self.taille_jeu = taille_jeu
+            taille = (
+                max(1, int(taille_jeu[0] * self.echelle)),
+                max(1, int(taille_jeu[1] * self.echelle)),
+            )
+            self.surface = pygame.Surface(taille).convert()
+            self.derniere_taille_fenetre = (0, 0)
+        self._mettre_a_jour_destination(fenetre)
+        return self.surface
+
+    def vers_logique(self, pos):
+        """
+        Convertit une position de la fenêtre (souris) en position logique.
+
+        Arguments:
+            pos (tuple): Position (x, y) dans la fenêtre
+
+        Retourne:
+            tuple: Position (x, y) dans le jeu (pas dans la surface interne,
+            qui peut être plus petite)
+        """
+        if not self.actif or self.destination is None:
+            return pos
+
+        largeur_logique, hauteur_logique = self.taille_jeu
+        x = (pos[0] - self.destination.x) * largeur_logique // self.destination.width
+        y = (pos[1] - self.destination.y) * hauteur_logique // self.destination.height
+        return (x, y)
+
+    def presenter(self, fenetre):
+        """
+        Met la surface interne à l'échelle de la fenêtre (un seul scale par frame).
+
+        Arguments:
+            fenetre (Surface): La surface de la fenêtre
+        """
+        if not self.actif or self.surface is None:
+            return
+
+        self._mettre_a_jour_destination(fenetre)
+
+        # Bandes noires autour si les proportions diffèrent
+        if self.destination.size != fenetre.get_size():
+            fenetre.fill((0, 0, 0))
+
+        if self.destination.size == self.surface.get_size():
+            # Même taille : une simple copie suffit
+            fenetre.blit(self.surface, self.destination)
+            return
+
+        # On écrit directement dans une sous-surface de la fenêtre :
+        # pas de surface intermédiaire allouée à chaque frame
+        zone = fenetre.subsurface(self.destination)
+        if self.lisse:
+            pygame.transform.smoothscale(self.surface, self.destination.size, zone)
+        else:
+            pygame.transform.scale(self.surface, self.destination.size, zone)
+
+
+# Images réduites pour le rendu à échelle < 1, clé : (image, échelle).
+# Les images du jeu viennent de caches (sprites, rotations, cercles) : elles
+# ne sont réduites qu'une fois. Vidé à chaque partie (oublier_images_reduites).
+_images_reduites = {}
+
+
+def image_reduite(image, echelle):
+    """
+    Retourne l'image réduite à une échelle (calculée une seule fois).
+
+    Arguments:
+        image (Surface): Image du jeu
+        echelle (float): Facteur de réduction (< 1)
+
+    Retourne:
+        Surface: L'image réduite
+    """
+    cle = (image, echelle)
+    reduite = _images_reduites.get(cle)
+    if reduite is None:
+        largeur, hauteur = image.get_size()
+        reduite = pygame.transform.scale(
+            image, (max(1, int(largeur * echelle)), max(1, int(hauteur * echelle)))
+        )
+        _images_reduites[cle] = reduite
+    return reduite
+
+
+def oublier_images_reduites():
+    """Vide le cache des images réduites (début de partie)."""
+    _images_reduites.clear()
+
+
+class FileRendu:
+    """
+    File d'affichage d'une couche (fruits, morceaux, particules...).
+
+    Pendant la mise à jour, chaque objet ajoute sa paire (image, position)
+    dans la file au lieu de faire son propre blit. À la fin, toute la couche
+    est envoyée en UN SEUL appel à screen.blits() : la boucle de blit se fait
+    en C au lieu de passer par une méthode Python par objet.
+
+    Les objets complètement hors de l'écran ne sont pas ajoutés (culling).
+
+    Les positions et les images sont celles du jeu : avec une échelle < 1
+    (surface interne réduite, voir CibleRendu), la file les réduit.
+
+    Attributs:
+        elements (list): Paires (Surface, position) en attente
+        dessins (list): Dessins de secours en attente (fonction, x, y, arguments)
+        zone (Rect): Zone visible (les objets hors de cette zone sont ignorés)
+        surface (Surface): Surface cible de la frame
+        echelle (float): Taille de la surface par rapport à celle du jeu
+    """
+
+    def __init__(self):
+        self.elements = []
+        self.dessins = []
+        self.zone = pygame.Rect(0, 0, 0, 0)
+        self.surface = None
+        self.echelle = 1.0
+
+    def commencer(self, surface, echelle=1.0):
+        """
+        Prépare la file pour une nouvelle frame.
+
+        Arguments:
+            surface (Surface): Surface sur laquelle la couche sera dessinée
+            echelle (float): Taille de la surface par rapport à celle du jeu
+        """
+        self.elements.clear()
+        self.dessins.clear()
+        self.surface = surface
+        self.zone = surface.get_rect()
+        self.echelle = echelle
+
+    def ajouter(self, image, centre_x, centre_y, alpha=None):
+        """
+        Ajoute une image centrée sur (centre_x, centre_y), si elle est visible.
+
+        Arguments:
+            image (Surface): Image à afficher (partagée : elle n'est pas modifiée)
+            centre_x, centre_y (float): Position du centre de l'image dans le jeu
+            alpha (int): Transparence (0 à 255) appliquée à une copie de
+                l'image, None = image telle quelle
+
+        Retourne:
+            bool: True si l'image a été ajoutée, False si elle est hors écran
+        """
+        if self.echelle != 1:
+            image = image_reduite(image, self.echelle)
+            centre_x *= self.echelle
+            centre_y *= self.echelle
+
+        largeur, hauteur = image.get_size()
+        x = int(centre_x) - largeur // 2
+        y = int(centre_y) - hauteur // 2
+
+        # Culling : rectangle entièrement en dehors de la zone visible
+        if (
+            x >= self.zone.right
+            or y >= self.zone.bottom
+            or x + largeur <= self.zone.x
+            or y + hauteur <= self.zone.y
+        ):
+            return False
+
+        if alpha is not None:
+            # Copie : l'image vient d'un cache partagé
+            image = image.copy()
+            image.set_alpha(alpha)
+        self.elements.append((image, (x, y)))
+        return True
+
+    def ajouter_dessin(self, fonction, x, y, *arguments):
+        """
+        Ajoute un dessin de secours (objet sans image), fait avec la couche.
+
+        Arguments:
+            fonction (callable): Appelée avec (surface, x, y, echelle, *arguments)
+            x, y (float): Position du dessin dans le jeu
+            *arguments: Arguments suivants de la fonction
+        """
+        self.dessins.append((fonction, x * self.echelle, y * self.echelle, arguments))
+
+    def soumettre(self):
+        """Dessine toute la couche en un seul appel puis vide la file."""
+        if self.elements:
+            self.surface.blits(self.elements, doreturn=False)
+            self.elements.clear()
+        for fonction, x, y, arguments in self.dessins:
+            fonction(self.surface, x, y, self.echelle, *arguments)
+        self.dessins.clear()
+
+
+# ============================================================================
+# RENDU PARALLÈLE DU MODE 2 JOUEURS
+# ============================================================================
+# En mode 2 joueurs, les deux moitiés de l'écran sont indépendantes : fond,
+# fruits confinés dans leur zone, freeze séparé. Chaque moitié est dessinée
+# dans sa propre sous-surface (screen.subsurface) par un thread.
+# Les blits de pygame relâchent le GIL : sur une machine multi-coeurs, les
+# deux moitiés sont vraiment dessinées en même temps.
+# ============================================================================
+
+
+class CoucheZones:
+    """
+    Couche d'affichage répartie entre les deux moitiés de l'écran.
+
+    S'utilise comme une FileRendu (mêmes méthodes ajouter() et
+    ajouter_dessin()) : chaque image ou dessin va dans la file de la zone où
+    se trouve son centre. Rien n'est dessiné directement sur l'écran : le
+    thread de la zone dessine son fond par-dessus.
+
+    Attributs:
+        files (tuple): (file de la zone gauche, file de la zone droite)
+        milieu_x (int): Position X de la séparation, dans le jeu
+    """
+
+    def __init__(self, files):
+        self.files = files
+        self.milieu_x = 0
+
+    def ajouter(self, image, centre_x, centre_y, alpha=None):
+        """Ajoute l'image dans la file de sa zone (coordonnées locales à la zone)."""
+        if centre_x < self.milieu_x:
+            return self.files[0].ajouter(image, centre_x, centre_y, alpha)
+        return self.files[1].ajouter(image, centre_x - self.milieu_x, centre_y, alpha)
+
+    def ajouter_dessin(self, fonction, x, y, *arguments):
+        """Ajoute le dessin de secours dans la file de sa zone (coordonnées locales)."""
+        if x < self.milieu_x:
+            self.files[0].ajouter_dessin(fonction, x, y, *arguments)
+        else:
+            self.files[1].ajouter_dessin(fonction, x - self.milieu_x, y, *arguments)
+
+
+class RenduZones:
+    """
+    Rendu des deux moitiés de l'écran par deux threads.
+
+    Attributs:
+        files (list): Pour chaque zone, une FileRendu par couche
+        couches (list): Une CoucheZones par couche (fruits, morceaux, particules...)
+        fonds (tuple): Fond de chaque zone, dessiné par le thread avant les couches
+        executeur (ThreadPoolExecutor): Les deux threads de rendu (créés au premier usage)
+    """
+
+    def __init__(self, nombre_couches=3):
+        self.files = [[FileRendu() for _ in range(nombre_couches)] for _ in range(2)]
+        self.couches = [
+            CoucheZones((self.files[0][i], self.files[1][i]))
+            for i in range(nombre_couches)
+        ]
+        self.fonds = (None, None)
+        self.executeur = None
+
+    def commencer(self, screen, milieu_x, fonds=(None, None), echelle=1.0):
+        """
+        Prépare les sous-surfaces et les files pour une nouvelle frame.
+
+        Arguments:
+            screen (Surface): Surface complète du jeu
+            milieu_x (int): Position X de la séparation entre les joueurs (sur screen)
+            fonds (tuple): Fonds (déjà à la bonne taille) des zones gauche et droite
+            echelle (float): Taille de screen par rapport à celle du jeu
+        """
+        largeur, hauteur = screen.get_size()
+        zones = (
+            screen.subsurface((0, 0, milieu_x, hauteur)),
+            screen.subsurface((milieu_x, 0, largeur - milieu_x, hauteur)),
+        )
+        for zone, files in zip(zones, self.files):
+            for file in files:
+                file.commencer(zone, echelle)
+
+        for couche in self.couches:
+            # Les positions ajoutées sont celles du jeu
+            couche.milieu_x = milieu_x / echelle
+
+        self.fonds = fonds
+
+    def _dessiner_zone(self, index):
+        """Dessine le fond puis toutes les couches d'une zone (dans un thread)."""
+        files = self.files[index]
+        fond = self.fonds[index]
+        if fond is not None:
+            files[0].surface.blit(fond, (0, 0))
+        for file in files:
+            file.soumettre()
+
+    def soumettre(self):
+        """
+        Dessine les deux zones en parallèle et attend la fin des deux threads.
+
+        À appeler avant pygame.display.flip().
+        """
+        if self.executeur is None:
+            self.executeur = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="rendu_zone"
+            )
+
+        taches = [self.executeur.submit(self._dessiner_zone, i) for i in range(2)]
+        for tache in taches:
+            # result() attend le thread et relance ses éventuelles erreurs
+            tache.result()
+
+    def fermer(self):
+        """Arrête les threads de rendu."""
+        if self.executeur is not None:
+            self.executeur.shutdown()
+            self.executeur = None
@@ -0,0 +1,516 @@
+# ============================================================================
+# FICHIER : replay.py
+# DESCRIPTION : Enregistrement et relecture des parties (journal des entrées)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - L'enregistrement compact d'une partie : graine aléatoire, positions de la
+#   souris (en différences), boutons et touches, datés en frames
+# - La relecture : les entrées repassent par la simulation (donc par
+#   ControleurJoueur.start_slice / update_slice / end_slice et
+#   controller.handle_keyboard_inputs) et la partie est reproduite à
+#   l'identique, sans fenêtre et plus vite que le temps réel
+# - La vérification : le score final enregistré est comparé à celui rejoué
+#
+# POURQUOI ?
+# - Vérifier un record contesté
+# - Rejouer une vraie partie pour mesurer les performances
+#
+# FORMAT DU FICHIER (.fsr) :
+#   "FSRP" + version (1 octet), puis le reste compressé avec zlib :
+#   - en-tête : nombre de joueurs, graine (signée depuis la version 4),
+#     largeur, hauteur, options
+#     (version 2 ; bit 0 = trajectoires analytiques, voir trajectoires.py ;
+#     bit 1 = apparitions en vagues, voir vagues.py), difficulté (version 3 :
+#     longueur puis JSON de la courbe du mode et de niveau_max, voir
+#     difficulte.py ; une partie se rejoue avec la difficulté qu'elle avait,
+#     même si difficulte.json a changé depuis)
+#   - enregistrements : écart de frame, code, données
+#   Les entiers sont des "varint" (7 bits par octet) : un petit nombre tient
+#   sur un seul octet. Les déplacements de souris sont des différences avec
+#   la position précédente (le plus souvent quelques pixels).
+#
+# ============================================================================
+
+import argparse
+import json
+import os
+import time
+import zlib
+from datetime import datetime
+
+MAGIQUE = b"FSRP"
+VERSION = 4
+VERSIONS_LUES = (1, 2, 3, 4)
+
+# Options de la partie (en-tête, version 2)
+OPTION_TRAJECTOIRES = 1
+OPTION_VAGUES = 2
+
+# Codes des enregistrements
+SOURIS = 0  # dx, dy
+APPUI = 1
+RELACHE = 2
+TOUCHE = 3  # code de la touche
+TAILLE = 4  # largeur, hauteur
+ABANDON = 5
+FIN = 6  # frame finale, score, niveau, vies J1, vies J2
+
+
+# ============================================================================
+# ENCODAGE DES ENTIERS
+# ============================================================================
+def ecrire_varint(tampon, valeur):
+    """
+    Ajoute un entier positif au tampon, 7 bits par octet.
+
+    Args:
+        tampon (bytearray): Données en cours d'écriture
+        valeur (int): Entier >= 0
+    """
+    while valeur >= 0x80:
+        tampon.append((valeur & 0x7F) | 0x80)
+        valeur >>= 7
+    tampon.append(valeur)
+
+
+def ecrire_signe(tampon, valeur):
+    """Ajoute un entier signé (codage "zigzag" : 0, -1, 1, -2, 2...)."""
+    ecrire_varint(tampon, valeur * 2 if valeur >= 0 else -valeur * 2 - 1)
+
+
+def lire_varint(donnees, position):
+    """
+    Lit un entier positif.
+
+    Retourne:
+        tuple: (valeur, position après l'entier)
+    """
+    valeur = 0
+    decalage = 0
+    while True:
+        octet = donnees[position]
+        position += 1
+        valeur |= (octet & 0x7F) << decalage
+        if octet < 0x80:
+            return valeur, position
+        decalage += 7
+
+
+def lire_signe(donnees, position):
+    """Lit un entier signé (voir ecrire_signe)."""
+    valeur, position = lire_varint(donnees, position)
+    return (valeur >> 1) ^ -(valeur & 1), position
+
+
+# ============================================================================
+# CLASSE : EnregistreurReplay
+# ============================================================================
+class EnregistreurReplay:
+    """
+    Enregistre les entrées d'une partie.
+
+    S'attache à une Simulation (simulation.enregistreur = EnregistreurReplay()) :
+    la simulation l'appelle à chaque entrée, au début et à la fin de la partie.
+
+    Attributs:
+        corps (bytearray): Données non compressées de la partie en cours
+        derniere_frame (int): Frame du dernier enregistrement
+        derniere_souris (tuple): Dernière position de souris enregistrée
+        termine (bool): True quand la fin de partie a été écrite
+    """
+
+    def __init__(self):
+        self.corps = bytearray()
+        self.derniere_frame = 0
+        self.derniere_souris = (0, 0)
+        self.termine = False
+
+    def commencer(self, simulation):
+        """Écrit l'en-tête d'une nouvelle partie (efface la précédente)."""
+        self.corps = bytearray()
+        self.derniere_frame = 0
+        self.derniere_souris = (0, 0)
+        self.termine = False
+
+        ecrire_varint(self.corps, simulation.nombre_de_joueurs)
+        # Signée : --graine -1 ou GRAINE_PARTIE = -1 sont des graines valides
+        ecrire_signe(self.corps, simulation.graine)
+        ecrire_varint(self.corps, simulation.largeur)
+        ecrire_varint(self.corps, simulation.hauteur)
+        options = 0
+        if simulation.trajectoires:
+            options |= OPTION_TRAJECTOIRES
+        if simulation.vagues:
+            options |= OPTION_VAGUES
+        ecrire_varint(self.corps, options)
+
+        # Difficulté de la partie (version 3)
+        table = simulation.table
+        texte = json.dumps(
+            {"niveau_max": table.niveau_max, "courbe": table.courbe},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        ecrire_varint(self.corps, len(texte))
+        self.corps += texte
+
+    def _entete(self, frame, code):
+        """Écrit l'écart de frame et le code d'un enregistrement."""
+        ecrire_varint(self.corps, frame - self.derniere_frame)
+        self.corps.append(code)
+        self.derniere_frame = frame
+
+    def souris(self, frame, pos):
+        """Nouvelle position de la souris."""
+        x, y = int(pos[0]), int(pos[1])
+        self._entete(frame, SOURIS)
+        ecrire_signe(self.corps, x - self.derniere_souris[0])
+        ecrire_signe(self.corps, y - self.derniere_souris[1])
+        self.derniere_souris = (x, y)
+
+    def appui(self, frame):
+        """Bouton de la souris enfoncé."""
+        self._entete(frame, APPUI)
+
+    def relache(self, frame):
+        """Bouton de la souris relâché."""
+        self._entete(frame, RELACHE)
+
+    def touche(self, frame, key):
+        """Touche du clavier."""
+        self._entete(frame, TOUCHE)
+        ecrire_varint(self.corps, key)
+
+    def taille(self, frame, largeur, hauteur):
+        """Changement de taille du terrain (plein écran sans résolution logique)."""
+        self._entete(frame, TAILLE)
+        ecrire_varint(self.corps, largeur)
+        ecrire_varint(self.corps, hauteur)
+
+    def abandon(self, frame):
+        """Partie quittée avec Échap."""
+        self._entete(frame, ABANDON)
+
+    def terminer(self, simulation):
+        """Écrit l'état final, qui servira à vérifier la relecture."""
+        self._entete(simulation.frame, FIN)
+        ecrire_varint(self.corps, simulation.score)
+        ecrire_varint(self.corps, simulation.niveau)
+        ecrire_signe(self.corps, simulation.vies_j1)
+        ecrire_signe(self.corps, simulation.vies_j2)
+        self.termine = True
+
+    def en_octets(self):
+        """Retourne le contenu du fichier .fsr."""
+        return encoder(self.corps)
+
+    def sauvegarder(self, chemin):
+        """
+        Écrit la partie dans un fichier.
+
+        Args:
+            chemin (str): Chemin du fichier .fsr
+        """
+        with open(chemin, "wb") as fichier:
+            fichier.write(self.en_octets())
+
+
+def encoder(corps):
+    """
+    Contenu d'un fichier .fsr.
+
+    Args:
+        corps (bytes): Données non compressées (EnregistreurReplay.corps)
+
+    Retourne:
+        bytes: En-tête puis données compressées
+    """
+    return MAGIQUE + bytes([VERSION]) + zlib.compress(bytes(corps), 9)
+
+
+def sauvegarder_replay(simulation, dossier, maximum=None):
+    """
+    Écrit le replay de la partie terminée dans un dossier.
+
+    Le nom contient la date (la même que dans scores.json), le mode et la graine.
+
+    Args:
+        simulation (Simulation): Partie terminée, avec son enregistreur
+        dossier (str): Dossier des replays (créé si besoin)
+        maximum (int): Replays gardés au plus dans le dossier (None = tous)
+
+    Retourne:
+        str: Chemin du fichier écrit
+    """
+    return ecrire_replay(
+        simulation.enregistreur.corps,
+        simulation.nombre_de_joueurs,
+        simulation.graine,
+        dossier,
+        maximum,
+    )
+
+
+def ecrire_replay(corps, nombre_de_joueurs, graine, dossier, maximum=None):
+    """
+    Comme sauvegarder_replay, depuis une copie des données (la compression
+    et l'écriture peuvent alors se faire dans un autre thread que le jeu).
+
+    Args:
+        corps (bytes): Données non compressées de la partie (evenements.EtatPartie.replay)
+        nombre_de_joueurs (int): 1 ou 2
+        graine (int): Graine de la partie
+        dossier (str): Dossier des replays (créé si besoin)
+        maximum (int): Replays gardés au plus dans le dossier (None = tous)
+
+    Retourne:
+        str: Chemin du fichier écrit
+    """
+    os.makedirs(dossier, exist_ok=True)
+    nom = f"{datetime.now():%Y-%m-%d_%H-%M-%S}_{nombre_de_joueurs}j_{graine}.fsr"
+    chemin = os.path.join(dossier, nom)
+    with open(chemin, "wb") as fichier:
+        fichier.write(encoder(corps))
+    if maximum is not None:
+        supprimer_anciens_replays(dossier, maximum)
+    return chemin
+
+
+def supprimer_anciens_replays(dossier, maximum):
+    """
+    Supprime les replays les plus anciens d'un dossier au-delà d'un nombre.
+
+    Args:
+        dossier (str): Dossier des replays
+        maximum (int): Replays gardés
+
+    Retourne:
+        list: Chemins supprimés
+    """
+    # Les noms commencent par la date : l'ordre alphabétique est l'ordre chronologique
+    fichiers = sorted(nom for nom in os.listdir(dossier) if nom.endswith(".fsr"))
+    supprimes = []
+    for nom in fichiers[: max(0, len(fichiers) - maximum)]:
+        chemin = os.path.join(dossier, nom)
+        try:
+            os.remove(chemin)
+        except OSError:
+            continue
+        supprimes.append(chemin)
+    return supprimes
+
+
+# ============================================================================
+# LECTURE
+# ============================================================================
+def lire_replay(donnees):
+    """
+    Décode un fichier .fsr.
+
+    Args:
+        donnees (bytes): Contenu du fichier
+
+    Retourne:
+        dict: "nombre_de_joueurs", "graine", "largeur", "hauteur",
+              "trajectoires" (mode des trajectoires analytiques),
+              "vagues" (apparitions en vagues),
+              "difficulte" ({"niveau_max": ..., "courbe": ...}, None avant
+              la version 3),
+              "entrees" (liste de (frame, entree) au format de simulation.py),
+              "fin" (dict de l'état final, ou None si la partie n'est pas finie)
+    """
+    if donnees[:4] != MAGIQUE:
+        raise ValueError("Ce n'est pas un fichier de replay Fruit Slicer")
+    if len(donnees) < 5:
+        raise ValueError("Replay tronqué ou invalide")
+    if donnees[4] not in VERSIONS_LUES:
+        raise ValueError(f"Version de replay non supportée : {donnees[4]}")
+
+    # Un fichier coupé (copie interrompue) ou abîmé s'arrête au milieu d'un
+    # entier ou d'un enregistrement
+    try:
+        return _decoder(donnees[4], zlib.decompress(donnees[5:]))
+    except (IndexError, zlib.error, ValueError):
+        raise ValueError("Replay tronqué ou invalide") from None
+
+
+def _decoder(version, corps):
+    """Décode le corps décompressé d'un fichier .fsr (voir lire_replay)."""
+    position = 0
+    nombre_de_joueurs, position = lire_varint(corps, position)
+    if version >= 4:
+        graine, position = lire_signe(corps, position)
+    else:
+        graine, position = lire_varint(corps, position)
+    largeur, position = lire_varint(corps, position)
+    hauteur, position = lire_varint(corps, position)
+    options = 0
+    if version >= 2:
+        options, position = lire_varint(corps, position)
+    difficulte = None
+    if version >= 3:
+        longueur, position = lire_varint(corps, position)
+        difficulte = json.loads(corps[position : position + longueur].decode("utf-8"))
+        position += longueur
+        if not (
+            isinstance(difficulte, dict)
+            and isinstance(difficulte.get("courbe"), dict)
+            and isinstance(difficulte.get("niveau_max"), int)
+        ):
+            raise ValueError("Difficulté du replay mal formée")
+
+    entrees = []
+    fin = None
+    frame = 0
+    x, y = 0, 0
+    while position < len(corps):
+        ecart, position = lire_varint(corps, position)
+        frame += ecart
+        code = corps[position]
+        position += 1
+
+        if code == SOURIS:
+            dx, position = lire_signe(corps, position)
+            dy, position = lire_signe(corps, position)
+            x += dx
+            y += dy
+            entrees.append((frame, ("souris", x, y)))
+        elif code == APPUI:
+            entrees.append((frame, ("appui",)))
+        elif code == RELACHE:
+            entrees.append((frame, ("relache",)))
+        elif code == TOUCHE:
+            key, position = lire_varint(corps, position)
+            entrees.append((frame, ("touche", key)))
+        elif code == TAILLE:
+            l, position = lire_varint(corps, position)
+            h, position = lire_varint(corps, position)
+            entrees.append((frame, ("taille", l, h)))
+        elif code == ABANDON:
+            entrees.append((frame, ("abandon",)))
+        elif code == FIN:
+            fin = {"frame": frame}
+            fin["score"], position = lire_varint(corps, position)
+            fin["niveau"], position = lire_varint(corps, position)
+            fin["vies_j1"], position = lire_signe(corps, position)
+            fin["vies_j2"], position = lire_signe(corps, position)
+        else:
+            raise ValueError(f"Enregistrement inconnu : {code}")
+
+    return {
+        "nombre_de_joueurs": nombre_de_joueurs,
+        "graine": graine,
+        "largeur": largeur,
+        "hauteur": hauteur,
+        "trajectoires": bool(options & OPTION_TRAJECTOIRES),
+        "vagues": bool(options & OPTION_VAGUES),
+        "difficulte": difficulte,
+        "entrees": entrees,
+        "fin": fin,
+    }
+
+
+def charger_replay(chemin):
+    """Lit et décode un fichier .fsr (voir lire_replay)."""
+    with open(chemin, "rb") as fichier:
+        return lire_replay(fichier.read())
+
+
+def rejouer(replay, effets=False):
+    """
+    Rejoue une partie enregistrée sans affichage, avec la difficulté
+    enregistrée (les replays d'avant la version 3 n'en ont pas : ils sont
+    rejoués avec les tables actuelles de difficulte.json).
+
+    Args:
+        replay (dict): Replay décodé (voir lire_replay)
+        effets (bool): Recréer aussi les particules (pour mesurer le dessin)
+
+    Retourne:
+        tuple: (Simulation à la fin de la relecture, True si l'état final est
+               identique à celui enregistré, None si le replay n'a pas de fin)
+    """
+    # Import local : simulation importe pygame et les objets du jeu
+    from difficulte import compiler_courbe
+    from simulation import Simulation, executer, pilote_depuis_script
+
+    tables = None
+    if replay["difficulte"] is not None:
+        tables = {
+            replay["nombre_de_joueurs"]: compiler_courbe(
+                replay["difficulte"]["courbe"], replay["difficulte"]["niveau_max"]
+            )
+        }
+
+    simulation = Simulation(
+        replay["nombre_de_joueurs"],
+        replay["largeur"],
+        replay["hauteur"],
+        effets=effets,
+        graine=replay["graine"],
+        trajectoires=replay["trajectoires"],
+        vagues=replay["vagues"],
+        tables=tables,
+    )
+
+    fin = replay["fin"]
+    if fin is not None:
+        nombre_frames = fin["frame"] + 1
+    elif replay["entrees"]:
+        nombre_frames = replay["entrees"][-1][0] + 1
+    else:
+        nombre_frames = 0
+
+    executer(simulation, nombre_frames, pilote_depuis_script(replay["entrees"]))
+
+    if fin is None:
+        return simulation, None
+
+    identique = (
+        simulation.frame == fin["frame"]
+        and simulation.score == fin["score"]
+        and simulation.niveau == fin["niveau"]
+        and simulation.vies_j1 == fin["vies_j1"]
+        and simulation.vies_j2 == fin["vies_j2"]
+    )
+    return simulation, identique
+
+
+def main():
+    """Point d'entrée : python replay.py replays/partie.fsr"""
+    parser = argparse.ArgumentParser(description="Relecture d'une partie de Fruit Slicer")
+    parser.add_argument("fichier", help="Fichier .fsr à rejouer")
+    parser.add_argument("--images", action="store_true", help="Charger les images")
+    args = parser.parse_args()
+
+    from simulation import initialiser_sans_affichage
+
+    initialiser_sans_affichage(charger_images=args.images)
+    try:
+        replay = charger_replay(args.fichier)
+    except (OSError, ValueError) as e:
+        print(f"❌ {args.fichier} : {e}")
+        raise SystemExit(1)
+    if replay["difficulte"] is None:
+        print("⚠️ Ancien replay sans difficulté enregistrée : rejoué avec difficulte.json actuel")
+
+    debut = time.perf_counter()
+    simulation, identique = rejouer(replay, effets=args.images)
+    duree = time.perf_counter() - debut
+
+    print(
+        f"{simulation.frame} frames rejouées en {duree:.2f} s "
+        f"({simulation.frame / 60 / max(duree, 1e-9):.0f}x le temps réel)"
+    )
+    print(f"Score {simulation.score}, niveau {simulation.niveau}, graine {replay['graine']}")
+    if identique is None:
+        print("⚠️ Partie non terminée : rien à vérifier")
+    elif identique:
+        print("✅ Replay conforme au score enregistré")
+    else:
+        print(f"❌ Replay NON conforme : attendu {replay['fin']}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
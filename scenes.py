@@ -0,0 +1,189 @@
+# ============================================================================
+# FICHIER : scenes.py
+# DESCRIPTION : Écrans du jeu sous forme de scènes (menu, règles, jeu...)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - La classe Scene : un écran avec ses étapes (entrer, sortir, événements,
+#   mise à jour, dessin)
+# - Le GestionnaireScenes : garde la scène active et passe d'une scène à
+#   l'autre en appelant sortir() puis entrer()
+#
+# POURQUOI ?
+# Avant, la boucle principale était une longue chaîne de
+# "if etat_jeu == ...", parcourue à chaque frame et pour chaque événement.
+# Avec les scènes, chaque frame n'exécute que le code de l'écran affiché, et
+# chaque scène charge ce qui lui coûte cher (écran pré-dessiné, scores lus
+# sur le disque...) en entrant et le libère en sortant.
+#
+# ORDRE DES APPELS DANS UNE FRAME :
+#     scenes.verifier_taille(fenetre.get_size())
+#     for event in pygame.event.get():
+#         scenes.evenement(event)
+#     scenes.mettre_a_jour()
+#     scenes.dessiner(scenes.surface(fenetre))
+#
+# Un changement de scène est immédiat (comme l'ancien etat_jeu) : les
+# événements suivants de la même frame vont déjà à la nouvelle scène.
+#
+# FRONTIÈRE DE SCÈNE :
+# Entre la sortie d'une scène et l'entrée de la suivante, rien n'est
+# affiché ni en cours : c'est là que le rechargement à chaud remplace les
+# images et la difficulté (voir a_chaque_changement et rechargement.py).
+#
+# ============================================================================
+
+import journal
+
+
+class Scene:
+    """
+    Un écran du jeu. Les méthodes ne font rien par défaut : chaque scène
+    n'écrit que celles dont elle a besoin.
+
+    Attributs:
+        nom (str): Nom de la scène ("menu", "regles", "scores", "jeu"...)
+    """
+
+    nom = None
+
+    def entrer(self):
+        """Appelée quand la scène devient active (chargement des ressources)."""
+
+    def sortir(self):
+        """Appelée quand on quitte la scène (libération des ressources)."""
+
+    def redimensionner(self, largeur, hauteur):
+        """
+        Appelée en entrant et quand la fenêtre change de taille.
+
+        Args:
+            largeur (int): Largeur de la fenêtre
+            hauteur (int): Hauteur de la fenêtre
+        """
+
+    def evenement(self, event):
+        """
+        Traite un événement Pygame (clic, touche...).
+
+        Args:
+            event (Event): L'événement
+        """
+
+    def mettre_a_jour(self):
+        """Logique d'une frame (avant le dessin)."""
+
+    def surface(self, fenetre):
+        """
+        Retourne la surface sur laquelle la scène dessine.
+
+        Args:
+            fenetre (Surface): La fenêtre du jeu
+
+        Retourne:
+            Surface: La fenêtre par défaut
+        """
+        return fenetre
+
+    def dessiner(self, screen):
+        """
+        Dessine la scène.
+
+        Args:
+            screen (Surface): Surface retournée par surface()
+        """
+
+
+class GestionnaireScenes:
+    """
+    Garde la scène active et fait les transitions.
+
+    Attributs:
+        scenes (dict): Scènes par nom
+        active (Scene): La scène affichée (None avant le premier changer())
+        taille (tuple): Dernière taille de fenêtre connue (largeur, hauteur)
+        transitions (list): Fonctions appelées à chaque frontière de scène
+    """
+
+    def __init__(self):
+        self.scenes = {}
+        self.active = None
+        self.taille = (0, 0)
+        self.transitions = []
+
+    def ajouter(self, scene):
+        """
+        Enregistre une scène (sous son nom).
+
+        Args:
+            scene (Scene): La scène
+        """
+        self.scenes[scene.nom] = scene
+
+    def a_chaque_changement(self, fonction):
+        """
+        Appelle une fonction à chaque changement de scène, après la sortie de
+        l'ancienne et avant l'entrée de la nouvelle.
+
+        Args:
+            fonction (callable): Fonction sans argument
+        """
+        self.transitions.append(fonction)
+
+    @property
+    def nom(self):
+        """Nom de la scène active (None avant le premier changer())."""
+        return self.active.nom if self.active is not None else None
+
+    def changer(self, nom):
+        """
+        Quitte la scène active et entre dans une autre.
+
+        Args:
+            nom (str): Nom de la scène suivante
+        """
+        suivante = self.scenes[nom]
+        precedente = self.active
+        if precedente is not None:
+            precedente.sortir()
+        for transition in self.transitions:
+            transition()
+        self.active = suivante
+        if journal.actif_debug:
+            journal.ecrire(
+                journal.DEBUG,
+                "scenes",
+                "Changement de scène",
+                de=precedente.nom if precedente is not None else None,
+                vers=nom,
+            )
+        suivante.entrer()
+        suivante.redimensionner(*self.taille)
+
+    def verifier_taille(self, taille):
+        """
+        Prévient la scène active si la fenêtre a changé de taille.
+
+        Args:
+            taille (tuple): Taille actuelle de la fenêtre (largeur, hauteur)
+        """
+        if taille != self.taille:
+            self.taille = taille
+            if self.active is not None:
+                self.active.redimensionner(*taille)
+
+    def evenement(self, event):
+        """Passe un événement à la scène active."""
+        self.active.evenement(event)
+
+    def mettre_a_jour(self):
+        """Logique d'une frame de la scène active."""
+        self.active.mettre_a_jour()
+
+    def surface(self, fenetre):
+        """Surface de dessin de la scène active."""
+        return self.active.surface(fenetre)
+
+    def dessiner(self, screen):
+        """Dessine la scène active."""
+        self.active.dessiner(screen)
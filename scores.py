@@ -112,7 +112,9 @@ def charger_scores(mode="1j"):
 # ============================================================================
 # FONCTION : sauvegarder_score
 # ============================================================================
-def sauvegarder_score(score, niveau, duree_secondes=0, mode="1j", gagnant=None):
+def sauvegarder_score(
+    score, niveau, duree_secondes=0, mode="1j", gagnant=None, graine=None
+):
     """
     :Param: Sauvegarde une nouvelle partie dans l'historique.
 
@@ -121,7 +123,8 @@ def sauvegarder_score(score, niveau, duree_secondes=0, mode="1j", gagnant=None):
         niveau (int): Le niveau atteint dans la partie
         duree_secondes (int): La durée de la partie en secondes (optionnel, par défaut 0)
         mode (str): Le mode de jeu ("1j" ou "2j")
-        gagnant (str): Le joueur gagnant en mode 2 joueurs ("J1", "J2" ou "Égalité")
+        gagnant (str): Le joueur gagnant en mode 2 joueurs ("J1", "J2" ou "egalite")
+        graine (int): La graine aléatoire de la partie (pour la rejouer)
 
     :Return:
         L'index de la partie dans le classement trié par score (1 = meilleur)
@@ -160,6 +163,10 @@ def sauvegarder_score(score, niveau, duree_secondes=0, mode="1j", gagnant=None):
     if mode == "2j" and gagnant:
         nouvelle_partie["gagnant"] = gagnant
 
+    # Graine de la partie : même graine + mêmes gestes = même partie
+    if graine is not None:
+        nouvelle_partie["graine"] = graine
+
     # Ajoute la nouvelle partie à l'historique approprié
     cle = f"historique_{mode}"
     donnees[cle].append(nouvelle_partie)
@@ -0,0 +1,987 @@
+# ============================================================================
+# FICHIER : simulation.py
+# DESCRIPTION : Logique d'une partie, indépendante de la fenêtre
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - L'apparition des objets (fruits, bombes, glaçons)
+# - La physique, les freeze, les vies, le score et les niveaux
+# - Les collisions (via controller.py)
+# - Un mode "sans affichage" qui fait tourner des milliers de frames par
+#   seconde, piloté par des entrées scriptées
+#
+# POURQUOI ?
+# - Avant, toute la logique était dans la boucle de main.py, liée à une vraie
+#   fenêtre, à pygame.mouse.get_pos() et à clock.tick(60)
+# - Ici, une partie avance d'UNE frame à chaque appel de etape() : main.py
+#   l'affiche, mais les benchmarks, l'équilibrage et les tests peuvent la faire
+#   tourner sans écran (pilote SDL "dummy") et sans limite de FPS
+#
+# ============================================================================
+
+import argparse
+import os
+import random
+import time
+
+import pygame
+
+import controller
+import difficulte
+from evenements import BombeTouchee, FinPartie, FruitRate, FruitTranche, GlaconTouche, NiveauMonte
+import journal
+import physique
+from ordonnanceur import Ordonnanceur
+import trajectoires
+from vagues import DirecteurVagues
+from constantes import (
+    liste_fruits,
+    liste_objets_speciaux,
+    load_assets,
+    TRAJECTOIRES_ANALYTIQUES,
+    VAGUES_APPARITION,
+)
+from objets import (
+    GENRES,
+    ObjetsVolants,
+    Morceaux,
+    Particules,
+    prechauffer,
+    systeme_mouvement,
+    systeme_etats_sprite,
+    systeme_rebonds,
+    systeme_rates,
+)
+import qualite
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+FPS = 60  # La simulation avance par frames de 1/60 de seconde
+DUREE_DECOMPTE = 3 * FPS  # Décompte "3, 2, 1" avant le début de la partie
+EXPLOSION_DUREE = 60  # Durée de l'animation d'explosion en frames
+FREEZE_DELAI_FRAMES = 120  # 2 secondes entre le glaçon tranché et le freeze
+VIES_DEPART = 3
+
+# Zones de temps de l'ordonnanceur : la partie (mode 1 joueur, explosion,
+# apparitions) et une zone par joueur (freeze du mode 2 joueurs)
+ZONES = ("partie", "j1", "j2")
+
+# Étapes d'une frame où passent les minuteries (dans cet ordre)
+ORDRE_FREEZE = 0  # Délais avant freeze et fins de freeze
+ORDRE_EXPLOSION = 1  # Fin de l'explosion de la bombe
+ORDRE_APPARITION = 2  # Lancer des objets
+
+
+class Simulation:
+    """
+    Une partie en cours (mode 1 ou 2 joueurs), avancée frame par frame.
+
+    Les entrées (souris, clavier) sont données par des méthodes, et etape()
+    retourne la liste des événements de la frame (sons à jouer, fin de
+    partie...). La simulation ne dessine rien et ne sauvegarde rien.
+
+    Événements retournés par etape() et par les méthodes d'entrée (voir
+    evenements.py) :
+        FruitTranche(fruits, x, y, combo) : fruit(s) tranché(s) en x, y ; combo =
+                                    fruits du geste (souris) ou de la zone (clavier)
+        BombeTouchee(x, y)        : bombe tranchée (explosion en x, y)
+        GlaconTouche(x, y)        : glaçon tranché
+        FruitRate(joueur, vies)   : fruit raté par le joueur 1 ou 2
+        NiveauMonte(niveau)       : montée de niveau (mode 1 joueur)
+        FinPartie(raison)         : partie terminée ("bombe" ou "vies")
+
+    Attributs principaux:
+        nombre_de_joueurs (int): 1 ou 2
+        largeur, hauteur (int): Taille du terrain de jeu
+        effets (bool): Créer les particules (False = plus rapide sans affichage)
+        trajectoires (bool): Trajectoires analytiques (voir trajectoires.py) ;
+            fixé à la création (une partie se rejoue dans le même mode)
+        vagues (bool): Apparitions en vagues planifiées (voir vagues.py),
+            sinon un objet à la fois ; fixé à la création, comme trajectoires
+        tables (dict): Nombre de joueurs -> difficulte.TableDifficulte
+            (None = tables du fichier de difficulté)
+        table (difficulte.TableDifficulte): Tables du mode de la partie
+        frame (int): Nombre de frames écoulées depuis le début (décompte compris)
+        mes_fruits (objets.ObjetsVolants): Fruits, glaçons et bombes à l'écran
+        morceaux_fruits (objets.Morceaux), particules_explosion,
+            particules_glace (objets.Particules): Effets visuels
+        vies_j1, vies_j2, score, niveau, gravite_actuelle
+        ordonnanceur (Ordonnanceur): Minuteries de la partie (freeze,
+            explosion, apparitions), une zone de temps par joueur
+        directeur (DirecteurVagues): Plan des vagues (None sans vagues)
+        freezes (dict): Zone gelée -> minuterie de fin du freeze
+        freezes_en_attente (dict): Zone -> minuterie de début du freeze
+            (délai après le glaçon tranché)
+        explosion (Minuterie): Fin de l'explosion en cours (None = aucune)
+        termine (bool), raison_fin (str), gagnant (str, mode 2 joueurs)
+        graine (int): Graine de la partie (enregistrée avec le score)
+        rng (Random): Flux aléatoire de la logique (apparitions, vitesses, freeze)
+        rng_effets (Random): Flux aléatoire des effets (particules, morceaux)
+        enregistreur (EnregistreurReplay): Journal des entrées (None = pas
+            d'enregistrement, voir replay.py)
+        profileur (Profileur): Mesure des phases de etape() (None = pas de
+            mesure, voir profileur.py)
+        controleurs (tuple): Tranchage à la souris de J1 et de J2
+            (controller.ControleurJoueur) ; la souris est à J1 en mode 1
+            joueur, à J2 en mode 2 joueurs (voir controleur_souris)
+
+    Tout l'état de la partie est ici (et dans ses contrôleurs) : plusieurs
+    parties peuvent tourner dans le même processus (bots, équilibrage).
+    __slots__ fixe la liste des attributs : demarrer() remet à zéro les mêmes
+    emplacements, et une faute de frappe lève une erreur au lieu de créer un
+    nouvel attribut.
+    """
+
+    __slots__ = (
+        "largeur",
+        "hauteur",
+        "effets",
+        "trajectoires",
+        "vagues",
+        "tables",
+        "table",
+        "enregistreur",
+        "profileur",
+        "controleurs",
+        "nombre_de_joueurs",
+        "graine",
+        "rng",
+        "rng_effets",
+        "frame",
+        "pos_souris",
+        "evenements",
+        "mes_fruits",
+        "morceaux_fruits",
+        "particules_explosion",
+        "particules_glace",
+        "vies_j1",
+        "vies_j2",
+        "score",
+        "niveau",
+        "gravite_actuelle",
+        "ordonnanceur",
+        "directeur",
+        "freezes",
+        "freezes_en_attente",
+        "explosion",
+        "is_bomb_exploded",
+        "termine",
+        "raison_fin",
+        "gagnant",
+    )
+
+    def __init__(
+        self,
+        nombre_de_joueurs=1,
+        largeur=1280,
+        hauteur=720,
+        effets=True,
+        graine=None,
+        tables=None,
+        trajectoires=None,
+        vagues=None,
+    ):
+        self.largeur = largeur
+        self.hauteur = hauteur
+        self.effets = effets
+        self.trajectoires = TRAJECTOIRES_ANALYTIQUES if trajectoires is None else trajectoires
+        self.vagues = VAGUES_APPARITION if vagues is None else vagues
+        self.tables = tables
+        self.enregistreur = None
+        self.profileur = None
+        self.controleurs = (controller.ControleurJoueur(), controller.ControleurJoueur())
+        self.demarrer(nombre_de_joueurs, graine)
+
+    # ========================================================================
+    # INITIALISATION
+    # ========================================================================
+    def demarrer(self, nombre_de_joueurs=None, graine=None):
+        """
+        Remet la partie à zéro (nouvelle partie).
+
+        Args:
+            nombre_de_joueurs (int): 1 ou 2 (None = garder le mode actuel)
+            graine (int): Graine de la partie (None = tirée au hasard)
+        """
+        if nombre_de_joueurs is not None:
+            self.nombre_de_joueurs = nombre_de_joueurs
+
+        # Même graine + mêmes entrées = même partie
+        if graine is None:
+            graine = random.getrandbits(32)
+        self.graine = graine
+        # Deux flux séparés : le nombre de particules dépend de la qualité,
+        # il ne doit pas décaler les tirages des apparitions
+        self.rng = random.Random(graine)
+        self.rng_effets = random.Random(f"effets-{graine}")
+
+        self.frame = 0
+        self.pos_souris = (self.largeur // 2, self.hauteur // 2)
+        self.evenements = []
+
+        # Objets à l'écran (une colonne par composant, voir objets.py)
+        self.mes_fruits = ObjetsVolants(self.trajectoires)
+        self.morceaux_fruits = Morceaux()
+        self.particules_explosion = Particules("cercle")
+        self.particules_glace = Particules("eclat")
+
+        # Vies, score et niveau
+        self.vies_j1 = VIES_DEPART
+        self.vies_j2 = VIES_DEPART
+        self.score = 0
+        self.niveau = 1
+        tables = difficulte.TABLES if self.tables is None else self.tables
+        self.table = tables[self.nombre_de_joueurs]
+        self.gravite_actuelle = self.table.gravite[0]
+
+        # Minuteries : leurs horloges n'avancent qu'après le décompte.
+        # Premier objet (ou première vague) entre 30 et 100 frames après le décompte.
+        self.ordonnanceur = Ordonnanceur(ZONES)
+        if self.vagues:
+            self.directeur = DirecteurVagues(graine, self.nombre_de_joueurs)
+            lancer = self._lancer_vague
+        else:
+            self.directeur = None
+            lancer = self._lancer_objet
+        self.ordonnanceur.programmer(self.rng.randint(30, 100), lancer, ordre=ORDRE_APPARITION)
+
+        # Freeze : "partie" en mode 1 joueur, "j1" / "j2" en mode 2 joueurs
+        self.freezes = {}
+        self.freezes_en_attente = {}
+
+        # Explosion de la bombe
+        self.explosion = None
+        self.is_bomb_exploded = False
+
+        # Fin de partie
+        self.termine = False
+        self.raison_fin = None
+        self.gagnant = None
+
+        # Le tranchage en cours de la partie précédente est abandonné
+        for controleur in self.controleurs:
+            controleur.reinitialiser()
+
+        if self.enregistreur is not None:
+            self.enregistreur.commencer(self)
+
+    # ========================================================================
+    # TEMPS
+    # ========================================================================
+    @property
+    def en_attente(self):
+        """True pendant le décompte du début de partie."""
+        return self.frame < DUREE_DECOMPTE
+
+    @property
+    def explosion_en_cours(self):
+        """True pendant l'explosion de la bombe (avant la fin de partie)."""
+        return self.explosion is not None
+
+    def zone_de(self, x):
+        """
+        Zone de temps d'une position : "partie" en mode 1 joueur, sinon
+        "j1" (moitié gauche) ou "j2" (moitié droite).
+
+        Args:
+            x (float): Abscisse sur le terrain
+        """
+        if self.nombre_de_joueurs == 1:
+            return "partie"
+        return "j1" if x < self.largeur // 2 else "j2"
+
+    def gele(self, zone):
+        """True si la zone ("partie", "j1" ou "j2") est en freeze."""
+        return zone in self.freezes
+
+    def temps_freeze(self, zone):
+        """Frames de freeze restantes dans la zone (0 = pas de freeze)."""
+        fin = self.freezes.get(zone)
+        return fin.restant if fin is not None else 0
+
+    def geler(self, zone, duree):
+        """
+        Gèle une zone tout de suite (remplace le freeze en cours).
+
+        Args:
+            zone (str): "partie", "j1" ou "j2"
+            duree (int): Durée en frames (la frame actuelle compte déjà)
+        """
+        ancien = self.freezes.get(zone)
+        if ancien is not None:
+            self.ordonnanceur.annuler(ancien)
+        self.freezes[zone] = self.ordonnanceur.programmer(
+            duree - 1, self._degeler, zone, zone=zone, ordre=ORDRE_FREEZE
+        )
+
+    @property
+    def secondes_ecoulees(self):
+        """Temps écoulé depuis le début (décompte compris), en secondes."""
+        return self.frame / FPS
+
+    def temps_ms(self):
+        """Horodatage de la simulation en millisecondes (pour la traînée)."""
+        return self.frame * 1000 / FPS
+
+    @property
+    def controleur_souris(self):
+        """Contrôleur du joueur à la souris (J1 en mode 1 joueur, J2 en mode 2 joueurs)."""
+        return self.controleurs[1] if self.nombre_de_joueurs == 2 else self.controleurs[0]
+
+    def duree_partie(self):
+        """Durée de jeu en secondes, sans le décompte."""
+        return max(0, self.frame - DUREE_DECOMPTE) / FPS
+
+    # ========================================================================
+    # ENTRÉES
+    # ========================================================================
+    def definir_taille(self, largeur, hauteur):
+        """Change la taille du terrain de jeu (la fenêtre a été redimensionnée)."""
+        if (largeur, hauteur) == (self.largeur, self.hauteur):
+            return
+        self.largeur = largeur
+        self.hauteur = hauteur
+        if self.enregistreur is not None:
+            self.enregistreur.taille(self.frame, largeur, hauteur)
+
+    def deplacer_souris(self, pos):
+        """Mémorise la position de la souris (coordonnées du terrain)."""
+        if pos == self.pos_souris:
+            return
+        self.pos_souris = pos
+        if self.enregistreur is not None:
+            self.enregistreur.souris(self.frame, pos)
+
+    def appuyer_souris(self, pos=None):
+        """Bouton de la souris enfoncé : début du tranchage."""
+        if pos is not None:
+            self.deplacer_souris(pos)
+        if self.en_attente or self.termine:
+            return
+        if self.enregistreur is not None:
+            self.enregistreur.appui(self.frame)
+        self.controleur_souris.start_slice(self.pos_souris, temps=self.temps_ms())
+
+    def relacher_souris(self):
+        """
+        Bouton de la souris relâché : fin du geste et score du combo.
+
+        Retourne:
+            list: Les événements produits
+        """
+        self.evenements = []
+        if self.en_attente or self.termine:
+            return self.evenements
+        if self.enregistreur is not None:
+            self.enregistreur.relache(self.frame)
+
+        score_geste = self.controleur_souris.end_slice(
+            self.mes_fruits, self.largeur, self.nombre_de_joueurs
+        )
+        if journal.actif_debug:
+            journal.ecrire(
+                journal.DEBUG, "score", "Geste souris", points=score_geste, score=self.score
+            )
+
+        # Ajoute le score au total (mode 1 joueur uniquement)
+        if self.nombre_de_joueurs == 1 and isinstance(score_geste, int) and score_geste > 0:
+            self.mettre_a_jour_score_et_niveau(score_geste)
+        return self.evenements
+
+    def appuyer_touche(self, key):
+        """
+        Touche du clavier (Z, E, S, D) : tranche les objets de la zone.
+
+        Args:
+            key (int): Touche appuyée (pygame.K_*)
+
+        Retourne:
+            list: Les événements produits
+        """
+        self.evenements = []
+        if self.en_attente or self.termine:
+            return self.evenements
+        if self.enregistreur is not None:
+            self.enregistreur.touche(self.frame, key)
+
+        avant = len(self.mes_fruits)
+        result = controller.handle_keyboard_inputs(
+            self.mes_fruits,
+            self.largeur,
+            self.hauteur,
+            key,
+            self.nombre_de_joueurs,
+            self.morceaux_fruits,
+            rng=self.rng_effets,
+        )
+        # Au clavier, l'explosion part du centre de la zone J1 ; les fruits
+        # tranchés sont placés au centre de la zone de la touche
+        zone = controller.zones_clavier(self.largeur, self.hauteur).get(key)
+        if zone is not None and isinstance(result, int) and result > 0:
+            fruits = avant - len(self.mes_fruits)
+            self._traiter_resultat(
+                result,
+                ((zone[0] + zone[2]) // 2, (zone[1] + zone[3]) // 2),
+                fruits=fruits,
+                combo=fruits,
+            )
+        else:
+            self._traiter_resultat(result, (self.largeur // 4, self.hauteur // 2))
+        return self.evenements
+
+    def abandonner(self):
+        """Partie quittée (Échap) : terminée sans événement de fin."""
+        if self.termine:
+            return
+        if self.enregistreur is not None:
+            self.enregistreur.abandon(self.frame)
+        self.termine = True
+        self.raison_fin = "abandon"
+
+    # ========================================================================
+    # UNE FRAME DE JEU
+    # ========================================================================
+    def etape(self, pos_souris=None):
+        """
+        Fait avancer la partie d'une frame.
+
+        Args:
+            pos_souris (tuple): Position actuelle de la souris (optionnelle)
+
+        Retourne:
+            list: Les événements de la frame (voir la docstring de la classe)
+        """
+        self.evenements = []
+        if self.termine:
+            return self.evenements
+        if pos_souris is not None:
+            self.deplacer_souris(pos_souris)
+
+        # Les objets retirés à la frame précédente ne sont plus lus
+        self.mes_fruits.oublier_retires()
+        self.frame += 1
+        en_attente = self.en_attente
+
+        if not en_attente:
+            self.ordonnanceur.avancer()
+
+            # Étape 1 : début et fin des freeze
+            self.ordonnanceur.executer(ORDRE_FREEZE)
+
+            # Étape 2 : fin de l'explosion, ou tranchage à la souris
+            if self.explosion_en_cours:
+                self.ordonnanceur.executer(ORDRE_EXPLOSION)
+            elif self.controleur_souris.slicing:
+                result = self.controleur_souris.update_slice(
+                    self.pos_souris,
+                    self.mes_fruits,
+                    self.largeur,
+                    self.nombre_de_joueurs,
+                    self.morceaux_fruits,
+                    temps=self.temps_ms(),
+                    rng=self.rng_effets,
+                )
+                self._traiter_resultat(result, self.pos_souris)
+            self._marquer("collisions")
+
+            # Étape 3 : apparition de nouveaux objets
+            self.ordonnanceur.executer(ORDRE_APPARITION)
+            self._marquer("apparitions")
+
+        # Étape 4 : physique des objets et fruits ratés
+        self._mettre_a_jour_objets(en_attente)
+
+        # Étape 5 : morceaux et particules
+        self._mettre_a_jour_effets()
+        self._marquer("objets")
+
+        # État final de la partie, écrit une fois la frame complète
+        if self.termine and self.enregistreur is not None:
+            self.enregistreur.terminer(self)
+
+        return self.evenements
+
+    def _marquer(self, phase):
+        """Termine une phase du profileur (s'il y en a un)."""
+        if self.profileur is not None:
+            self.profileur.marquer(phase)
+
+    def _champs_zone(self, zone):
+        """Champs du journal d'une zone : le joueur en mode 2 joueurs."""
+        return {} if zone == "partie" else {"joueur": ZONES.index(zone)}
+
+    def _commencer_freeze(self, zone):
+        """Le délai après le glaçon est écoulé : la zone gèle 3 à 5 secondes."""
+        del self.freezes_en_attente[zone]
+        freeze_duree = self.rng.randint(3, 5)  # Entre 3 et 5 secondes
+        self.geler(zone, freeze_duree * FPS)
+        if journal.actif_info:
+            journal.ecrire(
+                journal.INFO, "freeze", "Freeze activé", secondes=freeze_duree, **self._champs_zone(zone)
+            )
+
+    def _degeler(self, zone):
+        """Fin du freeze de la zone."""
+        del self.freezes[zone]
+        if journal.actif_info:
+            journal.ecrire(journal.INFO, "freeze", "Freeze terminé", **self._champs_zone(zone))
+
+    def _finir_explosion(self):
+        """Fin de l'animation d'explosion : la partie est perdue."""
+        self.explosion = None
+        self._terminer("bombe")
+
+    def _traiter_resultat(self, result, pos, fruits=1, combo=None):
+        """
+        Applique le résultat d'un tranchage (souris ou clavier).
+
+        Args:
+            result: Valeur retournée par controller (int, "game_over", "freeze"...)
+            pos (tuple): Position de l'effet (explosion, éclats de glace) ou des
+                fruits tranchés
+            fruits (int): Nombre de fruits tranchés (1 à la souris)
+            combo (int): Taille du combo (None = combo du geste en cours)
+        """
+        if result == "game_over":
+            # La bombe a été tranchée : explosion puis fin de partie
+            mx, my = pos
+            self.evenements.append(BombeTouchee(mx, my))
+            if self.effets:
+                for _ in range(qualite.nombre_particules(50)):
+                    self.particules_explosion.creer(mx, my, self.rng_effets)
+
+            # Une nouvelle bombe relance la durée de l'explosion
+            if self.explosion is not None:
+                self.ordonnanceur.annuler(self.explosion)
+            self.explosion = self.ordonnanceur.programmer(
+                EXPLOSION_DUREE, self._finir_explosion, ordre=ORDRE_EXPLOSION
+            )
+            self.is_bomb_exploded = True
+            if journal.actif_info:
+                journal.ecrire(journal.INFO, "bombe", "Explosion", x=mx, y=my)
+
+        elif result in ("freeze", "freeze_j1", "freeze_j2"):
+            # Le glaçon a été tranché : éclats de glace et freeze différé
+            mx, my = self.pos_souris
+            self.evenements.append(GlaconTouche(mx, my))
+            if self.effets:
+                for _ in range(qualite.nombre_particules(30)):
+                    self.particules_glace.creer(mx, my, self.rng_effets)
+
+            # "freeze" -> zone "partie", "freeze_j1" -> "j1", "freeze_j2" -> "j2"
+            zone = "partie" if result == "freeze" else result[-2:]
+            if zone not in self.freezes and zone not in self.freezes_en_attente:
+                self.freezes_en_attente[zone] = self.ordonnanceur.programmer(
+                    FREEZE_DELAI_FRAMES, self._commencer_freeze, zone, zone=zone, ordre=ORDRE_FREEZE
+                )
+                if journal.actif_info:
+                    journal.ecrire(journal.INFO, "freeze", "Freeze différé", **self._champs_zone(zone))
+
+        elif isinstance(result, int) and result > 0:
+            if combo is None:
+                combo = self.controleur_souris.get_combo_actuel()
+            self.evenements.append(FruitTranche(fruits, pos[0], pos[1], combo))
+            # Score en temps réel (mode 1 joueur)
+            if self.nombre_de_joueurs == 1:
+                # +1 point de base par fruit
+                points_gagnes = 1
+                # Bonus si combo >= 3
+                if self.controleur_souris.get_combo_actuel() >= 3:
+                    points_gagnes += 1  # +1 bonus
+
+                self.mettre_a_jour_score_et_niveau(points_gagnes)
+
+    def mettre_a_jour_score_et_niveau(self, points_gagnes):
+        """
+        Met à jour le score et vérifie si le joueur monte de niveau.
+
+        Args:
+            points_gagnes (int): Nombre de points à ajouter
+
+        Returns:
+            bool: True si le joueur a monté de niveau, False sinon
+        """
+        self.score += points_gagnes
+
+        # Vérifier montée de niveau tous les 10 points (par défaut)
+        nouveau_niveau = self.table.niveau_pour(self.score)
+        if nouveau_niveau > self.niveau:
+            self.niveau = nouveau_niveau
+            self.gravite_actuelle = self.table.gravite[self.table.ligne(self.niveau)]
+            if journal.actif_info:
+                journal.ecrire(
+                    journal.INFO,
+                    "score",
+                    "Niveau",
+                    niveau=self.niveau,
+                    gravite=round(self.gravite_actuelle, 2),
+                )
+            self.evenements.append(NiveauMonte(self.niveau))
+            return True
+
+        return False
+
+    def _frequences(self):
+        """
+        Intervalle des délais entre deux lancers au niveau actuel.
+
+        Retourne:
+            tuple: (min_freq, max_freq) en frames
+        """
+        # Les délais raccourcissent avec le niveau (voir difficulte.json)
+        ligne = self.table.ligne(self.niveau)
+        return self.table.freq_min[ligne], self.table.freq_max[ligne]
+
+    def _ecran_plein(self):
+        """True si le nombre maximal d'objets à l'écran (max_objets) est atteint."""
+        return self.mes_fruits.nombre >= self.table.max_objets[self.table.ligne(self.niveau)]
+
+    def _creer_objet(self, type_objet, zone_joueur):
+        """
+        Lance un objet depuis le bas du terrain.
+
+        Args:
+            type_objet (str): "pomme", "banane"... ou "ice", "bombe"
+            zone_joueur (int): 1, 2 ou None (mode 1 joueur)
+        """
+        self.mes_fruits.creer(
+            type_objet,
+            self.largeur,
+            self.hauteur,
+            zone_joueur,
+            self.gravite_actuelle,
+            rng=self.rng,
+        )
+        if journal.actif_debug and type_objet in liste_objets_speciaux:
+            journal.ecrire(journal.DEBUG, "apparition", "Objet spécial", type=type_objet, zone=zone_joueur)
+
+    def _lancer_objet(self):
+        """Apparitions sans vagues : lance un objet, puis programme le suivant."""
+        if self.explosion_en_cours or self._ecran_plein():
+            # Pas de lancer pendant l'explosion ni écran plein : on réessaie à la frame suivante
+            self.ordonnanceur.programmer(1, self._lancer_objet, ordre=ORDRE_APPARITION)
+            return
+
+        min_freq, max_freq = self._frequences()
+
+        # Gestion de la zone (2 joueurs ou non)
+        if self.nombre_de_joueurs == 2:
+            zone_joueur = self.rng.choice([1, 2])
+        else:
+            zone_joueur = None
+
+        # --- CHANCE D'OBJET SPÉCIAL (BOMBE OU ICE), 30% PAR DÉFAUT ---
+        if self.rng.randint(1, 100) <= self.table.chance_special[self.table.ligne(self.niveau)]:
+            # Choix aléatoire entre bombe et ice
+            self._creer_objet(self.rng.choice(liste_objets_speciaux), zone_joueur)
+        else:
+            # 70% : Fruit normal
+            self._creer_objet(self.rng.choice(liste_fruits), zone_joueur)
+
+        self.ordonnanceur.programmer(self.rng.randint(min_freq, max_freq), self._lancer_objet, ordre=ORDRE_APPARITION)
+
+    def _lancer_vague(self):
+        """
+        Apparitions en vagues (voir vagues.py) : programme tous les lancers
+        de la prochaine vague, puis la vague suivante.
+        """
+        if self.explosion_en_cours:
+            # La partie se termine : plus de vagues
+            return
+
+        chance_special = self.table.chance_special[self.table.ligne(self.niveau)]
+        vague = self.directeur.suivante(self.niveau, *self._frequences(), chance_special)
+        for decalage, type_objet, zone_joueur in vague["lancers"]:
+            self.ordonnanceur.programmer(
+                decalage, self._lancer_objet_vague, type_objet, zone_joueur, ordre=ORDRE_APPARITION
+            )
+        self.ordonnanceur.programmer(vague["pause"], self._lancer_vague, ordre=ORDRE_APPARITION)
+        if journal.actif_debug:
+            journal.ecrire(
+                journal.DEBUG, "apparition", "Vague", nature=vague["nature"], objets=len(vague["lancers"])
+            )
+
+        # Images de la vague suivante préparées pendant celle-ci
+        prechauffer(self.directeur.prochains_types())
+
+    def _lancer_objet_vague(self, type_objet, zone_joueur):
+        """Un lancer programmé d'une vague (annulé par l'explosion de la bombe)."""
+        if self.explosion_en_cours:
+            return
+        if self._ecran_plein():
+            # Écran plein : le lancer attend la frame suivante
+            self.ordonnanceur.programmer(
+                1, self._lancer_objet_vague, type_objet, zone_joueur, ordre=ORDRE_APPARITION
+            )
+            return
+        self._creer_objet(type_objet, zone_joueur)
+
+    def _mettre_a_jour_objets(self, en_attente):
+        """Déplace les objets (sauf zones gelées) et gère les fruits ratés."""
+        milieu_x = self.largeur // 2
+        objets = self.mes_fruits
+
+        # Rien ne bouge pendant le décompte ni quand tout est gelé
+        if self.nombre_de_joueurs == 1:
+            gel_gauche = gel_droite = self.gele("partie")
+        else:
+            gel_gauche, gel_droite = self.gele("j1"), self.gele("j2")
+
+        if en_attente or (gel_gauche and gel_droite):
+            pass
+        elif not objets.analytique and physique.utiliser(objets, physique.SEUIL_OBJETS):
+            # Beaucoup d'objets : une seule passe NumPy (mêmes résultats)
+            physique.deplacer_objets(objets, self.largeur, gel_gauche, gel_droite)
+        else:
+            # Lignes qui bougent : le côté de l'objet n'est pas gelé
+            if gel_gauche == gel_droite:
+                actifs = range(objets.nombre)
+            else:
+                x = objets.x
+                actifs = [
+                    i for i in range(objets.nombre) if not (gel_gauche if x[i] < milieu_x else gel_droite)
+                ]
+            if objets.analytique:
+                # Position calculée depuis l'âge : le freeze ne fait que
+                # retarder l'âge des objets gelés
+                trajectoires.systeme_trajectoires(objets, actifs, self.largeur)
+            else:
+                systeme_mouvement(objets, actifs)
+                systeme_rebonds(objets, actifs, self.largeur)
+            systeme_etats_sprite(objets, actifs)
+
+        # --- DÉTECTION FRUIT RATÉ ---
+        for f in systeme_rates(objets, self.hauteur + 50):
+            # On n'enlève une vie QUE pour les FRUITS non tranchés, hors décompte :
+            # un glaçon raté n'est pas une pénalité, une bombe évitée non plus !
+            if not GENRES[f.genre]["coute_une_vie"] or f.sliced or en_attente:
+                continue
+
+            if self.nombre_de_joueurs == 1:
+                self.vies_j1 -= 1
+                if journal.actif_info:
+                    journal.ecrire(journal.INFO, "vies", "Fruit raté", vies=self.vies_j1)
+                self.evenements.append(FruitRate(1, self.vies_j1))
+                if self.vies_j1 <= 0:
+                    self._terminer("vies")
+            else:
+                # Mode 2 joueurs : on regarde le côté
+                if f.x < milieu_x:
+                    self.vies_j1 -= 1
+                    if journal.actif_info:
+                        journal.ecrire(journal.INFO, "vies", "Fruit raté", joueur=1, vies=self.vies_j1)
+                    self.evenements.append(FruitRate(1, self.vies_j1))
+                else:
+                    self.vies_j2 -= 1
+                    if journal.actif_info:
+                        journal.ecrire(journal.INFO, "vies", "Fruit raté", joueur=2, vies=self.vies_j2)
+                    self.evenements.append(FruitRate(2, self.vies_j2))
+
+                # Si l'un des deux meurt, c'est Game Over global
+                if self.vies_j1 <= 0 or self.vies_j2 <= 0:
+                    self._terminer("vies")
+
+    def _mettre_a_jour_effets(self):
+        """Fait avancer les morceaux de fruits et les particules."""
+        # Physique + fondu, puis retrait de ceux qui ont disparu
+        self.morceaux_fruits.mettre_a_jour()
+        self.particules_explosion.mettre_a_jour()
+        self.particules_glace.mettre_a_jour()
+
+    def _terminer(self, raison):
+        """
+        Termine la partie (une seule fois).
+
+        Args:
+            raison (str): "bombe" ou "vies"
+        """
+        if self.termine:
+            return
+        self.termine = True
+        self.raison_fin = raison
+
+        if self.nombre_de_joueurs == 2:
+            # Détermine le gagnant
+            if raison == "bombe" or (self.vies_j1 <= 0 and self.vies_j2 <= 0):
+                self.gagnant = "egalite"
+            elif self.vies_j1 <= 0:
+                self.gagnant = "J2"
+            else:
+                self.gagnant = "J1"
+
+        self.evenements.append(FinPartie(raison))
+
+
+# ============================================================================
+# MODE SANS AFFICHAGE
+# ============================================================================
+# Une "entrée" est un tuple :
+#   ("souris", x, y)  : déplacement de la souris
+#   ("appui",)        : bouton enfoncé (à la position actuelle)
+#   ("relache",)      : bouton relâché
+#   ("touche", key)   : touche du clavier (pygame.K_z, ...)
+#   ("taille", l, h)  : nouvelle taille du terrain
+#   ("abandon",)      : partie quittée (Échap)
+#
+# Un "pilote" est une fonction pilote(simulation, frame) qui retourne la liste
+# des entrées de la frame (un script, un bot...).
+# ============================================================================
+
+
+def initialiser_sans_affichage(charger_images=False):
+    """
+    Initialise pygame avec le pilote vidéo "dummy" (aucune fenêtre).
+
+    Args:
+        charger_images (bool): Charger aussi les images (pour les morceaux de
+            fruits et pour mesurer le dessin)
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        # convert_alpha() a besoin d'un mode vidéo, même minuscule
+        pygame.display.set_mode((1, 1))
+    if charger_images:
+        load_assets()
+
+
+def appliquer_entree(simulation, entree):
+    """
+    Transmet une entrée scriptée à la simulation.
+
+    Args:
+        simulation (Simulation): La partie
+        entree (tuple): Voir le format ci-dessus
+
+    Retourne:
+        list: Événements produits par l'entrée (relâche du bouton, touche)
+    """
+    nature = entree[0]
+    if nature == "souris":
+        simulation.deplacer_souris((entree[1], entree[2]))
+    elif nature == "appui":
+        simulation.appuyer_souris()
+    elif nature == "relache":
+        return simulation.relacher_souris()
+    elif nature == "touche":
+        return simulation.appuyer_touche(entree[1])
+    elif nature == "taille":
+        simulation.definir_taille(entree[1], entree[2])
+    elif nature == "abandon":
+        simulation.abandonner()
+    else:
+        raise ValueError(f"Entrée inconnue : {entree!r}")
+    return []
+
+
+def pilote_depuis_script(script):
+    """
+    Crée un pilote à partir d'une liste d'entrées datées.
+
+    Args:
+        script (list): Liste de (frame, entree)
+
+    Retourne:
+        function: pilote(simulation, frame) -> liste d'entrées
+    """
+    par_frame = {}
+    for frame, entree in script:
+        par_frame.setdefault(frame, []).append(entree)
+    return lambda simulation, frame: par_frame.get(frame, ())
+
+
+def pilote_aleatoire(graine=0, nombre_de_joueurs=1, largeur=1280, hauteur=720):
+    """
+    Crée un pilote qui fait des gestes de souris (et des touches) au hasard.
+
+    Utile pour charger la simulation avec des entrées réalistes.
+
+    Retourne:
+        function: pilote(simulation, frame) -> liste d'entrées
+    """
+    rng = random.Random(graine)
+    touches = [pygame.K_z, pygame.K_e, pygame.K_s, pygame.K_d]
+
+    def pilote(simulation, frame):
+        entrees = [("souris", rng.randint(0, largeur - 1), rng.randint(0, hauteur - 1))]
+        if frame % 40 == 0:
+            entrees.append(("appui",))
+        elif frame % 40 == 30:
+            entrees.append(("relache",))
+        if nombre_de_joueurs == 2 and frame % 9 == 0:
+            entrees.append(("touche", rng.choice(touches)))
+        return entrees
+
+    return pilote
+
+
+def executer(simulation, nombre_frames, pilote=None, arreter_a_la_fin=True):
+    """
+    Fait tourner la simulation sans affichage ni limite de FPS.
+
+    Args:
+        simulation (Simulation): La partie
+        nombre_frames (int): Nombre maximum de frames
+        pilote (function): pilote(simulation, frame) -> entrées (optionnel)
+        arreter_a_la_fin (bool): S'arrêter quand la partie est terminée
+
+    Retourne:
+        list: Tous les événements, sous la forme (frame, evenement)
+    """
+    historique = []
+    for frame in range(nombre_frames):
+        if pilote is not None:
+            for entree in pilote(simulation, frame):
+                historique.extend((frame, e) for e in appliquer_entree(simulation, entree))
+
+        historique.extend((frame, e) for e in simulation.etape())
+
+        if simulation.termine and arreter_a_la_fin:
+            break
+    return historique
+
+
+def main():
+    """Point d'entrée : python simulation.py --frames 10000"""
+    parser = argparse.ArgumentParser(description="Simulation sans affichage de Fruit Slicer")
+    parser.add_argument("--frames", type=int, default=10000, help="Nombre de frames")
+    parser.add_argument("--joueurs", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--graine", type=int, default=0, help="Graine des parties et du pilote")
+    parser.add_argument("--images", action="store_true", help="Charger les images")
+    parser.add_argument(
+        "--journal", choices=sorted(journal.NIVEAUX_PAR_NOM), help="Niveau du journal (coupé par défaut)"
+    )
+    parser.add_argument(
+        "--continuer", action="store_true", help="Recommencer une partie à chaque fin"
+    )
+    args = parser.parse_args()
+
+    journal.configurer(args.journal)
+    initialiser_sans_affichage(charger_images=args.images)
+    simulation = Simulation(args.joueurs, effets=args.images, graine=args.graine)
+    pilote = pilote_aleatoire(args.graine, args.joueurs)
+
+    debut = time.perf_counter()
+    frames = 0
+    parties = 0
+    while frames < args.frames:
+        executer(simulation, args.frames - frames, pilote)
+        frames += simulation.frame
+        if not simulation.termine:
+            break
+        parties += 1
+        if not args.continuer:
+            break
+        simulation.demarrer(graine=args.graine + parties)
+    duree = time.perf_counter() - debut
+
+    print(
+        f"{frames} frames en {duree:.2f} s ({frames / max(duree, 1e-9):.0f} frames/s), "
+        f"{parties} partie(s) terminée(s), score {simulation.score}, niveau {simulation.niveau}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+# ============================================================================
+# FICHIER : telemetrie.py
+# DESCRIPTION : Télémétrie des sessions (enregistrement + analyse hors ligne)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - L'enregistrement d'un fichier par partie : temps de chaque frame, nombre
+#   de fruits, morceaux et particules, fruits tranchés (position, combo),
+#   fruits ratés, glaçons, bombes, niveaux et score final
+# - L'analyse de nombreuses sessions (NumPy) : carte des coupes, taux de
+#   fruits ratés par niveau, temps de frame selon le nombre d'objets, et
+#   temps de frame par borne
+#
+# POURQUOI ?
+# Le banc d'essai (bench.py) mesure des scénarios construits à la main. Sur
+# les bornes, on veut savoir OÙ le jeu perd vraiment du temps : à quel
+# nombre d'objets, sur quelle machine, à quel niveau.
+#
+# FORMAT DU FICHIER (.jsonl, une ligne JSON par enregistrement) :
+#   {"type": "session", "version": 1, "machine": ..., "joueurs": ..., ...}
+#   {"type": "frames", "f": 1, "ms": [...], "fruits": [...], ...}  (par bloc)
+#   {"type": "tranche", "f": 250, "x": 0.41, "y": 0.37, "fruits": 1, ...}
+#   {"type": "fin", "f": 3600, "score": 42, "niveau": 5, "raison": "vies"}
+#   Les frames sont groupées par blocs (colonnes) : une ligne par seconde de
+#   jeu au lieu d'une par frame. Les positions sont divisées par la taille
+#   du terrain (0 à 1) pour comparer des bornes de résolutions différentes.
+#
+# ANALYSE (demande NumPy : pip install numpy) :
+#   python telemetrie.py telemetrie/ --image carte_coupes.png
+#
+# ============================================================================
+
+import argparse
+import glob
+import json
+import os
+import platform
+from datetime import datetime
+
+VERSION = 1
+
+# Nombre de frames par ligne "frames" du fichier
+FRAMES_PAR_BLOC = 60
+BUDGET_MS = 1000 / 60
+
+
+# ============================================================================
+# CLASSE : EnregistreurTelemetrie
+# ============================================================================
+class EnregistreurTelemetrie:
+    """
+    Enregistre la télémétrie d'une partie dans un fichier .jsonl.
+
+    Le jeu l'appelle au début de la partie (commencer), à chaque frame
+    (frame), avec les événements de la simulation (evenements) et à la fin
+    (terminer). Chaque partie a son propre fichier dans le dossier.
+
+    Les méthodes ne lisent que des attributs simples de la partie (frame,
+    niveau, score, taille...) : on peut leur passer la Simulation ou une
+    copie de son état (evenements.EtatPartie), et donc les appeler depuis
+    un autre thread que celui du jeu (main.py le fait, voir FileTravail).
+
+    Attributs:
+        dossier (str): Dossier des fichiers de télémétrie
+        chemin (str): Fichier de la partie en cours (None = pas de partie)
+        colonnes (dict): Frames du bloc en cours, colonne par colonne
+        premiere_frame (int): Numéro de la première frame du bloc
+    """
+
+    def __init__(self, dossier):
+        self.dossier = dossier
+        self.chemin = None
+        self.fichier = None
+        self.colonnes = self._colonnes_vides()
+        self.premiere_frame = 0
+
+    def _colonnes_vides(self):
+        """Retourne un bloc de frames vide."""
+        return {"ms": [], "fruits": [], "morceaux": [], "particules": []}
+
+    def _ecrire(self, enregistrement):
+        """Écrit une ligne JSON dans le fichier de la partie."""
+        self.fichier.write(json.dumps(enregistrement, separators=(",", ":")) + "\n")
+
+    def commencer(self, simulation):
+        """
+        Ouvre le fichier d'une nouvelle partie (termine la précédente).
+
+        Args:
+            simulation (Simulation ou EtatPartie): La partie qui commence
+        """
+        if self.fichier is not None:
+            self.terminer(simulation, "abandon")
+
+        os.makedirs(self.dossier, exist_ok=True)
+        debut = datetime.now()
+        nom = f"{debut.strftime('%Y-%m-%d_%H-%M-%S')}_{simulation.nombre_de_joueurs}j_{simulation.graine}.jsonl"
+        self.chemin = os.path.join(self.dossier, nom)
+        self.fichier = open(self.chemin, "w", encoding="utf-8")
+        self.colonnes = self._colonnes_vides()
+        self.premiere_frame = simulation.frame + 1
+        self._ecrire(
+            {
+                "type": "session",
+                "version": VERSION,
+                "date": debut.strftime("%Y-%m-%d %H:%M:%S"),
+                "machine": platform.node(),
+                "joueurs": simulation.nombre_de_joueurs,
+                "graine": simulation.graine,
+                "largeur": simulation.largeur,
+                "hauteur": simulation.hauteur,
+            }
+        )
+
+    def frame(self, simulation, duree_ms):
+        """
+        Ajoute une frame au bloc en cours (écrit le bloc quand il est plein).
+
+        Args:
+            simulation (Simulation): La partie (nombre d'objets)
+            duree_ms (float): Temps de travail de la frame
+        """
+        self.ajouter_frame(
+            simulation.frame,
+            duree_ms,
+            len(simulation.mes_fruits),
+            len(simulation.morceaux_fruits),
+            len(simulation.particules_explosion) + len(simulation.particules_glace),
+        )
+
+    def ajouter_frame(self, frame, duree_ms, fruits, morceaux, particules):
+        """
+        Comme frame(), avec les nombres d'objets déjà comptés (depuis un
+        autre thread, la simulation a déjà avancé).
+
+        Args:
+            frame (int): Numéro de la frame
+            duree_ms (float): Temps de travail de la frame
+            fruits, morceaux, particules (int): Objets à l'écran
+        """
+        if self.fichier is None:
+            return
+        colonnes = self.colonnes
+        colonnes["ms"].append(round(duree_ms, 2))
+        colonnes["fruits"].append(fruits)
+        colonnes["morceaux"].append(morceaux)
+        colonnes["particules"].append(particules)
+        if len(colonnes["ms"]) >= FRAMES_PAR_BLOC:
+            self._vider_bloc(frame)
+
+    def _vider_bloc(self, frame):
+        """Écrit les frames du bloc en cours (frame = dernière frame du bloc)."""
+        if self.colonnes["ms"]:
+            self._ecrire({"type": "frames", "f": self.premiere_frame, **self.colonnes})
+        self.colonnes = self._colonnes_vides()
+        self.premiere_frame = frame + 1
+
+    def evenements(self, simulation, evenements):
+        """
+        Enregistre les événements d'une frame ou d'une entrée.
+
+        Args:
+            simulation (Simulation): La partie (frame, niveau, taille du terrain)
+            evenements (list): Événements retournés par la simulation
+        """
+        for evenement in evenements:
+            self.evenement(evenement, simulation)
+
+    def evenement(self, evenement, simulation):
+        """
+        Enregistre un événement (abonné du bus d'événements, voir evenements.py).
+
+        Args:
+            evenement: FruitTranche, BombeTouchee, GlaconTouche, FruitRate,
+                NiveauMonte ou FinPartie
+            simulation (Simulation ou EtatPartie): La partie au moment de l'événement
+        """
+        if self.fichier is None:
+            return
+        nature = evenement.nature
+        ligne = {"type": nature, "f": simulation.frame, "niveau": simulation.niveau}
+        if nature == "tranche":
+            ligne["x"] = round(evenement.x / simulation.largeur, 3)
+            ligne["y"] = round(evenement.y / simulation.hauteur, 3)
+            ligne["fruits"] = evenement.fruits
+            ligne["combo"] = evenement.combo
+        elif nature in ("bombe", "glace"):
+            ligne["x"] = round(evenement.x / simulation.largeur, 3)
+            ligne["y"] = round(evenement.y / simulation.hauteur, 3)
+        elif nature == "rate":
+            ligne["joueur"] = evenement.joueur
+            ligne["vies"] = evenement.vies
+        elif nature == "niveau":
+            ligne["score"] = simulation.score
+        elif nature == "fin_partie":
+            self.terminer(simulation, evenement.raison)
+            return
+        self._ecrire(ligne)
+
+    def terminer(self, simulation, raison):
+        """
+        Écrit l'état final et ferme le fichier de la partie.
+
+        Args:
+            simulation (Simulation ou EtatPartie): La partie terminée
+            raison (str): "bombe", "vies" ou "abandon"
+        """
+        if self.fichier is None:
+            return
+        self._vider_bloc(simulation.frame)
+        self._ecrire(
+            {
+                "type": "fin",
+                "f": simulation.frame,
+                "score": simulation.score,
+                "niveau": simulation.niveau,
+                "raison": raison,
+                "gagnant": simulation.gagnant,
+            }
+        )
+        self.fichier.close()
+        self.fichier = None
+
+
+# ============================================================================
+# ANALYSE HORS LIGNE
+# ============================================================================
+def lire_sessions(chemins):
+    """
+    Lit des fichiers de télémétrie (les dossiers sont parcourus).
+
+    Args:
+        chemins (list): Fichiers .jsonl ou dossiers
+
+    Retourne:
+        list: Une liste d'enregistrements (dict) par session
+    """
+    fichiers = []
+    for chemin in chemins:
+        if os.path.isdir(chemin):
+            fichiers.extend(sorted(glob.glob(os.path.join(chemin, "*.jsonl"))))
+        else:
+            fichiers.append(chemin)
+
+    sessions = []
+    for fichier in fichiers:
+        with open(fichier, encoding="utf-8") as f:
+            enregistrements = []
+            for ligne in f:
+                try:
+                    enregistrements.append(json.loads(ligne))
+                except json.JSONDecodeError:
+                    # Dernière ligne tronquée (borne éteinte en pleine partie)
+                    break
+        if enregistrements and enregistrements[0].get("type") == "session":
+            sessions.append(enregistrements)
+    return sessions
+
+
+def analyser(sessions, np, taille_carte=(16, 9)):
+    """
+    Agrège les sessions.
+
+    Args:
+        sessions (list): Sessions lues par lire_sessions
+        np (module): NumPy
+        taille_carte (tuple): Nombre de cases (colonnes, lignes) de la carte
+
+    Retourne:
+        dict: frames (durées et objets), carte des coupes, ratés par niveau,
+        temps de frame par nombre d'objets et par machine
+    """
+    durees, objets, machines = [], [], []
+    coupes_x, coupes_y, coupes_poids = [], [], []
+    tranches_par_niveau, rates_par_niveau = {}, {}
+    combos = []
+
+    for session in sessions:
+        machine = session[0].get("machine", "?")
+        for ligne in session[1:]:
+            nature = ligne["type"]
+            if nature == "frames":
+                durees.extend(ligne["ms"])
+                objets.extend(
+                    f + m + p
+                    for f, m, p in zip(ligne["fruits"], ligne["morceaux"], ligne["particules"])
+                )
+                machines.extend([machine] * len(ligne["ms"]))
+            elif nature == "tranche":
+                coupes_x.append(ligne["x"])
+                coupes_y.append(ligne["y"])
+                coupes_poids.append(ligne["fruits"])
+                combos.append(ligne["combo"])
+                niveau = ligne["niveau"]
+                tranches_par_niveau[niveau] = tranches_par_niveau.get(niveau, 0) + ligne["fruits"]
+            elif nature == "rate":
+                niveau = ligne["niveau"]
+                rates_par_niveau[niveau] = rates_par_niveau.get(niveau, 0) + 1
+
+    durees = np.array(durees, dtype=np.float64)
+    objets = np.array(objets, dtype=np.int64)
+    machines = np.array(machines)
+
+    # Carte des coupes : histogramme 2D des positions (0 à 1)
+    carte, _, _ = np.histogram2d(
+        np.array(coupes_y, dtype=np.float64),
+        np.array(coupes_x, dtype=np.float64),
+        bins=(taille_carte[1], taille_carte[0]),
+        range=((0, 1), (0, 1)),
+        weights=np.array(coupes_poids, dtype=np.float64),
+    )
+
+    # Fruits ratés par niveau
+    rates = []
+    for niveau in sorted(set(tranches_par_niveau) | set(rates_par_niveau)):
+        tranches = tranches_par_niveau.get(niveau, 0)
+        manques = rates_par_niveau.get(niveau, 0)
+        rates.append((niveau, tranches, manques, manques / max(1, tranches + manques)))
+
+    # Temps de frame selon le nombre d'objets (par tranches de 10 objets)
+    par_objets = []
+    pente = None
+    if durees.size:
+        groupes = objets // 10
+        for groupe in np.unique(groupes):
+            selection = durees[groupes == groupe]
+            par_objets.append(
+                (
+                    int(groupe) * 10,
+                    selection.size,
+                    float(np.median(selection)),
+                    float(np.percentile(selection, 95)),
+                    float(np.percentile(selection, 99)),
+                )
+            )
+        # Coût moyen d'un objet de plus (droite des moindres carrés)
+        if np.unique(objets).size > 1:
+            pente = float(np.polyfit(objets, durees, 1)[0])
+
+    par_machine = []
+    for machine in np.unique(machines):
+        selection = durees[machines == machine]
+        par_machine.append(
+            (
+                str(machine),
+                selection.size,
+                float(np.median(selection)),
+                float(np.percentile(selection, 99)),
+                float(np.mean(selection > BUDGET_MS)),
+            )
+        )
+
+    return {
+        "sessions": len(sessions),
+        "durees": durees,
+        "carte": carte,
+        "combos": np.array(combos, dtype=np.int64),
+        "rates": rates,
+        "par_objets": par_objets,
+        "pente_ms_par_objet": pente,
+        "par_machine": par_machine,
+    }
+
+
+def afficher_carte(carte):
+    """Affiche la carte des coupes en caractères (du plus clair au plus dense)."""
+    nuances = " .:-=+*#%@"
+    maximum = carte.max()
+    print("+" + "-" * carte.shape[1] * 2 + "+")
+    for ligne in carte:
+        cases = ""
+        for valeur in ligne:
+            indice = 0 if maximum == 0 else int(valeur / maximum * (len(nuances) - 1))
+            cases += nuances[indice] * 2
+        print("|" + cases + "|")
+    print("+" + "-" * carte.shape[1] * 2 + "+")
+
+
+def sauver_image_carte(carte, chemin, np, taille=(640, 360)):
+    """
+    Enregistre la carte des coupes en image (noir = aucune coupe, rouge = beaucoup).
+
+    Args:
+        carte (ndarray): Carte (lignes, colonnes) retournée par analyser
+        chemin (str): Fichier image (.png)
+        np (module): NumPy
+        taille (tuple): Taille de l'image
+    """
+    import pygame
+
+    maximum = carte.max() or 1
+    intensite = (carte.T / maximum * 255).astype(np.uint8)  # surfarray : (x, y)
+    pixels = np.zeros((*intensite.shape, 3), dtype=np.uint8)
+    pixels[..., 0] = intensite
+    pixels[..., 1] = intensite // 3
+    surface = pygame.surfarray.make_surface(pixels)
+    pygame.image.save(pygame.transform.scale(surface, taille), chemin)
+
+
+def main():
+    """Point d'entrée : analyse des fichiers de télémétrie."""
+    parser = argparse.ArgumentParser(description="Analyse de la télémétrie des sessions")
+    parser.add_argument("chemins", nargs="+", help="Fichiers .jsonl ou dossiers")
+    parser.add_argument("--image", help="Enregistrer la carte des coupes (PNG)")
+    args = parser.parse_args()
+
+    try:
+        # Import local : NumPy n'est utile que pour l'analyse, pas pour le jeu
+        import numpy as np
+    except ImportError:
+        raise SystemExit("❌ L'analyse de la télémétrie demande NumPy : pip install numpy")
+
+    sessions = lire_sessions(args.chemins)
+    if not sessions:
+        raise SystemExit("Aucune session trouvée")
+    resultat = analyser(sessions, np)
+    durees = resultat["durees"]
+
+    print(f"📊 {resultat['sessions']} session(s), {durees.size} frames ({durees.size / 3600:.1f} min)")
+    if durees.size:
+        print(
+            f"Temps de frame : médiane {np.median(durees):.2f} ms | p95 {np.percentile(durees, 95):.2f} ms"
+            f" | p99 {np.percentile(durees, 99):.2f} ms"
+            f" | hors budget {np.mean(durees > BUDGET_MS) * 100:.1f} %"
+        )
+
+    print("\nPar borne :")
+    print(f"  {'machine':<20} {'frames':>8} {'p50':>7} {'p99':>7} {'hors budget':>12}")
+    for machine, frames, p50, p99, hors_budget in resultat["par_machine"]:
+        print(f"  {machine:<20} {frames:>8} {p50:>7.2f} {p99:>7.2f} {hors_budget * 100:>11.1f}%")
+
+    print("\nTemps de frame selon le nombre d'objets (fruits + morceaux + particules) :")
+    print(f"  {'objets':<9} {'frames':>8} {'p50':>7} {'p95':>7} {'p99':>7}")
+    for debut, frames, p50, p95, p99 in resultat["par_objets"]:
+        print(f"  {f'{debut}-{debut + 9}':<9} {frames:>8} {p50:>7.2f} {p95:>7.2f} {p99:>7.2f}")
+    if resultat["pente_ms_par_objet"] is not None:
+        print(f"  Coût moyen d'un objet : {resultat['pente_ms_par_objet'] * 1000:.1f} µs")
+
+    print("\nFruits ratés par niveau :")
+    print(f"  {'niveau':<7} {'tranchés':>9} {'ratés':>7} {'taux':>7}")
+    for niveau, tranches, manques, taux in resultat["rates"]:
+        print(f"  {niveau:<7} {tranches:>9} {manques:>7} {taux * 100:>6.1f}%")
+
+    combos = resultat["combos"]
+    if combos.size:
+        print(f"\nCombo le plus long : {combos.max()} fruits")
+
+    print("\nCarte des coupes :")
+    afficher_carte(resultat["carte"])
+    if args.image:
+        sauver_image_carte(resultat["carte"], args.image, np)
+        print(f"🖼️ Carte enregistrée dans {args.image}")
+
+
+if __name__ == "__main__":
+    main()
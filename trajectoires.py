@@ -0,0 +1,203 @@
+# ============================================================================
+# FICHIER : trajectoires.py
+# DESCRIPTION : Trajectoires calculées (paraboles) des objets lancés
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Le calcul DIRECT de la position d'un objet après k frames, sans faire
+#   les k frames une par une (gravité et vitesse horizontale constantes)
+# - Les segments de trajectoire : le lancer, puis un segment par rebond (ou
+#   par changement de vitesse, comme le saut du glaçon coupé)
+# - Le mode "trajectoires analytiques" (TRAJECTOIRES_ANALYTIQUES) : la
+#   position de chaque objet est calculée depuis son segment à partir de
+#   son âge (frames vécues hors freeze)
+# - La prédiction des positions futures (bot) et la position à un âge passé
+#
+# POURQUOI ?
+# Entre deux rebonds, un objet suit une simple parabole. Avec l'âge de
+# l'objet et son segment, on connaît sa position à n'importe quel moment :
+# le bot peut regarder loin dans le futur sans simuler, et on peut
+# retrouver la position d'un objet à un âge passé.
+#
+# LE FREEZE :
+# L'âge d'un objet n'avance pas pendant le freeze de sa zone. Le freeze est
+# donc un simple décalage de temps (frames de la partie - âge de l'objet).
+#
+# FORMULES (même ordre que la physique image par image : la gravité
+# s'ajoute à la vitesse AVANT le déplacement) :
+#     vy(k) = vy + k * g
+#     y(k)  = y + k * vy + g * k * (k + 1) / 2
+#     x(k)  = x + k * vx
+# Les calculs directs ne donnent pas exactement les mêmes arrondis que les
+# additions frame par frame : une partie jouée dans un mode se rejoue dans
+# le même mode (il est enregistré dans le replay).
+#
+# ============================================================================
+
+from bisect import bisect_right
+
+
+def bornes_x(rayon, zone, largeur):
+    """
+    Positions extrêmes du centre d'un objet avant rebond.
+
+    Args:
+        rayon (float): Rayon de l'objet
+        zone (int): 1 (gauche), 2 (droite) ou 0 (mode 1 joueur)
+        largeur (int): Largeur du terrain de jeu
+
+    Retourne:
+        tuple: (gauche, droite)
+    """
+    milieu_x = largeur // 2
+    gauche, droite = rayon, largeur - rayon
+    if zone == 1:
+        droite = milieu_x - rayon
+    elif zone == 2:
+        gauche = milieu_x + rayon
+    return gauche, droite
+
+
+def etat_segment(segment, k, gravite):
+    """
+    État d'un objet k frames après le début de son segment.
+
+    Args:
+        segment (tuple): (age, x, y, vx, vy) au début du segment
+        k (int): Frames écoulées depuis le début du segment
+        gravite (float): Gravité de l'objet
+
+    Retourne:
+        tuple: (x, y, vx, vy)
+    """
+    _, x, y, vx, vy = segment
+    return x + k * vx, y + k * vy + gravite * k * (k + 1) / 2, vx, vy + k * gravite
+
+
+def _dehors(x, gauche, droite):
+    """True si la position est hors des bornes (l'objet rebondit)."""
+    return x < gauche or x > droite
+
+
+def prochain_rebond(x, vx, gauche, droite):
+    """
+    Nombre de frames avant le prochain rebond d'un segment.
+
+    Args:
+        x, vx (float): Position et vitesse horizontales au début du segment
+        gauche, droite (float): Bornes (voir bornes_x)
+
+    Retourne:
+        int: Frames avant le rebond (au moins 1), None si vx est nul
+    """
+    if vx == 0:
+        return None
+    if _dehors(x + vx, gauche, droite):
+        return 1
+    # Depuis l'intérieur, la division donne la bonne frame à un arrondi
+    # près : on corrige avec le même test que le déplacement
+    k = max(1, int(((droite if vx > 0 else gauche) - x) / vx) + 1)
+    while k > 1 and _dehors(x + (k - 1) * vx, gauche, droite):
+        k -= 1
+    while not _dehors(x + k * vx, gauche, droite):
+        k += 1
+    return k
+
+
+def _suivre(segment, age, gravite, gauche, droite, fin=None):
+    """
+    Avance un segment jusqu'à un âge en passant par les rebonds prévus.
+
+    Args:
+        segment (tuple): Segment de départ (age <= âge demandé)
+        age (int): Âge voulu
+        gravite (float): Gravité de l'objet
+        gauche, droite (float): Bornes (voir bornes_x)
+        fin (int): Âge du segment suivant déjà connu (les rebonds prévus
+            s'arrêtent avant), None = aucun
+
+    Retourne:
+        tuple: (x, y, vx, vy) à cet âge
+    """
+    while True:
+        k = prochain_rebond(segment[1], segment[3], gauche, droite)
+        if k is None or segment[0] + k > age or (fin is not None and segment[0] + k >= fin):
+            break
+        x, y, vx, vy = etat_segment(segment, k, gravite)
+        segment = (segment[0] + k, gauche if x < gauche else droite, y, -vx, vy)
+    return etat_segment(segment, age - segment[0], gravite)
+
+
+def etat_a(objet, age, largeur):
+    """
+    État d'un objet à un âge donné, passé ou futur.
+
+    Dans le passé, on part du segment enregistré à cet âge (mode
+    trajectoires analytiques). Dans le futur, on prévoit les rebonds (sans
+    freeze ni changement de taille du terrain d'ici là).
+
+    Args:
+        objet (ObjetVolant): Fruit, glaçon ou bombe
+        age (int): Âge de l'objet (frames vécues hors freeze)
+        largeur (int): Largeur du terrain de jeu
+
+    Retourne:
+        tuple: (x, y, vx, vy)
+    """
+    segments = objet.segments
+    i = max(0, bisect_right([segment[0] for segment in segments], age) - 1)
+    fin = segments[i + 1][0] if i + 1 < len(segments) else None
+    gauche, droite = bornes_x(objet.radius, objet.zone_joueur or 0, largeur)
+    return _suivre(segments[i], age, objet.gravity, gauche, droite, fin)
+
+
+def predire(objet, frames, largeur):
+    """
+    Position d'un objet dans quelques frames, depuis son état actuel.
+
+    Args:
+        objet (ObjetVolant): Fruit, glaçon ou bombe
+        frames (int): Nombre de frames dans le futur (hors freeze)
+        largeur (int): Largeur du terrain (pour les rebonds)
+
+    Retourne:
+        tuple: (x, y) prédits
+    """
+    gauche, droite = bornes_x(objet.radius, objet.zone_joueur or 0, largeur)
+    segment = (0, objet.x, objet.y, objet.speed_x, objet.speed_y)
+    x, y, _, _ = _suivre(segment, frames, objet.gravity, gauche, droite)
+    return x, y
+
+
+def systeme_trajectoires(objets, indices, largeur_ecran):
+    """
+    Mode trajectoires analytiques : vieillit les objets d'une frame et
+    calcule leur position depuis leur segment. Un objet qui sort des bornes
+    est ramené au bord et commence un nouveau segment (rebond).
+
+    Args:
+        objets (ObjetsVolants): Les objets
+        indices (list): Lignes qui bougent cette frame (zones non gelées)
+        largeur_ecran (int): Largeur du terrain de jeu
+    """
+    x, y, vx, vy = objets.x, objets.y, objets.vx, objets.vy
+    age, segments, gravite, rayon, zone = (
+        objets.age,
+        objets.segments,
+        objets.gravite,
+        objets.rayon,
+        objets.zone,
+    )
+    for i in indices:
+        age[i] += 1
+        segment = segments[i][-1]
+        xi, yi, vxi, vyi = etat_segment(segment, age[i] - segment[0], gravite[i])
+
+        # Bornes relues à chaque frame : le terrain peut changer de taille
+        gauche, droite = bornes_x(rayon[i], zone[i], largeur_ecran)
+        if _dehors(xi, gauche, droite):
+            xi = gauche if xi < gauche else droite
+            vxi = -vxi
+            segments[i].append((age[i], xi, yi, vxi, vyi))
+
+        x[i], y[i], vx[i], vy[i] = xi, yi, vxi, vyi
@@ -0,0 +1,246 @@
+# ============================================================================
+# FICHIER : tuner.py
+# DESCRIPTION : Équilibrage de la courbe de difficulté par simulation (Monte Carlo)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Des courbes de difficulté "candidates" (variantes de la courbe 1 joueur
+#   de difficulte.json)
+# - Des centaines de parties sans affichage jouées par le bot (bot.py),
+#   réparties sur tous les coeurs du processeur (ProcessPoolExecutor)
+# - Un rapport par courbe : durée de survie, niveau atteint, score
+#
+# UTILISATION :
+#   python tuner.py --parties 200
+#   python tuner.py --courbe gravite_par_niveau=0.05 --courbe freq_min_base=40
+#   python tuner.py --habilete 0.6 --reaction 20 --json resultats.json
+#
+# POURQUOI DES PROCESSUS ET PAS DES THREADS ?
+# La simulation est du Python pur : à cause du GIL, des threads ne
+# tourneraient pas en parallèle. Chaque processus a son propre interpréteur.
+#
+# ============================================================================
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from difficulte import NIVEAU_MAX, PARAMETRES, compiler_courbe, courbe_du_mode
+
+# Courbe actuelle du mode 1 joueur (fichier de difficulté)
+COURBE_DIFFICULTE = courbe_du_mode(1)
+
+# Durée maximale d'une partie simulée : 20 minutes de jeu
+FRAMES_MAX = 20 * 60 * 60
+
+
+# ============================================================================
+# TRAVAIL D'UN PROCESSUS
+# ============================================================================
+def _initialiser_processus():
+    """Prépare un processus de calcul : pygame sans fenêtre, sans les print."""
+    # Un message de bienvenue de pygame par processus brouillerait le rapport
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")
+
+    from simulation import initialiser_sans_affichage
+
+    initialiser_sans_affichage()
+
+
+def jouer_partie(tache):
+    """
+    Joue une partie complète avec le bot (exécuté dans un processus de calcul).
+
+    Args:
+        tache (tuple): (index de la courbe, courbe, graine, réglages du bot, frames max)
+
+    Retourne:
+        tuple: (index de la courbe, dict du résultat de la partie)
+    """
+    from bot import Bot
+    from simulation import Simulation, executer
+
+    index, courbe, graine, reglages_bot, frames_max = tache
+    tables = {1: compiler_courbe(courbe, NIVEAU_MAX)}
+    simulation = Simulation(1, effets=False, graine=graine, tables=tables)
+    bot = Bot(graine=graine, **reglages_bot)
+    executer(simulation, frames_max, bot.pilote)
+
+    return index, {
+        "survie_s": simulation.duree_partie(),
+        "niveau": simulation.niveau,
+        "score": simulation.score,
+        "fin": simulation.raison_fin or "temps",
+    }
+
+
+# ============================================================================
+# STATISTIQUES
+# ============================================================================
+def resumer(valeurs):
+    """
+    Résume une distribution : moyenne, médiane, 10e et 90e centiles, max.
+
+    Args:
+        valeurs (list): Valeurs numériques (au moins une)
+
+    Retourne:
+        dict: Résumé de la distribution
+    """
+    if len(valeurs) >= 2:
+        deciles = statistics.quantiles(valeurs, n=10, method="inclusive")
+        p10, p90 = deciles[0], deciles[-1]
+    else:
+        p10 = p90 = valeurs[0]
+    return {
+        "moyenne": statistics.fmean(valeurs),
+        "mediane": statistics.median(valeurs),
+        "p10": p10,
+        "p90": p90,
+        "max": max(valeurs),
+    }
+
+
+def rapport_courbe(resultats):
+    """
+    Calcule le rapport d'une courbe à partir des résultats de ses parties.
+
+    Retourne:
+        dict: Distributions de la survie, du niveau et du score, et les causes de fin
+    """
+    fins = {}
+    for resultat in resultats:
+        fins[resultat["fin"]] = fins.get(resultat["fin"], 0) + 1
+    return {
+        "parties": len(resultats),
+        "survie_s": resumer([r["survie_s"] for r in resultats]),
+        "niveau": resumer([r["niveau"] for r in resultats]),
+        "score": resumer([r["score"] for r in resultats]),
+        "fins": fins,
+    }
+
+
+# ============================================================================
+# COURBES CANDIDATES
+# ============================================================================
+def lire_modification(texte):
+    """
+    Lit une modification de courbe "cle=valeur,cle=valeur".
+
+    Args:
+        texte (str): Par exemple "gravite_par_niveau=0.05,freq_min_base=40"
+
+    Retourne:
+        dict: Courbe complète (courbe actuelle + modifications)
+    """
+    courbe = dict(COURBE_DIFFICULTE)
+    for morceau in texte.split(","):
+        cle, _, valeur = morceau.partition("=")
+        cle = cle.strip()
+        if cle not in PARAMETRES:
+            raise SystemExit(f"Paramètre de courbe inconnu : {cle}")
+        # Type du paramètre (int ou float)
+        courbe[cle] = PARAMETRES[cle](float(valeur))
+    try:
+        compiler_courbe(courbe, NIVEAU_MAX)
+    except ValueError as e:
+        raise SystemExit(f"Courbe invalide ({texte}) : {e}")
+    return courbe
+
+
+def courbes_par_defaut():
+    """Courbe actuelle, plus une variante plus douce et une plus dure."""
+    douce = dict(COURBE_DIFFICULTE)
+    douce["gravite_par_niveau"] = COURBE_DIFFICULTE["gravite_par_niveau"] * 0.5
+    douce["freq_min_pente"] = max(1, COURBE_DIFFICULTE["freq_min_pente"] // 2)
+    douce["freq_max_pente"] = max(1, COURBE_DIFFICULTE["freq_max_pente"] // 2)
+
+    dure = dict(COURBE_DIFFICULTE)
+    dure["gravite_par_niveau"] = COURBE_DIFFICULTE["gravite_par_niveau"] * 2
+    dure["freq_min_pente"] = COURBE_DIFFICULTE["freq_min_pente"] * 2
+    dure["freq_max_pente"] = COURBE_DIFFICULTE["freq_max_pente"] * 2
+
+    return [("actuelle", dict(COURBE_DIFFICULTE)), ("douce", douce), ("dure", dure)]
+
+
+def afficher_rapport(nom, rapport):
+    """Affiche le rapport d'une courbe dans la console."""
+    print(f"\n=== Courbe {nom} ({rapport['parties']} parties) ===")
+    for cle, titre in (("survie_s", "Survie (s)"), ("niveau", "Niveau"), ("score", "Score")):
+        r = rapport[cle]
+        print(
+            f"  {titre:<11} moyenne {r['moyenne']:8.1f} | médiane {r['mediane']:8.1f}"
+            f" | p10 {r['p10']:8.1f} | p90 {r['p90']:8.1f} | max {r['max']:8.1f}"
+        )
+    fins = ", ".join(f"{cause} {n}" for cause, n in sorted(rapport["fins"].items()))
+    print(f"  Fin de partie : {fins}")
+
+
+def main():
+    """Point d'entrée : python tuner.py"""
+    parser = argparse.ArgumentParser(description="Équilibrage de la difficulté par simulation")
+    parser.add_argument("--parties", type=int, default=100, help="Parties par courbe")
+    parser.add_argument(
+        "--courbe",
+        action="append",
+        help="Courbe candidate 'cle=valeur,...' (répétable). Par défaut : actuelle, douce, dure",
+    )
+    parser.add_argument("--habilete", type=float, default=0.8, help="Habileté du bot (0 à 1)")
+    parser.add_argument("--reaction", type=int, default=15, help="Temps de réaction du bot (frames)")
+    parser.add_argument(
+        "--evitement", type=float, default=1.0, help="Évitement des bombes du bot (0 à 1)"
+    )
+    parser.add_argument("--frames-max", type=int, default=FRAMES_MAX, help="Durée max d'une partie")
+    parser.add_argument("--processus", type=int, default=None, help="Nombre de processus")
+    parser.add_argument("--graine", type=int, default=0, help="Première graine des parties")
+    parser.add_argument("--json", help="Écrire les rapports dans ce fichier JSON")
+    args = parser.parse_args()
+
+    if args.courbe:
+        candidates = [(texte, lire_modification(texte)) for texte in args.courbe]
+    else:
+        candidates = courbes_par_defaut()
+
+    reglages_bot = {
+        "habilete": args.habilete,
+        "reaction_frames": args.reaction,
+        "evitement_bombes": args.evitement,
+    }
+
+    # Les mêmes graines pour toutes les courbes : les différences viennent
+    # de la courbe, pas du hasard
+    taches = [
+        (index, courbe, args.graine + partie, reglages_bot, args.frames_max)
+        for index, (_, courbe) in enumerate(candidates)
+        for partie in range(args.parties)
+    ]
+
+    resultats = [[] for _ in candidates]
+    debut = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=args.processus, initializer=_initialiser_processus
+    ) as executeur:
+        # chunksize : on envoie les parties par paquets (moins d'échanges)
+        paquet = max(1, len(taches) // ((args.processus or os.cpu_count() or 1) * 8))
+        for index, resultat in executeur.map(jouer_partie, taches, chunksize=paquet):
+            resultats[index].append(resultat)
+    duree = time.perf_counter() - debut
+
+    print(f"{len(taches)} parties simulées en {duree:.1f} s")
+    rapports = {}
+    for (nom, courbe), resultats_courbe in zip(candidates, resultats):
+        rapports[nom] = {"courbe": courbe, **rapport_courbe(resultats_courbe)}
+        afficher_rapport(nom, rapports[nom])
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fichier:
+            json.dump(rapports, fichier, indent=4, ensure_ascii=False)
+        print(f"\nRapports écrits dans {args.json}")
+
+
+if __name__ == "__main__":
+    main()
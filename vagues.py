@@ -0,0 +1,163 @@
+# ============================================================================
+# FICHIER : vagues.py
+# DESCRIPTION : Directeur des apparitions (vagues d'objets planifiées)
+# ============================================================================
+#
+# CE FICHIER GÈRE :
+# - Le plan des vagues d'un niveau, tiré à l'avance depuis la graine de la
+#   partie : objets seuls, rafales, salves, vagues en miroir (2 joueurs)
+# - Le mélange des objets spéciaux dans une vague (au plus une bombe)
+# - Les objets des prochaines vagues, pour préparer leurs images à l'avance
+#
+# POURQUOI ?
+# Avant, un compteur lançait UN objet quand il atteignait une fréquence
+# tirée au hasard. Les niveaux élevés ne pouvaient devenir plus denses
+# qu'en raccourcissant ce délai. Avec des vagues planifiées :
+# - Les lancers d'une vague sont programmés d'un coup dans l'ordonnanceur
+#   (voir ordonnanceur.py), la frame du lancer n'a plus qu'à créer l'objet
+# - Les images de la vague suivante sont préparées pendant la vague en
+#   cours (voir objets.prechauffer), pas à la frame du lancer
+# - Les vagues grossissent avec le niveau (rafales et salves plus
+#   fréquentes et plus longues)
+#
+# HASARD :
+# Le plan utilise son propre flux aléatoire (graine "vagues-<graine>"), comme
+# les effets : le tirer à l'avance ne décale pas les positions et vitesses
+# des objets, tirées au lancer avec simulation.rng.
+#
+# UNE VAGUE (dict) :
+#   "nature"  : "simple", "rafale", "salve" ou "miroir"
+#   "lancers" : liste de (décalage en frames, type d'objet, zone du joueur)
+#   "pause"   : frames entre le début de cette vague et la suivante
+#
+# ============================================================================
+
+import random
+
+from constantes import liste_fruits, liste_objets_speciaux
+
+# Nombre de vagues tirées d'un coup pour le niveau en cours
+VAGUES_PAR_PLAN = 12
+
+# Écart (en frames) entre deux objets d'une rafale
+ECART_RAFALE = (6, 12)
+
+# Taille maximale des vagues
+TAILLE_MAX_RAFALE = 6
+TAILLE_MAX_SALVE = 5
+
+
+def poids_natures(niveau, nombre_de_joueurs):
+    """
+    Chances relatives de chaque nature de vague à un niveau.
+
+    Args:
+        niveau (int): Niveau de la partie (1 en mode 2 joueurs)
+        nombre_de_joueurs (int): 1 ou 2
+
+    Retourne:
+        dict: Nature -> poids
+    """
+    poids = {
+        "simple": max(2, 10 - niveau),
+        "rafale": 1 + niveau // 2,
+        "salve": niveau // 3,
+    }
+    if nombre_de_joueurs == 2:
+        # Les deux joueurs reçoivent les mêmes objets en même temps
+        poids["miroir"] = 3
+    return poids
+
+
+class DirecteurVagues:
+    """
+    Tire et garde le plan des vagues de la partie.
+
+    Attributs:
+        nombre_de_joueurs (int): 1 ou 2
+        rng (Random): Flux aléatoire du plan (séparé de celui de la partie)
+        niveau (int): Niveau du plan en cours
+        plan (list): Vagues restantes du plan, la prochaine en premier
+    """
+
+    def __init__(self, graine, nombre_de_joueurs):
+        self.nombre_de_joueurs = nombre_de_joueurs
+        self.rng = random.Random(f"vagues-{graine}")
+        self.niveau = None
+        self.plan = []
+
+    def suivante(self, niveau, min_freq, max_freq, chance_special):
+        """
+        Retire et retourne la prochaine vague. Le plan est tiré à nouveau
+        quand il est vide ou que le niveau a changé.
+
+        Args:
+            niveau (int): Niveau actuel de la partie
+            min_freq, max_freq (int): Intervalle des pauses (en frames) pour
+                une vague d'un seul objet
+            chance_special (int): Pourcentage d'objets spéciaux (bombes, glaçons)
+
+        Retourne:
+            dict: La vague (voir l'en-tête du fichier)
+        """
+        if not self.plan or niveau != self.niveau:
+            self.niveau = niveau
+            self.plan = [
+                self._tirer_vague(niveau, min_freq, max_freq, chance_special)
+                for _ in range(VAGUES_PAR_PLAN)
+            ]
+        return self.plan.pop(0)
+
+    def prochains_types(self):
+        """Types d'objets de la prochaine vague prévue (vide si le plan est fini)."""
+        if not self.plan:
+            return []
+        return sorted({type_objet for _, type_objet, _ in self.plan[0]["lancers"]})
+
+    def _tirer_type(self, bombe_permise, chance_special):
+        """Tire un type d'objet : spécial selon chance_special, sinon un fruit."""
+        if self.rng.randint(1, 100) <= chance_special:
+            type_special = self.rng.choice(liste_objets_speciaux)
+            if type_special != "bombe" or bombe_permise:
+                return type_special
+            return "ice"
+        return self.rng.choice(liste_fruits)
+
+    def _zone(self):
+        """Zone d'un objet : un côté au hasard en mode 2 joueurs."""
+        return self.rng.choice([1, 2]) if self.nombre_de_joueurs == 2 else None
+
+    def _tirer_vague(self, niveau, min_freq, max_freq, chance_special):
+        """Tire une vague du niveau (voir poids_natures)."""
+        poids = poids_natures(niveau, self.nombre_de_joueurs)
+        nature = self.rng.choices(list(poids), weights=list(poids.values()))[0]
+
+        if nature == "rafale":
+            taille = self.rng.randint(2, min(TAILLE_MAX_RAFALE, 2 + niveau // 3))
+        elif nature == "salve":
+            taille = self.rng.randint(2, min(TAILLE_MAX_SALVE, 2 + niveau // 4))
+        elif nature == "miroir":
+            taille = self.rng.randint(1, 2)
+        else:
+            taille = 1
+
+        lancers = []
+        decalage = 0
+        bombe = False  # Au plus une bombe par vague
+        for _ in range(taille):
+            type_objet = self._tirer_type(not bombe, chance_special)
+            bombe = bombe or type_objet == "bombe"
+            if nature == "miroir":
+                lancers.append((decalage, type_objet, 1))
+                lancers.append((decalage, type_objet, 2))
+                decalage += self.rng.randint(*ECART_RAFALE)
+            else:
+                lancers.append((decalage, type_objet, self._zone()))
+                if nature == "rafale":
+                    decalage += self.rng.randint(*ECART_RAFALE)
+
+        # Une grosse vague laisse un peu plus de temps avant la suivante,
+        # mais moins que la somme des pauses de ses objets : plus dense
+        pause = int(self.rng.randint(min_freq, max_freq) * (0.6 + 0.4 * taille))
+        pause = max(pause, lancers[-1][0] + 1)
+        return {"nature": nature, "lancers": lancers, "pause": pause}